@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from src.models.swe_edge import SweEdge
+from src.models.swe_node import SweNode
+from src.service.swe_knowledge_base_service import SweKnowledgeBase
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def build_synthetic_kb(num_nodes: int, seed: int = 0) -> SweKnowledgeBase:
+    """A KB of long uncategorized chains hanging off a few NFR roots.
+
+    Chains are the worst case for sweep-based propagation (one sweep per hop);
+    short random back-links keep the graph from being a pure tree without
+    shrinking its diameter.
+    """
+
+    rng = random.Random(seed)
+    kb = SweKnowledgeBase(ground_data_dir="", linked_data_dir="")
+    nodes = {}
+    num_roots = max(1, num_nodes // 10_000)
+    for index in range(num_roots):
+        node_id = f"nfr_{index}"
+        nodes[node_id] = SweNode(
+            id=node_id, type="NFR", name=f"Nfr {index}", nfr_category="", description=""
+        )
+
+    edges = []
+    # Node ids are inserted in reverse chain order so each sweep advances one hop.
+    chain_ids = [f"practice_{index}" for index in range(num_nodes - num_roots)]
+    for node_id in reversed(chain_ids):
+        nodes[node_id] = SweNode(
+            id=node_id, type="Practice", name=node_id, nfr_category="", description=""
+        )
+    for position, node_id in enumerate(chain_ids):
+        parent = (
+            f"nfr_{position % num_roots}"
+            if position < num_roots
+            else chain_ids[position - num_roots]
+        )
+        edges.append(SweEdge(parent, "related_to", node_id, ""))
+    for _ in range(num_nodes // 10):
+        # Short back-links within a chain keep its diameter (and the sweep count).
+        position = rng.randrange(num_roots * 8, len(chain_ids))
+        back = chain_ids[position - num_roots * rng.randint(2, 8)]
+        edges.append(SweEdge(back, "supports", chain_ids[position], ""))
+    kb.nodes = nodes
+    kb.edges = edges
+    return kb
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time SweKnowledgeBase NFR category inference on synthetic KBs."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>10} {'edges':>10} {'build_s':>9} {'infer_s':>9}")
+    for size in args.sizes:
+        started = time.perf_counter()
+        kb = build_synthetic_kb(size, seed=args.seed)
+        built = time.perf_counter() - started
+
+        started = time.perf_counter()
+        kb._infer_nfr_categories()
+        inferred = time.perf_counter() - started
+
+        uncategorized = sum(1 for node in kb.nodes.values() if not node.nfr_category)
+        print(f"{size:>10} {len(kb.edges):>10} {built:>9.3f} {inferred:>9.3f}")
+        if uncategorized:
+            print(f"  warning: {uncategorized} nodes left uncategorized")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import os
+import sys
+
+from src.mcp.swe_mcp_server import SweMcpServerContextProvider
+from src.models.swe_config import SweMcpConfig
+
+
+def main() -> int:
+    """Rebuild the knowledge base snapshot for a repository (defaults to the CWD)."""
+
+    repo_root = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else os.getcwd())
+    provider = SweMcpServerContextProvider(repo_root=repo_root)
+    config = SweMcpConfig.load(repo_root=repo_root)
+    kb = provider.create_knowledge_base(config=config, use_snapshot=True)
+    kb.load(refresh_snapshot=True)
+    print(
+        f"Wrote knowledge base snapshot with {len(kb.nodes)} nodes and "
+        f"{len(kb.edges)} edges to {kb.snapshot_path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
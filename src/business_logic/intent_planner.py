@@ -24,7 +24,7 @@ class IntentPlanner:
         config: Optional[SweMcpConfig] = None,
     ) -> None:
         self.kb = kb
-        self.llm_client = llm_client or MultiModelLLMClient()
+        self.llm_client = llm_client or MultiModelLLMClient.shared()
         self.config = config or SweMcpConfig()
 
     # ------------------------- public API -------------------------
@@ -116,56 +116,27 @@ class IntentPlanner:
             return focus, resolved_ids
 
         focus_seen = {f.lower() for f in focus}
-        nfr_id_seen = set(resolved_ids)
-        all_edges = self.kb.edges
-
-        for _ in range(max_loops):
-            new_ids: List[str] = []
-
-            for nfr_id in list(nfr_id_seen):
-                for edge in all_edges:
-                    # Traverse both directions so inverse links are also useful.
-                    if edge.source_id == nfr_id:
-                        neighbor_id = edge.target_id
-                    elif edge.target_id == nfr_id:
-                        neighbor_id = edge.source_id
-                    else:
-                        continue
-
-                    neighbor = self.kb.nodes.get(neighbor_id)
-                    if not neighbor or neighbor.type.upper() != "NFR":
-                        continue
-                    if neighbor.id in nfr_id_seen:
-                        continue
-                    nfr_id_seen.add(neighbor.id)
-                    new_ids.append(neighbor.id)
-
-                    # Keep focus labels human-readable while preserving order.
-                    preferred_label = (
-                        neighbor.name or neighbor.nfr_category or neighbor.id
-                    )
-                    label_key = preferred_label.lower()
-                    if label_key not in focus_seen:
-                        focus.append(preferred_label)
-                        focus_seen.add(label_key)
-
-            if not new_ids:
-                break
-
-        return focus, list(nfr_id_seen)
+        # One hop of NFR-to-NFR links per loop, traversed in both directions so
+        # inverse links are also useful.
+        distances = self.kb.get_neighborhood(
+            resolved_ids, hops=max_loops, direction="both", node_types=["NFR"]
+        )
+        for neighbor_id, hop in distances.items():
+            if hop == 0:
+                continue
+            neighbor = self.kb.nodes[neighbor_id]
+            # Keep focus labels human-readable while preserving order.
+            preferred_label = neighbor.name or neighbor.nfr_category or neighbor.id
+            label_key = preferred_label.lower()
+            if label_key not in focus_seen:
+                focus.append(preferred_label)
+                focus_seen.add(label_key)
 
-    def _infer_nfrs_from_text(self, text: str) -> List[str]:
-        text_lower = text.lower()
-        candidates: List[str] = []
+        return focus, list(distances)
 
+    def _infer_nfrs_from_text(self, text: str) -> List[str]:
         # Look for known NFR names/categories mentioned in the request.
-        for node in self.kb.get_all_nfrs():
-            name = (node.name or "").lower()
-            category = (node.nfr_category or "").lower()
-            if name and name in text_lower:
-                candidates.append(node.name)
-            elif category and category in text_lower:
-                candidates.append(node.nfr_category)
+        candidates = self.kb.find_nfr_mentions(text)
 
         # Preserve order but remove duplicates.
         seen = set()
@@ -0,0 +1,5 @@
+from src.errors.TextLLMException import TextLLMException
+
+
+class LLMCacheMissError(TextLLMException):
+    pass
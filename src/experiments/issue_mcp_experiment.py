@@ -20,13 +20,18 @@ from mcp.client.stdio import stdio_client
 
 from src.evaluation.experiment_metrics import ExperimentMetricsEvaluator
 from src.evaluation.sonarqube_client import SonarIssueQuery, SonarQubeClient
+from src.models.swe_config import LocalizerConfig
 from src.report.experiment_report_writer import (
     metrics_rows,
     write_csv_report,
     write_log_report,
     write_markdown_report,
 )
-from src.service.localizer import RepositoryIssueLocalizer
+from src.service.localizer import (
+    RepositoryIssueLocalizer,
+    SymbolIndex,
+    discover_repository_code_files,
+)
 
 
 @dataclass(frozen=True)
@@ -266,6 +271,7 @@ def _write_llm_debug_artifacts(
                         "chunked": apply_payload.get("chunked"),
                         "chunk_count": apply_payload.get("chunk_count"),
                         "chunk_errors": apply_payload.get("chunk_errors"),
+                        "streaming": apply_payload.get("streaming"),
                     }
                 ),
                 "```",
@@ -589,15 +595,37 @@ def _run_experiment(args: argparse.Namespace) -> dict[str, Any]:
                 f"Could not fetch PR files for localization ({type(exc).__name__}: {exc}); falling back to repository scan."
             )
 
-    localizer = RepositoryIssueLocalizer(
+    candidate_paths = pr_candidate_files
+    if not candidate_paths:
+        # Localize against the snapshot the experiment diffs and reads from.
+        candidate_paths = discover_repository_code_files(repo_path, ref=args.base_ref)
+        log_lines.append(
+            f"Localizer candidate pool at {args.base_ref}: {len(candidate_paths)} files"
+        )
+
+    symbol_index = (
+        SymbolIndex(Path(args.localizer_index_path).resolve())
+        if args.localizer_index_path
+        else None
+    )
+    localizer_config = LocalizerConfig(
         enable_semantic_nlp=args.enable_nlp_localizer,
+        max_workers=args.localizer_workers,
+        enable_cascade_ranking=args.localizer_cascade,
     )
-    localization = localizer.localize(
-        repo_path=repo_path,
-        issue_text=issue_prompt,
-        top_k=args.max_target_files,
-        candidate_paths=pr_candidate_files,
+    localizer = RepositoryIssueLocalizer.from_config(
+        localizer_config, symbol_index=symbol_index
     )
+    try:
+        localization = localizer.localize(
+            repo_path=repo_path,
+            issue_text=issue_prompt,
+            top_k=args.max_target_files,
+            candidate_paths=candidate_paths,
+        )
+    finally:
+        if symbol_index is not None:
+            symbol_index.close()
     target_files = localization.selected_files
     if not target_files:
         raise ValueError("Localizer could not identify candidate files for this issue.")
@@ -632,6 +660,9 @@ def _run_experiment(args: argparse.Namespace) -> dict[str, Any]:
         os.environ["DEFAULT_MODEL"] = args.model
     if args.model_endpoint:
         os.environ["DEFAULT_MODEL_ENDPOINT"] = args.model_endpoint
+    os.environ["LLM_CACHE_MODE"] = args.llm_cache_mode
+    if args.llm_cache_path:
+        os.environ["LLM_CACHE_PATH"] = args.llm_cache_path
 
     nfr_focus = [entry.strip() for entry in args.nfr_focus.split(",") if entry.strip()]
     mcp_payload = asyncio.run(
@@ -861,6 +892,7 @@ def _run_experiment(args: argparse.Namespace) -> dict[str, Any]:
                 "endpoint": args.model_endpoint,
                 "temperature": args.temperature,
                 "seed": args.seed,
+                "cache_mode": args.llm_cache_mode,
                 "notes": "Model and endpoint are passed through env vars to MCP tools.",
             },
             "mcp_server": {
@@ -954,6 +986,28 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable semantic NLP localizer strategy (TF-IDF cosine).",
     )
+    parser.add_argument(
+        "--localizer-index-path",
+        default=None,
+        help=(
+            "Optional SQLite file caching localizer symbol analyses by git blob SHA "
+            "so unchanged files are not re-extracted across runs."
+        ),
+    )
+    parser.add_argument(
+        "--localizer-workers",
+        type=int,
+        default=1,
+        help="Worker processes used by the localizer to analyse candidate files.",
+    )
+    parser.add_argument(
+        "--localizer-cascade",
+        action="store_true",
+        help=(
+            "Run cheap localizer strategies first and skip expensive ones for files "
+            "that can no longer reach the top results."
+        ),
+    )
     parser.add_argument("--base-ref", default="HEAD", help="Git reference for baseline")
     parser.add_argument(
         "--head-ref",
@@ -997,6 +1051,20 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--temperature", type=float, default=0.0)
     parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--llm-cache-mode",
+        choices=["off", "read_through", "record", "replay"],
+        default=os.getenv("LLM_CACHE_MODE", "off"),
+        help=(
+            "LLM response cache used by MCP tools: read_through serves repeated "
+            "calls from disk, record refreshes it, replay fails on a miss."
+        ),
+    )
+    parser.add_argument(
+        "--llm-cache-path",
+        default=os.getenv("LLM_CACHE_PATH"),
+        help="SQLite file for the LLM response cache (defaults to the user cache dir)",
+    )
     parser.add_argument(
         "--sonar-url",
         default=os.getenv("SONAR_HOST_URL"),
@@ -1,13 +1,16 @@
 from src.service.localizer import (
     AstMatchingStrategy,
+    CorpusDocument,
     FilenameMatchingStrategy,
     LocalizationHit,
     LocalizationStrategy,
     LocalizerResult,
     RegexContentMatchingStrategy,
+    RepositoryCorpus,
     RepositoryIssueLocalizer,
     SemanticNlpMatchingStrategy,
     SymbolImpactStrategy,
+    SymbolIndex,
     discover_repository_code_files,
 )
 
@@ -20,6 +23,9 @@ __all__ = [
     "SemanticNlpMatchingStrategy",
     "SymbolImpactStrategy",
     "LocalizerResult",
+    "CorpusDocument",
+    "RepositoryCorpus",
+    "SymbolIndex",
     "RepositoryIssueLocalizer",
     "discover_repository_code_files",
 ]
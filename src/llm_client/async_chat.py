@@ -0,0 +1,51 @@
+import asyncio
+import threading
+import weakref
+from typing import Callable
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class EndpointConcurrencyLimiter:
+    """Caps in-flight async requests per endpoint URL within each event loop.
+
+    Clients for several models served by the same endpoint share one
+    semaphore; its size is the `max_concurrency` of whichever client used the
+    endpoint first on that loop.
+    """
+
+    def __init__(self) -> None:
+        # loop -> {endpoint: semaphore}; asyncio primitives must not be shared
+        # across loops.
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def semaphore(self, endpoint: str, limit: int) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            per_loop = self._semaphores.setdefault(loop, {})
+            semaphore = per_loop.get(endpoint)
+            if semaphore is None:
+                semaphore = per_loop[endpoint] = asyncio.Semaphore(max(1, limit))
+        return semaphore
+
+
+ENDPOINT_LIMITER = EndpointConcurrencyLimiter()
+
+
+class AsyncChatMixin:
+    """Adds `achat` to a client exposing `endpoint`, `max_concurrency` and `chat`.
+
+    The blocking `chat` call runs on a worker thread and reuses the client's
+    keep-alive `requests` session, so concurrent `achat` calls overlap their
+    network round-trips while at most `max_concurrency` of them are in flight
+    per endpoint.
+    """
+
+    endpoint: str
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    chat: Callable[..., str]
+
+    async def achat(self, prompt: str, model: str | None = None, **kwargs) -> str:
+        async with ENDPOINT_LIMITER.semaphore(self.endpoint, self.max_concurrency):
+            return await asyncio.to_thread(self.chat, prompt, model, **kwargs)
@@ -1,11 +1,16 @@
+import json
+from typing import Iterator
+
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from src.errors.TextLLMException import TextLLMException
+from src.llm_client.async_chat import DEFAULT_MAX_CONCURRENCY, AsyncChatMixin
+from src.llm_client.sse import iter_sse_data
 
 
-class AzureResponsesClient:
+class AzureResponsesClient(AsyncChatMixin):
     """HTTP client for Azure OpenAI Responses API compatible endpoints."""
 
     def __init__(
@@ -15,6 +20,9 @@ class AzureResponsesClient:
         api_key: str | None = None,
         api_version: str | None = None,
         timeout: int = 600,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        pool_maxsize: int | None = None,
+        session: requests.Session | None = None,
     ) -> None:
         if not endpoint:
             raise ValueError("Azure responses endpoint is required")
@@ -23,7 +31,10 @@ class AzureResponsesClient:
         self.api_key = api_key
         self.api_version = api_version
         self.timeout = timeout
-        self.session = self._create_session()
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize or max(max_concurrency, 10)
+        # Clients for models on the same endpoint may share one session.
+        self.session = session or self._create_session()
 
     def _create_session(self) -> requests.Session:
         session = requests.Session()
@@ -33,7 +44,10 @@ class AzureResponsesClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["POST"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=self.pool_maxsize,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -71,7 +85,7 @@ class AzureResponsesClient:
 
         raise TextLLMException("Azure Responses API returned no textual output")
 
-    def chat(self, prompt: str, model: str | None = None, **kwargs) -> str:
+    def _payload(self, prompt: str, model: str | None = None, **kwargs) -> dict:
         payload = {
             "model": model or self.default_model,
             "input": [
@@ -83,6 +97,10 @@ class AzureResponsesClient:
         }
         if "temperature" in kwargs:
             payload["temperature"] = kwargs["temperature"]
+        return payload
+
+    def chat(self, prompt: str, model: str | None = None, **kwargs) -> str:
+        payload = self._payload(prompt, model, **kwargs)
 
         try:
             resp = self.session.post(
@@ -104,3 +122,44 @@ class AzureResponsesClient:
             raise
         except Exception as e:
             raise TextLLMException(f"Unexpected error: {e}")
+
+    def stream_chat(
+        self, prompt: str, model: str | None = None, **kwargs
+    ) -> Iterator[str]:
+        """Yield output text deltas as the Responses API streams them."""
+
+        payload = self._payload(prompt, model, **kwargs)
+        payload["stream"] = True
+        headers = {**self._headers(), "Accept": "text/event-stream"}
+
+        try:
+            with self.session.post(
+                self.endpoint,
+                headers=headers,
+                json=payload,
+                timeout=(10, self.timeout),
+                stream=True,
+            ) as resp:
+                resp.raise_for_status()
+                resp.encoding = "utf-8"
+                for data in iter_sse_data(resp.iter_lines(decode_unicode=True)):
+                    event = json.loads(data)
+                    event_type = event.get("type")
+                    if event_type == "response.output_text.delta":
+                        delta = event.get("delta")
+                        if isinstance(delta, str) and delta:
+                            yield delta
+                    elif event_type == "response.completed":
+                        return
+                    elif event_type in {"error", "response.failed"}:
+                        raise TextLLMException(f"Azure Responses stream failed: {data}")
+        except requests.exceptions.Timeout as e:
+            raise TextLLMException(f"Request timeout: {e}")
+        except requests.exceptions.ConnectionError as e:
+            raise TextLLMException(f"Connection error: {e}")
+        except requests.exceptions.RequestException as e:
+            raise TextLLMException(f"Request failed: {e}")
+        except TextLLMException:
+            raise
+        except Exception as e:
+            raise TextLLMException(f"Unexpected error: {e}")
@@ -0,0 +1,74 @@
+import re
+
+_FENCE = "```"
+_LANGUAGE_CHAR = re.compile(r"[a-zA-Z0-9_+-]")
+
+
+class CodeBlockStreamParser:
+    """Extracts fenced code blocks from text that arrives in pieces.
+
+    Matches what ``re.finditer(r"```([a-zA-Z0-9_+-]*)\\n(.*?)```", text,
+    re.DOTALL)`` finds on the complete text, but reports each block as soon
+    as its closing fence is fed, so a streaming caller can stop reading
+    there. Each feed only scans the newly arrived characters.
+    """
+
+    def __init__(self) -> None:
+        self.blocks: list[dict[str, str]] = []
+        self._buffer = ""
+        self._scan = 0
+        self._fence_start: int | None = None
+        self._code_start: int | None = None
+
+    def feed(self, text: str) -> list[dict[str, str]]:
+        """Append ``text``; return the non-empty blocks it completed."""
+
+        self._buffer += text
+        completed: list[dict[str, str]] = []
+        while True:
+            if self._code_start is not None:
+                close = self._buffer.find(_FENCE, self._scan)
+                if close < 0:
+                    self._scan = max(self._code_start, len(self._buffer) - 2)
+                    break
+                self._finish_block(close, completed)
+            elif self._fence_start is not None:
+                if not self._read_header():
+                    break
+            else:
+                start = self._buffer.find(_FENCE, self._scan)
+                if start < 0:
+                    self._scan = max(self._scan, len(self._buffer) - 2)
+                    break
+                self._fence_start = start
+                self._scan = start + len(_FENCE)
+        return completed
+
+    def _read_header(self) -> bool:
+        """Advance through the opening fence's language tag; False to wait."""
+
+        position = self._scan
+        while position < len(self._buffer):
+            char = self._buffer[position]
+            if char == "\n":
+                self._code_start = self._scan = position + 1
+                return True
+            if not _LANGUAGE_CHAR.match(char):
+                # Not an opening fence; look for one from the next character.
+                self._scan = self._fence_start + 1
+                self._fence_start = None
+                return True
+            position += 1
+        self._scan = position
+        return False
+
+    def _finish_block(self, close: int, completed: list[dict[str, str]]) -> None:
+        header = self._buffer[self._fence_start + len(_FENCE) : self._code_start - 1]
+        code = self._buffer[self._code_start : close].strip()
+        if code:
+            block = {"language": header.strip() or "text", "code": code}
+            self.blocks.append(block)
+            completed.append(block)
+        self._scan = close + len(_FENCE)
+        self._fence_start = None
+        self._code_start = None
@@ -1,15 +1,21 @@
+import json
+
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from src.errors.TextLLMException import TextLLMException
+from src.llm_client.async_chat import DEFAULT_MAX_CONCURRENCY, AsyncChatMixin
+from src.llm_client.sse import iter_sse_data
 
 
-class LocalAIClient:
+class LocalAIClient(AsyncChatMixin):
     """
     Simple HTTP client for a LocalAI server.
     Assumes LocalAI chat completions endpoint at {endpoint}/v1/chat/completions
-    and returns the first choice's message content.
+    and returns the first choice's message content. `achat` runs the same
+    request asynchronously, with at most `max_concurrency` in flight per
+    endpoint; `stream_chat` yields the content as it is generated.
     """
 
     def __init__(
@@ -18,12 +24,18 @@ class LocalAIClient:
         default_model=None,
         api_key=None,
         timeout=600,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        pool_maxsize=None,
+        session=None,
     ):
         self.endpoint = endpoint.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.default_model = default_model
-        self.session = self._create_session()
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize or max(max_concurrency, 10)
+        # Clients for models on the same endpoint may share one session.
+        self.session = session or self._create_session()
 
     def _create_session(self):
         """Create a requests session with retry logic and connection pooling."""
@@ -37,7 +49,11 @@ class LocalAIClient:
             allowed_methods=["POST"],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep enough pooled keep-alive connections for concurrent `achat` calls.
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=self.pool_maxsize,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -52,6 +68,21 @@ class LocalAIClient:
             headers["Authorization"] = f"{self.api_key}"
         return headers
 
+    def _payload(self, prompt, model=None, **kwargs):
+        payload = {
+            "model": model or self.default_model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": kwargs.get("max_tokens", 512),
+        }
+
+        # Optional deterministic controls for reproducibility
+        if "temperature" in kwargs:
+            payload["temperature"] = kwargs["temperature"]
+
+        if "seed" in kwargs:
+            payload["seed"] = kwargs["seed"]
+        return payload
+
     def chat(self, prompt, model=None, **kwargs):
         """
         Send a chat completion request to LocalAI.
@@ -73,24 +104,12 @@ class LocalAIClient:
         """
         # Use chat completions endpoint format
         url = f"{self.endpoint}/v1/chat/completions"
-        payload = {
-            "model": model or self.default_model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": kwargs.get("max_tokens", 512),
-        }
-
-        # Optional deterministic controls for reproducibility
-        if "temperature" in kwargs:
-            payload["temperature"] = kwargs["temperature"]
-
-        if "seed" in kwargs:
-            payload["seed"] = kwargs["seed"]
+        payload = self._payload(prompt, model, **kwargs)
 
         try:
             # Use session with connection pooling for better stability
             # timeout as tuple: (connect_timeout, read_timeout)
             resp = self.session.post(
-
                 url,
                 headers=self._headers(),
                 json=payload,
@@ -111,3 +130,46 @@ class LocalAIClient:
             raise TextLLMException(f"Request failed: {e}")
         except Exception as e:
             raise TextLLMException(f"Unexpected error: {e}")
+
+    def stream_chat(self, prompt, model=None, **kwargs):
+        """
+        Like `chat`, but yield the message content in pieces as LocalAI
+        streams them (server-sent events).
+
+        The read timeout applies between chunks rather than to the whole
+        completion, and closing the generator early closes the connection.
+
+        Raises:
+            TextLLMException: On network errors or request failures
+        """
+        url = f"{self.endpoint}/v1/chat/completions"
+        payload = self._payload(prompt, model, **kwargs)
+        payload["stream"] = True
+        headers = {**self._headers(), "Accept": "text/event-stream"}
+
+        try:
+            with self.session.post(
+                url,
+                headers=headers,
+                json=payload,
+                timeout=(10, self.timeout),
+                stream=True,
+            ) as resp:
+                resp.raise_for_status()
+                resp.encoding = "utf-8"
+                for data in iter_sse_data(resp.iter_lines(decode_unicode=True)):
+                    if data == "[DONE]":
+                        return
+                    choices = json.loads(data).get("choices") or []
+                    delta = (choices[0].get("delta") or {}) if choices else {}
+                    content = delta.get("content")
+                    if content:
+                        yield content
+        except requests.exceptions.Timeout as e:
+            raise TextLLMException(f"Request timeout: {e}")
+        except requests.exceptions.ConnectionError as e:
+            raise TextLLMException(f"Connection error: {e}")
+        except requests.exceptions.RequestException as e:
+            raise TextLLMException(f"Request failed: {e}")
+        except Exception as e:
+            raise TextLLMException(f"Unexpected error: {e}")
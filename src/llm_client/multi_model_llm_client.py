@@ -1,46 +1,148 @@
+import asyncio
 import os
+import threading
+from collections.abc import Mapping
 
 import yaml
 from dotenv import load_dotenv
 
+from src.llm_client.async_chat import DEFAULT_MAX_CONCURRENCY
 from src.llm_client.azure_responses_client import AzureResponsesClient
+from src.llm_client.code_block_stream import CodeBlockStreamParser
 from src.llm_client.localai_client import LocalAIClient
+from src.llm_client.response_cache import LLMResponseCache
+
+_AZURE_PROVIDERS = {"AzureOpenAI", "AzureResponses"}
+_SUPPORTED_PROVIDERS = _AZURE_PROVIDERS | {"LocalAI"}
+
+_SHARED_LOCK = threading.Lock()
+_SHARED_CLIENTS = {}
+
+
+class _LazyProviderClients(Mapping):
+    """Provider clients by model name, each constructed on first access."""
+
+    def __init__(self, model_names, create_client):
+        self._model_names = list(model_names)
+        self._create_client = create_client
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, model_name):
+        client = self._clients.get(model_name)
+        if client is not None:
+            return client
+        if model_name not in self._model_names:
+            raise KeyError(model_name)
+        with self._lock:
+            client = self._clients.get(model_name)
+            if client is None:
+                client = self._clients[model_name] = self._create_client(model_name)
+        return client
+
+    def __contains__(self, model_name):
+        return model_name in self._model_names
+
+    def __iter__(self):
+        return iter(self._model_names)
+
+    def __len__(self):
+        return len(self._model_names)
 
 
 class MultiModelLLMClient:
     """
     Wrapper for OpenAIChatClient to support multiple model selection.
+
+    Provider clients are created the first time their model is used. Models
+    served by the same provider endpoint share one keep-alive session, whose
+    pool holds as many connections as the largest `max_concurrency` among
+    them (at least 10). Use `shared()` to reuse one instance per process.
+
+    Responses go through `response_cache` when one is given or configured via
+    the `LLM_CACHE_MODE` / `LLM_CACHE_PATH` / `LLM_CACHE_MAX_MB` variables.
     """
 
-    def __init__(self):
+    def __init__(self, response_cache: LLMResponseCache | None = None):
         self.default_model = None
         self.api_key = None
         self.load_env()
-        self.clients = {}
+        if response_cache is None:
+            response_cache = LLMResponseCache.from_env()
+        self.response_cache = response_cache
         # Load model configuration from available_models.yaml
         config_path = os.path.join(
             os.path.dirname(__file__), "../../available_models.yaml"
         )
         with open(config_path, "r", encoding="utf-8") as f:
             models_config = yaml.safe_load(f)
+        self._model_configs = {}
+        self._pool_sizes = {}
+        self._sessions = {}
         for model_info in models_config:
-            model_name = model_info.get("model_name")
             provider = model_info.get("provider")
-            endpoint = model_info.get("endpoint")
-            api_version = model_info.get("api_version")
-
-            if provider in {"AzureOpenAI", "AzureResponses"}:
-                self.clients[model_name] = AzureResponsesClient(
-                    endpoint=endpoint,
-                    default_model=model_name,
-                    api_key=self.api_key,
-                    api_version=api_version,
-                )
-            elif provider == "LocalAI":
-                # Instantiate the LocalAI HTTP client wrapper
-                self.clients[model_name] = LocalAIClient(
-                    endpoint=endpoint, default_model=model_name, api_key=self.api_key
-                )
+            if provider not in _SUPPORTED_PROVIDERS:
+                continue
+            self._model_configs[model_info.get("model_name")] = model_info
+            pool_key = (provider, model_info.get("endpoint"))
+            self._pool_sizes[pool_key] = max(
+                self._pool_sizes.get(pool_key, 10),
+                self._max_concurrency(model_info),
+            )
+        self.clients = _LazyProviderClients(self._model_configs, self._create_client)
+
+    @classmethod
+    def shared(cls):
+        """
+        Process-wide instance, so `.env` and available_models.yaml are read
+        once and provider sessions are reused across callers.
+        """
+        with _SHARED_LOCK:
+            instance = _SHARED_CLIENTS.get(cls)
+            if instance is None:
+                instance = _SHARED_CLIENTS[cls] = cls()
+        return instance
+
+    @classmethod
+    def reset_shared(cls):
+        """Drop the process-wide instance, e.g. after editing model config."""
+        with _SHARED_LOCK:
+            _SHARED_CLIENTS.pop(cls, None)
+
+    @staticmethod
+    def _max_concurrency(model_info):
+        return int(model_info.get("max_concurrency") or DEFAULT_MAX_CONCURRENCY)
+
+    def _create_client(self, model_name):
+        # Called under the client map's lock, which also guards `_sessions`.
+        model_info = self._model_configs[model_name]
+        provider = model_info.get("provider")
+        endpoint = model_info.get("endpoint")
+        pool_key = (provider, endpoint)
+        session = self._sessions.get(pool_key)
+
+        if provider in _AZURE_PROVIDERS:
+            client = AzureResponsesClient(
+                endpoint=endpoint,
+                default_model=model_name,
+                api_key=self.api_key,
+                api_version=model_info.get("api_version"),
+                max_concurrency=self._max_concurrency(model_info),
+                pool_maxsize=self._pool_sizes[pool_key],
+                session=session,
+            )
+        else:
+            # Instantiate the LocalAI HTTP client wrapper
+            client = LocalAIClient(
+                endpoint=endpoint,
+                default_model=model_name,
+                api_key=self.api_key,
+                max_concurrency=self._max_concurrency(model_info),
+                pool_maxsize=self._pool_sizes[pool_key],
+                session=session,
+            )
+        self._sessions.setdefault(pool_key, client.session)
+        return client
 
     def load_env(self):
         env_path = os.path.join(os.path.dirname(__file__), "../../.env")
@@ -59,20 +161,114 @@ class MultiModelLLMClient:
             raise ValueError(f"Model '{model}' is not supported.")
         return self.clients[model]
 
+    def _chat_one(self, prompt, model, **kwargs):
+        client = self.get_client(model)
+        cache = self.response_cache
+        if cache is None:
+            return client.chat(prompt, **kwargs)
+        model_name = model or self.default_model
+        cached = cache.lookup(model_name, prompt, kwargs)
+        if cached is not None:
+            return cached
+        response = client.chat(prompt, **kwargs)
+        cache.store(model_name, prompt, kwargs, response)
+        return response
+
+    async def _achat_one(self, prompt, model, **kwargs):
+        client = self.get_client(model)
+        cache = self.response_cache
+        if cache is None:
+            return await client.achat(prompt, **kwargs)
+        model_name = model or self.default_model
+        cached = cache.lookup(model_name, prompt, kwargs)
+        if cached is not None:
+            return cached
+        response = await client.achat(prompt, **kwargs)
+        cache.store(model_name, prompt, kwargs, response)
+        return response
+
     def chat(self, prompt, model=None, **kwargs):
         """
         If model is a list, call each and return a dict of model:response.
         If model is a string or None, return the single response.
+
+        Model lists are sent concurrently (see `achat`) unless an event loop
+        is already running in this thread, in which case they run in turn.
         """
         if isinstance(model, list):
-            results = {}
-            for m in model:
-                client = self.get_client(m)
-                results[m] = client.chat(prompt, **kwargs)
-            return results
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.achat(prompt, model=model, **kwargs))
+            return {m: self._chat_one(prompt, m, **kwargs) for m in model}
         else:
-            client = self.get_client(model)
-            return client.chat(prompt, **kwargs)
+            return self._chat_one(prompt, model, **kwargs)
+
+    async def achat(self, prompt, model=None, **kwargs):
+        """
+        Async `chat`. A list of models is fanned out concurrently and returns
+        a dict of model:response in the given order; each provider client
+        bounds its in-flight requests per endpoint.
+        """
+        if isinstance(model, list):
+            for m in model:
+                self.get_client(m)
+            responses = await asyncio.gather(
+                *(self._achat_one(prompt, m, **kwargs) for m in model)
+            )
+            return dict(zip(model, responses))
+        return await self._achat_one(prompt, model, **kwargs)
+
+    async def achat_many(self, prompts, model=None, return_exceptions=False, **kwargs):
+        """
+        Send several prompts to one model concurrently; responses keep the
+        order of `prompts`. With `return_exceptions`, a failed prompt yields
+        its exception instead of cancelling the others.
+        """
+        self.get_client(model)
+        return await asyncio.gather(
+            *(self._achat_one(prompt, model, **kwargs) for prompt in prompts),
+            return_exceptions=return_exceptions,
+        )
+
+    def stream_chat(self, prompt, model=None, stop_after_code_block=False, **kwargs):
+        """
+        Yield the response of a single model in pieces as it is generated.
+
+        With `stop_after_code_block`, the stream ends once the first non-empty
+        fenced code block is closed. With a response cache, a hit is yielded
+        as one piece; a miss is stored only when the stream ends by itself or
+        at that deliberate stop (which is part of the key), never when the
+        consumer abandons it part-way.
+        """
+        client = self.get_client(model)
+        cache = self.response_cache
+        parser = CodeBlockStreamParser() if stop_after_code_block else None
+        model_name = model or self.default_model
+        params = {**kwargs, "stream": True}
+        if stop_after_code_block:
+            params["stop"] = "code_block"
+        if cache is not None:
+            cached = cache.lookup(model_name, prompt, params)
+            if cached is not None:
+                yield cached
+                return
+        parts = []
+        stream = client.stream_chat(prompt, **kwargs)
+        try:
+            for part in stream:
+                parts.append(part)
+                if parser is not None and parser.feed(part):
+                    # Store before the last yield: the consumer may stop here.
+                    if cache is not None:
+                        cache.store(model_name, prompt, params, "".join(parts))
+                    yield part
+                    return
+                yield part
+        finally:
+            stream.close()
+        if cache is not None:
+            cache.store(model_name, prompt, params, "".join(parts))
 
     def openai_client(self, model=None):
         if model is None:
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Mapping
+
+from src.errors.LLMCacheMissError import LLMCacheMissError
+
+CACHE_MODES = ("off", "read_through", "record", "replay")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_TOUCH_INTERVAL_S = 60.0
+
+
+def default_response_cache_path() -> Path:
+    cache_root = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_root) / "coding-tool-reasoning" / "llm_responses.sqlite"
+
+
+def response_cache_key(model: str, prompt: str, params: Mapping[str, Any]) -> str:
+    """SHA-256 over the model, prompt and every sampling parameter of a call."""
+
+    material = json.dumps(
+        {"model": model, "prompt": prompt, "params": dict(params)},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Content-addressed SQLite store of LLM responses.
+
+    Modes:
+    - ``read_through``: serve hits, call the model on a miss and store the result.
+    - ``record``: always call the model and overwrite the stored response.
+    - ``replay``: serve hits and raise `LLMCacheMissError` on a miss, so a rerun
+      never reaches a model.
+
+    Once the stored responses exceed ``max_bytes``, the least recently used
+    ones are evicted. A hit only rewrites its ``last_used_at`` when the stored
+    value is older than ``touch_interval_s``, so recency is tracked to that
+    granularity. The total size is kept in memory and only re-summed from the
+    table when it crosses the budget, which also folds in what other
+    processes sharing the file have stored.
+    """
+
+    def __init__(
+        self,
+        mode: str = "read_through",
+        db_path: Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        touch_interval_s: float = DEFAULT_TOUCH_INTERVAL_S,
+    ) -> None:
+        if mode not in CACHE_MODES or mode == "off":
+            raise ValueError(f"mode must be one of {CACHE_MODES[1:]}: {mode!r}")
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.touch_interval_s = touch_interval_s
+        self.db_path = db_path or default_response_cache_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Async fan-out stores responses from worker threads.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.db_path), timeout=30.0, check_same_thread=False
+        )
+        # WAL lets the experiment runner and MCP server processes share the file.
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT NOT NULL, response TEXT NOT NULL, "
+            "size INTEGER NOT NULL, created_at REAL NOT NULL, "
+            "last_used_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used_at)"
+        )
+        self._connection.commit()
+        self._total_bytes = self._stored_bytes()
+
+    @classmethod
+    def from_env(cls) -> "LLMResponseCache | None":
+        """Build the cache described by `LLM_CACHE_*` variables; None when off."""
+
+        mode = (os.getenv("LLM_CACHE_MODE") or "off").strip().lower()
+        if mode == "off":
+            return None
+        path = os.getenv("LLM_CACHE_PATH")
+        max_mb = os.getenv("LLM_CACHE_MAX_MB")
+        return cls(
+            mode=mode,
+            db_path=Path(path) if path else None,
+            max_bytes=int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES,
+        )
+
+    def lookup(self, model: str, prompt: str, params: Mapping[str, Any]) -> str | None:
+        """Stored response for this call, or None when the model must be called.
+
+        Raises `LLMCacheMissError` on a miss in ``replay`` mode.
+        """
+
+        if self.mode == "record":
+            return None
+        key = response_cache_key(model, prompt, params)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, last_used_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            if row is not None and now - row[1] >= self.touch_interval_s:
+                self._connection.execute(
+                    "UPDATE responses SET last_used_at = ? WHERE key = ?", (now, key)
+                )
+                self._connection.commit()
+        if row is None and self.mode == "replay":
+            raise LLMCacheMissError(
+                f"No cached response for model '{model}' (key {key[:12]}) in replay mode"
+            )
+        return None if row is None else row[0]
+
+    def store(
+        self, model: str, prompt: str, params: Mapping[str, Any], response: str
+    ) -> None:
+        if self.mode == "replay":
+            return
+        key = response_cache_key(model, prompt, params)
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, response, size, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now),
+            )
+            # Replacing a key over-counts; the re-sum in _evict corrects it.
+            self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self._connection.commit()
+
+    def _stored_bytes(self) -> int:
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def _evict(self) -> None:
+        total = self._total_bytes = self._stored_bytes()
+        if total <= self.max_bytes:
+            return
+        cursor = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY last_used_at, created_at"
+        )
+        evicted = []
+        for key, size in cursor:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self._total_bytes = total
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
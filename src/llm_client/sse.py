@@ -0,0 +1,25 @@
+from typing import Iterable, Iterator
+
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[str]:
+    """Data payload of each server-sent event in a stream of decoded lines.
+
+    Multi-line `data:` fields are joined with newlines; comments, `event:`,
+    `id:` and `retry:` fields are ignored since both providers repeat the event
+    type inside the JSON payload.
+    """
+
+    data_lines: list[str] = []
+    for line in lines:
+        if not line:
+            if data_lines:
+                yield "\n".join(data_lines)
+                data_lines = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if field == "data":
+            data_lines.append(value[1:] if value.startswith(" ") else value)
+    if data_lines:
+        yield "\n".join(data_lines)
@@ -11,13 +11,22 @@ from __future__ import annotations
 
 import glob
 import json
+import logging
 import os
+import threading
 from typing import Any, List, Optional
 
 from src.mcp.tools.swe_mcp_tools import register_swe_mcp_tools
 from src.models.swe_config import SweMcpConfig
 from src.models.swe_server_context import SweServerContext
 from src.service.swe_knowledge_base_service import SweKnowledgeBase
+from src.service.swe_knowledge_base_snapshot import default_snapshot_path
+from src.service.swe_knowledge_base_watcher import (
+    KnowledgeBaseWatcher,
+    KnowledgeSourceCache,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class SweMcpServerContextProvider:
@@ -28,6 +37,9 @@ class SweMcpServerContextProvider:
             os.path.join(os.path.dirname(__file__), "..", "..")
         )
         self._server_context: SweServerContext | None = None
+        self._source_cache: KnowledgeSourceCache | None = None
+        self._watcher: KnowledgeBaseWatcher | None = None
+        self._reload_lock = threading.Lock()
 
     @property
     def repo_root(self) -> str:
@@ -40,6 +52,89 @@ class SweMcpServerContextProvider:
             return self._server_context
 
         config = SweMcpConfig.load(repo_root=self._repo_root)
+        # Serialized with watcher reloads so every replaced context is retired.
+        with self._reload_lock:
+            if self._server_context is not None and not force_reload:
+                return self._server_context
+            previous = self._server_context
+            context = self._server_context = self._build_server_context(config=config)
+            self._retire(previous)
+        if config.knowledge_base.watch_for_changes:
+            self.start_knowledge_base_watcher()
+        return context
+
+    def _build_server_context(self, config: SweMcpConfig) -> SweServerContext:
+        kb = self.create_knowledge_base(config=config)
+        kb.load()
+        templates = self._load_concern_assets(config=config)
+        return SweServerContext(
+            repo_root=self._repo_root,
+            config=config,
+            kb=kb,
+            templates=templates,
+        )
+
+    def reload_knowledge_base(self) -> SweServerContext:
+        """Rebuild the knowledge base and templates and swap in a new context.
+
+        The new context is built next to the current one and published with a
+        single assignment, so tool calls that already hold the previous context
+        finish against it. With ``watch_for_changes`` enabled, unchanged source
+        files are reused from the provider's source cache instead of re-parsed.
+        """
+
+        with self._reload_lock:
+            current = self._server_context
+            config = (
+                current.config
+                if current is not None
+                else SweMcpConfig.load(repo_root=self._repo_root)
+            )
+            context = self._server_context = self._build_server_context(config=config)
+            self._retire(current)
+        return context
+
+    @staticmethod
+    def _retire(context: SweServerContext | None) -> None:
+        # In-flight tool calls may still use the old knowledge base, so only
+        # stop its prefetch threads without waiting for them.
+        if context is not None:
+            context.kb.close(wait=False)
+
+    def start_knowledge_base_watcher(self) -> KnowledgeBaseWatcher:
+        """Poll the knowledge base roots and reload whenever a source file changes."""
+
+        context = self.create_swe_server_context()
+        if self._watcher is None:
+            self._watcher = KnowledgeBaseWatcher(
+                roots=[context.kb.ground_data_dir, context.kb.linked_data_dir],
+                on_change=self._on_knowledge_sources_changed,
+                interval_seconds=context.config.knowledge_base.watch_interval_seconds,
+            )
+        self._watcher.start()
+        return self._watcher
+
+    def stop_knowledge_base_watcher(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _on_knowledge_sources_changed(self, changed_paths: List[str]) -> None:
+        if self._source_cache is not None:
+            self._source_cache.discard(
+                path for path in changed_paths if not os.path.exists(path)
+            )
+        logger.info(
+            f"Reloading knowledge base after {len(changed_paths)} source file change(s)"
+        )
+        self.reload_knowledge_base()
+
+    def create_knowledge_base(
+        self,
+        config: SweMcpConfig,
+        use_snapshot: Optional[bool] = None,
+    ) -> SweKnowledgeBase:
+        """Build an unloaded knowledge base from the configured roots."""
 
         ground_dir = config.knowledge_base.ground_data_dir or os.path.join(
             self._repo_root, "knowledge", "data"
@@ -53,21 +148,30 @@ class SweMcpServerContextProvider:
         if not os.path.isabs(linked_dir):
             linked_dir = os.path.join(self._repo_root, linked_dir)
 
-        kb = SweKnowledgeBase(
+        options: dict[str, Any] = {}
+        if config.knowledge_base.lazy_load_nodes:
+            options["hydration_cache_size"] = config.knowledge_base.hydration_cache_size
+            options["hydration_workers"] = config.knowledge_base.hydration_workers
+            options["prefetch_depth"] = config.knowledge_base.relationship_depth
+        if config.knowledge_base.watch_for_changes:
+            if self._source_cache is None:
+                self._source_cache = KnowledgeSourceCache()
+            options["source_cache"] = self._source_cache
+        if use_snapshot is None:
+            use_snapshot = config.knowledge_base.use_snapshot
+        if use_snapshot:
+            options["snapshot_path"] = (
+                self._resolve_path(config.knowledge_base.snapshot_path)
+                if config.knowledge_base.snapshot_path
+                else default_snapshot_path(ground_dir, linked_dir)
+            )
+
+        return SweKnowledgeBase(
             ground_data_dir=ground_dir,
             linked_data_dir=linked_dir,
             lazy_load_nodes=config.knowledge_base.lazy_load_nodes,
+            **options,
         )
-        kb.load()
-        templates = self._load_concern_assets(config=config)
-
-        self._server_context = SweServerContext(
-            repo_root=self._repo_root,
-            config=config,
-            kb=kb,
-            templates=templates,
-        )
-        return self._server_context
 
     def _resolve_path(self, configured_path: str) -> str:
         if os.path.isabs(configured_path):
@@ -255,4 +359,3 @@ def register_swe_tools_on_mcp(mcp: Any) -> None:
     """Backwards-compatible function wrapper for MCP registration."""
 
     _DEFAULT_CONTEXT_PROVIDER.register_swe_tools_on_mcp(mcp)
-
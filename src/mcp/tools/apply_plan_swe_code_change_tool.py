@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import difflib
 import json
-import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from src.llm_client.code_block_stream import CodeBlockStreamParser
 from src.llm_client.multi_model_llm_client import MultiModelLLMClient
 from src.models.swe_context import SweContext
 
@@ -17,14 +19,50 @@ class ApplyPlanSweCodeChangeTool:
 
     @staticmethod
     def _extract_code_blocks(raw_text: str) -> list[dict[str, str]]:
-        blocks: list[dict[str, str]] = []
-        pattern = re.compile(r"```([a-zA-Z0-9_+-]*)\n(.*?)```", re.DOTALL)
-        for match in pattern.finditer(raw_text):
-            language = (match.group(1) or "text").strip() or "text"
-            content = (match.group(2) or "").strip()
-            if content:
-                blocks.append({"language": language, "code": content})
-        return blocks
+        parser = CodeBlockStreamParser()
+        parser.feed(raw_text)
+        return parser.blocks
+
+    @staticmethod
+    def _generate(
+        llm_client: Any, prompt: str, chat_kwargs: dict[str, Any], stream: bool
+    ) -> tuple[str, dict[str, Any]]:
+        """Response text plus streaming stats for one generation call.
+
+        When streaming, reading stops once the first non-empty code block is
+        closed, since the prompts ask for exactly one block.
+        """
+
+        if not stream:
+            raw = llm_client.chat(prompt, **chat_kwargs)
+            return raw, {"time_to_first_token_ms": None, "stopped_at_fence": False}
+
+        started = time.perf_counter()
+        first_token_ms: float | None = None
+        parser = CodeBlockStreamParser()
+        parts: list[str] = []
+        stopped_at_fence = False
+        stream_kwargs = dict(chat_kwargs)
+        if isinstance(llm_client, MultiModelLLMClient):
+            # Lets the client cache the response up to the same stop point.
+            stream_kwargs["stop_after_code_block"] = True
+        response_stream = llm_client.stream_chat(prompt, **stream_kwargs)
+        try:
+            for part in response_stream:
+                if first_token_ms is None:
+                    first_token_ms = round((time.perf_counter() - started) * 1000, 1)
+                parts.append(part)
+                if parser.feed(part):
+                    stopped_at_fence = True
+                    break
+        finally:
+            close = getattr(response_stream, "close", None)
+            if close is not None:
+                close()
+        return "".join(parts), {
+            "time_to_first_token_ms": first_token_ms,
+            "stopped_at_fence": stopped_at_fence,
+        }
 
     @staticmethod
     def _select_generated_code(
@@ -52,6 +90,18 @@ class ApplyPlanSweCodeChangeTool:
             return text
         return f"{text[:max_chars]}\n\n[...truncated {len(text) - max_chars} chars]"
 
+    @staticmethod
+    def _truncate_lines(value: str | None, max_chars: int) -> str:
+        """Like `_truncate_text`, but only cuts between lines."""
+
+        text = (value or "").strip()
+        if len(text) <= max_chars:
+            return text
+        cut = text.rfind("\n", 0, max_chars + 1)
+        if cut <= 0:
+            cut = max_chars
+        return f"{text[:cut].rstrip()}\n\n[...truncated {len(text) - cut} chars]"
+
     @classmethod
     def _compact_swe_context_for_generation(
         cls,
@@ -65,7 +115,9 @@ class ApplyPlanSweCodeChangeTool:
             "nfr_focus": plan.nfr_focus or [],
             "target_language": plan.target_language,
             "high_level_steps": plan.high_level_steps,
-            "swe_summary": cls._truncate_text(
+            # Summaries built by BuildSweCodeContextTool already fit this
+            # budget; this only guards caller-supplied contexts.
+            "swe_summary": cls._truncate_lines(
                 swe_context.swe_summary, max_summary_chars
             ),
             "security_context": cls._truncate_text(
@@ -179,8 +231,8 @@ class ApplyPlanSweCodeChangeTool:
     ) -> dict[str, Any]:
         """Generate candidate modified code using plan + context + original code."""
 
-        llm_cls = self._registry._llm_client_cls or MultiModelLLMClient
-        llm_client = llm_cls()
+        llm_cls = self._registry._llm_client_cls
+        llm_client = llm_cls() if llm_cls else MultiModelLLMClient.shared()
 
         config = self._registry._create_swe_server_context().config.execution
 
@@ -198,6 +250,9 @@ class ApplyPlanSweCodeChangeTool:
             chat_kwargs["temperature"] = temperature
         if seed is not None:
             chat_kwargs["seed"] = seed
+        stream = config.stream_generation and hasattr(llm_client, "stream_chat")
+        first_token_ms: float | None = None
+        stopped_at_fence_count = 0
 
         if not chunked:
             prompt = self._build_single_shot_prompt(
@@ -206,7 +261,9 @@ class ApplyPlanSweCodeChangeTool:
                 original_code=original_code,
             )
             try:
-                raw_response = llm_client.chat(prompt, **chat_kwargs)
+                raw_response, stream_stats = self._generate(
+                    llm_client, prompt, chat_kwargs, stream
+                )
             except Exception as exc:  # pragma: no cover
                 self._registry._logger.warning(
                     "apply_plan_swe_code_change failed: %s", exc
@@ -223,6 +280,8 @@ class ApplyPlanSweCodeChangeTool:
                     "chunked": False,
                 }
 
+            first_token_ms = stream_stats["time_to_first_token_ms"]
+            stopped_at_fence_count = int(stream_stats["stopped_at_fence"])
             extracted_blocks = self._extract_code_blocks(raw_response)
             generated_code = self._select_generated_code(
                 original_code, extracted_blocks, raw_response
@@ -235,9 +294,8 @@ class ApplyPlanSweCodeChangeTool:
             updated_chunks: list[str] = []
             raw_responses: list[str] = []
             chunk_errors = []
-
-            for idx, chunk in enumerate(chunks, start=1):
-                chunk_prompt = self._build_chunk_prompt(
+            chunk_prompts = [
+                self._build_chunk_prompt(
                     target_path=target_path,
                     compact_context_json=compact_context_json,
                     chunk_index=idx,
@@ -246,29 +304,47 @@ class ApplyPlanSweCodeChangeTool:
                     end_line=int(chunk["end"]),
                     chunk_code=str(chunk["code"]),
                 )
+                for idx, chunk in enumerate(chunks, start=1)
+            ]
 
-                try:
-                    chunk_raw = llm_client.chat(chunk_prompt, **chat_kwargs)
-                    chunk_blocks = self._extract_code_blocks(chunk_raw)
-                    updated_chunk = self._select_generated_code(
-                        str(chunk["code"]),
-                        chunk_blocks,
-                        chunk_raw,
-                    )
-                    updated_chunks.append(updated_chunk)
-                    raw_responses.append(
-                        f"### Chunk {idx}/{len(chunks)} (lines {chunk['start']}-{chunk['end']})\\n{chunk_raw}"
+            # Chunks are generated concurrently but collected in file order, so
+            # reassembly and error reporting match sequential generation.
+            with ThreadPoolExecutor(
+                max_workers=min(config.max_parallel_chunks, len(chunks)),
+                thread_name_prefix="apply-plan-chunk",
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._generate, llm_client, chunk_prompt, chat_kwargs, stream
                     )
-                except Exception as exc:  # pragma: no cover
-                    chunk_errors.append(
-                        {
-                            "chunk_index": idx,
-                            "line_start": chunk["start"],
-                            "line_end": chunk["end"],
-                            "error": f"{type(exc).__name__}: {exc}",
-                        }
-                    )
-                    updated_chunks.append(str(chunk["code"]))
+                    for chunk_prompt in chunk_prompts
+                ]
+                for idx, (chunk, future) in enumerate(zip(chunks, futures), start=1):
+                    try:
+                        chunk_raw, stream_stats = future.result()
+                        if first_token_ms is None:
+                            first_token_ms = stream_stats["time_to_first_token_ms"]
+                        stopped_at_fence_count += int(stream_stats["stopped_at_fence"])
+                        chunk_blocks = self._extract_code_blocks(chunk_raw)
+                        updated_chunk = self._select_generated_code(
+                            str(chunk["code"]),
+                            chunk_blocks,
+                            chunk_raw,
+                        )
+                        updated_chunks.append(updated_chunk)
+                        raw_responses.append(
+                            f"### Chunk {idx}/{len(chunks)} (lines {chunk['start']}-{chunk['end']})\\n{chunk_raw}"
+                        )
+                    except Exception as exc:  # pragma: no cover
+                        chunk_errors.append(
+                            {
+                                "chunk_index": idx,
+                                "line_start": chunk["start"],
+                                "line_end": chunk["end"],
+                                "error": f"{type(exc).__name__}: {exc}",
+                            }
+                        )
+                        updated_chunks.append(str(chunk["code"]))
 
             generated_code = "\n".join(updated_chunks)
             raw_response = "\n\n".join(raw_responses)
@@ -298,10 +374,17 @@ class ApplyPlanSweCodeChangeTool:
             else 1,
             "chunk_errors": chunk_errors if chunked else [],
             "formatting_normalized": True,
+            "streaming": {
+                "enabled": stream,
+                "time_to_first_token_ms": first_token_ms,
+                "stopped_at_closing_fence": stopped_at_fence_count,
+            },
             "execution_config": {
                 "max_summary_chars": config.max_summary_chars,
                 "max_security_context_chars": config.max_security_context_chars,
                 "max_single_shot_code_chars": config.max_single_shot_code_chars,
                 "chunk_lines": config.chunk_lines,
+                "max_parallel_chunks": config.max_parallel_chunks,
+                "stream_generation": config.stream_generation,
             },
         }
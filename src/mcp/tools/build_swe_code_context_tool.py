@@ -34,7 +34,11 @@ class BuildSweCodeContextTool:
         kb = ctx.kb
 
         nfr_ids = kb.find_nfr_ids(plan.nfr_focus) if plan.nfr_focus else []
-        summary = kb.summarize_for_prompt(nfr_ids)
+        summary = kb.summarize_for_prompt(
+            nfr_ids,
+            max_chars=ctx.config.execution.max_summary_chars,
+            focus_text="\n".join([plan.problem_description, *plan.high_level_steps]),
+        )
         LOGGER.info(
             "Building SWE code context for problem '%s' (nfr_ids=%d, include_templates=%s)",
             plan.problem_description,
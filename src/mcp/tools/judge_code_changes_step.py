@@ -38,7 +38,7 @@ class JudgeCodeChangesStep:
             )
         self.kb = kb
         self.kb.load()
-        self.llm_client = llm_client or MultiModelLLMClient()
+        self.llm_client = llm_client or MultiModelLLMClient.shared()
         self.service = ExplanationService(
             kb=self.kb,
             llm_client=self.llm_client,
@@ -44,6 +44,48 @@ class KnowledgeBaseConfig(BaseModel):
             "defer loading rich data.json payload details until a node is read."
         ),
     )
+    hydration_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "With lazy_load_nodes, how many nodes keep their data.json details "
+            "loaded before the least recently used are released (0 = unbounded)."
+        ),
+    )
+    hydration_workers: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Threads used to prefetch data.json details of the nodes around "
+            "resolved NFRs when lazy_load_nodes is enabled."
+        ),
+    )
+    use_snapshot: bool = Field(
+        default=False,
+        description=(
+            "Restore the loaded knowledge base from a snapshot keyed by a content "
+            "hash of the source files, rebuilding it only when they change."
+        ),
+    )
+    snapshot_path: Optional[str] = Field(
+        default=None,
+        description=(
+            "Optional absolute or repo-relative snapshot file. Defaults to a "
+            "per-source-tree file under the user cache directory."
+        ),
+    )
+    watch_for_changes: bool = Field(
+        default=False,
+        description=(
+            "Poll the knowledge base roots and reload the knowledge base when a "
+            "data.json or CSV file changes, without restarting the server."
+        ),
+    )
+    watch_interval_seconds: float = Field(
+        default=2.0,
+        gt=0,
+        description="Seconds between polls when watch_for_changes is enabled.",
+    )
 
 
 class PlanningConfig(BaseModel):
@@ -162,7 +204,11 @@ class ToolExecutionConfig(BaseModel):
     max_summary_chars: int = Field(
         default=6000,
         ge=500,
-        description="Maximum characters included from SWE summary in generation prompts.",
+        description=(
+            "Character budget for the SWE summary: build_swe_code_context fills it "
+            "with the most relevant knowledge base neighbours, and generation "
+            "prompts cut longer caller-supplied summaries at a line boundary."
+        ),
     )
     max_security_context_chars: int = Field(
         default=2000,
@@ -182,6 +228,21 @@ class ToolExecutionConfig(BaseModel):
         ge=20,
         description="Chunk size in lines when chunked generation mode is used.",
     )
+    max_parallel_chunks: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Chunk prompts in flight at once in chunked generation mode; 1 "
+            "generates chunks one after another."
+        ),
+    )
+    stream_generation: bool = Field(
+        default=True,
+        description=(
+            "Stream generation responses when the LLM client supports it, "
+            "stopping at the closing fence of the first code block."
+        ),
+    )
 
 
 class LocalizerConfig(BaseModel):
@@ -194,6 +255,21 @@ class LocalizerConfig(BaseModel):
             "when minimizing model-related overhead is preferred."
         ),
     )
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Worker processes used to read and analyse candidate files before "
+            "scoring. 1 keeps localization in the calling process."
+        ),
+    )
+    enable_cascade_ranking: bool = Field(
+        default=False,
+        description=(
+            "Run cheap strategies first and skip expensive ones for files whose "
+            "score upper bound can no longer reach the reported top results."
+        ),
+    )
 
 
 class SweMcpConfig(BaseModel):
@@ -225,4 +301,3 @@ class SweMcpConfig(BaseModel):
         except Exception:
             # Fall back to defaults on any parsing error to keep the server robust.
             return cls()
-
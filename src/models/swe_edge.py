@@ -1,9 +1,15 @@
+import sys
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class SweEdge:
     source_id: str
     relation: str
     target_id: str
     description: str
+
+    def __post_init__(self) -> None:
+        self.source_id = sys.intern(self.source_id)
+        self.relation = sys.intern(self.relation)
+        self.target_id = sys.intern(self.target_id)
@@ -1,8 +1,9 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class SweNode:
     id: str
     type: str
@@ -11,3 +12,9 @@ class SweNode:
     description: str
     metadata: Dict[str, Any] = field(default_factory=dict)
     source_path: str = ""
+
+    def __post_init__(self) -> None:
+        # Ids, types and categories repeat across nodes and edges; share one copy.
+        self.id = sys.intern(self.id)
+        self.type = sys.intern(self.type)
+        self.nfr_category = sys.intern(self.nfr_category)
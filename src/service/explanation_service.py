@@ -25,7 +25,7 @@ class ExplanationService:
         config: Optional[SweMcpConfig] = None,
     ) -> None:
         self.kb = kb
-        self.llm_client = llm_client or MultiModelLLMClient()
+        self.llm_client = llm_client or MultiModelLLMClient.shared()
         self.config = config or SweMcpConfig()
 
     def explain_change(
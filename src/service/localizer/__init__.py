@@ -1,3 +1,4 @@
+from src.service.localizer.corpus import CorpusDocument, RepositoryCorpus
 from src.service.localizer.discovery import discover_repository_code_files
 from src.service.localizer.models import (
     LocalizationHit,
@@ -12,11 +13,15 @@ from src.service.localizer.strategies import (
     SemanticNlpMatchingStrategy,
     SymbolImpactStrategy,
 )
+from src.service.localizer.symbol_index import SymbolIndex
 
 __all__ = [
     "LocalizationHit",
     "LocalizationStrategy",
     "LocalizerResult",
+    "CorpusDocument",
+    "RepositoryCorpus",
+    "SymbolIndex",
     "AstMatchingStrategy",
     "FilenameMatchingStrategy",
     "RegexContentMatchingStrategy",
@@ -8,8 +8,13 @@ from src.service.localizer.ast.symbol_set import SymbolSet
 
 
 class PythonSymbolExtractor(GenericSymbolExtractor):
+    """Collect definitions, references and imports from a single AST walk."""
+
     def extract(self, path: Path, source: str) -> SymbolSet:
         definitions: set[str] = set()
+        references: set[str] = set()
+        imports: set[str] = set()
+        modules: set[str] = set()
         try:
             tree = ast.parse(source)
         except SyntaxError:
@@ -18,5 +23,28 @@ class PythonSymbolExtractor(GenericSymbolExtractor):
         for node in ast.walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
                 definitions.add(node.name.lower())
+            elif isinstance(node, ast.Name):
+                references.add(node.id.lower())
+            elif isinstance(node, ast.Attribute):
+                references.add(node.attr.lower())
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.add(alias.name.split(".")[-1].lower())
+                    modules.add(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                prefix = "." * node.level + (node.module or "")
+                if node.module:
+                    imports.add(node.module.split(".")[-1].lower())
+                    modules.add(prefix)
+                for alias in node.names:
+                    imports.add(alias.name.split(".")[-1].lower())
+                    # `from pkg import mod` may name a submodule rather than a symbol.
+                    separator = "." if node.module else ""
+                    modules.add(f"{prefix}{separator}{alias.name}")
 
-        return SymbolSet(definitions=definitions)
+        return SymbolSet(
+            definitions=definitions,
+            references=references,
+            imports=imports,
+            modules=modules,
+        )
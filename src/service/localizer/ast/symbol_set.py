@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
 class SymbolSet:
     definitions: set[str]
+    references: set[str] = field(default_factory=set)
+    imports: set[str] = field(default_factory=set)
+    # Full import specs ("a.b.c", "..pkg.mod") for module-level dependency graphs.
+    modules: set[str] = field(default_factory=set)
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from src.service.localizer.ast.python_symbol_extractor import PythonSymbolExtractor
+from src.service.localizer.ast.symbol_set import SymbolSet
+from src.service.localizer.symbol_index import SymbolIndex
+from src.service.localizer.utils import (
+    count_token_frequency,
+    decode_source,
+    git_blob_sha,
+)
+
+T = TypeVar("T")
+
+Preparer = Callable[["CorpusDocument"], None]
+
+_PYTHON_EXTRACTOR = PythonSymbolExtractor()
+
+
+@dataclass
+class CorpusDocument:
+    """Decoded contents of one candidate file plus lazily computed analyses."""
+
+    path: str
+    text: str
+    size: int
+    blob_sha: str | None = None
+    index: SymbolIndex | None = field(default=None, repr=False)
+    _analyses: dict[str, object] = field(default_factory=dict, repr=False)
+
+    @property
+    def suffix(self) -> str:
+        return Path(self.path).suffix.lower()
+
+    def cached(self, key: str, build: Callable[[str], T]) -> T:
+        """Return the analysis stored under `key`, computing it from text once.
+
+        With a persistent index attached, results are looked up by blob SHA
+        before building and written back after, so unchanged files are only
+        analysed once across runs.
+        """
+
+        if key in self._analyses:
+            return self._analyses[key]  # type: ignore[return-value]
+
+        value = None
+        if self.index is not None and self.blob_sha is not None:
+            value = self.index.get(self.blob_sha, key)
+        if value is None:
+            value = build(self.text)
+            if self.index is not None and self.blob_sha is not None:
+                self.index.put(self.blob_sha, key, value)
+        self._analyses[key] = value
+        return value  # type: ignore[return-value]
+
+    def token_frequency(self) -> dict[str, int]:
+        return self.cached("token_frequency", count_token_frequency)
+
+    def python_symbols(self) -> SymbolSet:
+        return self.cached(
+            "python_symbols",
+            lambda text: _PYTHON_EXTRACTOR.extract(Path(self.path), text),
+        )
+
+
+class RepositoryCorpus:
+    """Read-once document store shared by every strategy of a localization run.
+
+    Each candidate is stat-ed and decoded at most once; per-file analyses such as
+    token frequencies and parsed Python symbols are memoized on the document so
+    that strategies reuse each other's work instead of re-reading the tree.
+    An optional `SymbolIndex` persists those analyses by git blob SHA, and
+    `expected_queries` tells strategies how many issues will be scored against
+    the corpus so they can decide whether building shared indexes pays off.
+    `preload` fans the per-file analysis work out to a process pool.
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        index: SymbolIndex | None = None,
+        expected_queries: int = 1,
+    ) -> None:
+        self.repo_path = repo_path
+        self.index = index
+        self.expected_queries = expected_queries
+        self.preloaded = False
+        self._sizes: dict[str, int | None] = {}
+        self._documents: dict[str, CorpusDocument | None] = {}
+        self._shared: dict[object, object] = {}
+        self._candidate_sets: dict[int, tuple[object, tuple[int, tuple[str, ...]]]] = {}
+        self._candidate_set_ids: dict[tuple[str, ...], int] = {}
+
+    def size(self, rel_path: str) -> int | None:
+        """On-disk size of `rel_path` (stat-ed once), or None when unreadable."""
+
+        if rel_path not in self._sizes:
+            try:
+                self._sizes[rel_path] = (self.repo_path / rel_path).stat().st_size
+            except OSError:
+                self._sizes[rel_path] = None
+        return self._sizes[rel_path]
+
+    def document(
+        self,
+        rel_path: str,
+        max_file_size_bytes: int,
+    ) -> CorpusDocument | None:
+        """Return the document for `rel_path`, or None when missing, empty or too big."""
+
+        size = self.size(rel_path)
+        if size is None or size > max_file_size_bytes:
+            return None
+
+        if rel_path not in self._documents:
+            try:
+                data = (self.repo_path / rel_path).read_bytes()
+            except OSError:
+                data = b""
+            text = decode_source(data)
+            self._documents[rel_path] = (
+                CorpusDocument(
+                    path=rel_path,
+                    text=text,
+                    size=size,
+                    blob_sha=git_blob_sha(data) if self.index is not None else None,
+                    index=self.index,
+                )
+                if text
+                else None
+            )
+        return self._documents[rel_path]
+
+    def shared(self, key: object, build: Callable[[], T]) -> T:
+        """Memoize a corpus-wide structure (e.g. an inverted index) under `key`."""
+
+        if key not in self._shared:
+            self._shared[key] = build()
+        return self._shared[key]  # type: ignore[return-value]
+
+    def built_shared(self, key: object) -> object | None:
+        """The structure memoized under `key` by `shared`, without building it."""
+
+        return self._shared.get(key)
+
+    def candidate_set(
+        self, candidate_paths: Iterable[str]
+    ) -> tuple[int, tuple[str, ...]]:
+        """Small id and frozen copy of `candidate_paths`, for `shared` keys.
+
+        Collections are recognised by identity, so the candidate list that a
+        localization run passes for every issue is only copied and hashed
+        once; it must not be mutated while the corpus is in use. Equal
+        collections get the same id.
+        """
+
+        entry = self._candidate_sets.get(id(candidate_paths))
+        if entry is not None and entry[0] is candidate_paths:
+            return entry[1]
+        frozen = tuple(candidate_paths)
+        set_id = self._candidate_set_ids.setdefault(
+            frozen, len(self._candidate_set_ids)
+        )
+        result = (set_id, frozen)
+        # Holding the collection keeps its id from being reused.
+        self._candidate_sets[id(candidate_paths)] = (candidate_paths, result)
+        return result
+
+    def documents(
+        self,
+        candidate_paths: Iterable[str],
+        max_file_size_bytes: int,
+    ) -> Iterator[CorpusDocument]:
+        for rel_path in candidate_paths:
+            document = self.document(rel_path, max_file_size_bytes)
+            if document is not None:
+                yield document
+
+    def preload(
+        self,
+        candidate_paths: Iterable[str],
+        preparers: list[Preparer],
+        max_file_size_bytes: int,
+        max_workers: int,
+    ) -> None:
+        """Read candidates and run `preparers` on them across worker processes.
+
+        Candidates are split into contiguous shards; each worker builds its own
+        corpus, computes the analyses the preparers request and ships documents
+        back, which are adopted here in shard order so results stay
+        deterministic regardless of scheduling.
+        """
+
+        paths = [path for path in candidate_paths if path not in self._documents]
+        self.preloaded = True
+        if max_workers <= 1 or len(paths) < 2:
+            for document in self.documents(paths, max_file_size_bytes):
+                for prepare in preparers:
+                    prepare(document)
+            return
+
+        shard_size = math.ceil(len(paths) / (max_workers * 4))
+        shards = [
+            paths[start : start + shard_size]
+            for start in range(0, len(paths), shard_size)
+        ]
+        index_path = self.index.db_path if self.index is not None else None
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            loaded_shards = pool.map(
+                _preload_shard,
+                [self.repo_path] * len(shards),
+                shards,
+                [preparers] * len(shards),
+                [max_file_size_bytes] * len(shards),
+                [index_path] * len(shards),
+                [self.expected_queries] * len(shards),
+            )
+            for sizes, loaded in loaded_shards:
+                self._adopt(sizes, loaded, max_file_size_bytes)
+
+    def _adopt(
+        self,
+        sizes: dict[str, int | None],
+        loaded: list[tuple[str, int, str, str | None, dict[str, object]]],
+        max_file_size_bytes: int,
+    ) -> None:
+        self._sizes.update(sizes)
+        for rel_path, size in sizes.items():
+            if size is not None and size <= max_file_size_bytes:
+                # Readable but empty files are not shipped back by workers.
+                self._documents.setdefault(rel_path, None)
+        for rel_path, size, text, blob_sha, analyses in loaded:
+            self._documents[rel_path] = CorpusDocument(
+                path=rel_path,
+                text=text,
+                size=size,
+                blob_sha=blob_sha,
+                index=self.index,
+                _analyses=analyses,
+            )
+
+
+def _preload_shard(
+    repo_path: Path,
+    rel_paths: list[str],
+    preparers: list[Preparer],
+    max_file_size_bytes: int,
+    index_path: Path | None,
+    expected_queries: int,
+) -> tuple[dict[str, int | None], list[tuple[str, int, str, str | None, dict]]]:
+    index = SymbolIndex(index_path) if index_path is not None else None
+    corpus = RepositoryCorpus(repo_path, index=index, expected_queries=expected_queries)
+    corpus.preloaded = True
+    loaded = []
+    try:
+        for document in corpus.documents(rel_paths, max_file_size_bytes):
+            for prepare in preparers:
+                prepare(document)
+            loaded.append(
+                (
+                    document.path,
+                    document.size,
+                    document.text,
+                    document.blob_sha,
+                    document._analyses,
+                )
+            )
+    finally:
+        if index is not None:
+            index.close()
+    return corpus._sizes, loaded
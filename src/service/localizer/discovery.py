@@ -1,12 +1,44 @@
 from __future__ import annotations
 
+import json
 import os
-from pathlib import Path
+import subprocess
+from pathlib import Path, PurePosixPath
 
 from src.service.localizer.constants import _CODE_EXTENSIONS, _EXCLUDED_DIRS
 
 
-def discover_repository_code_files(repo_path: Path) -> list[str]:
+def _is_code_file(rel_path: str) -> bool:
+    path = PurePosixPath(rel_path)
+    if path.suffix.lower() not in _CODE_EXTENSIONS:
+        return False
+    return not any(part in _EXCLUDED_DIRS for part in path.parts[:-1])
+
+
+def _run_git(repo_path: Path, args: list[str]) -> str | None:
+    """Return git's stdout, or None when git is missing or the command fails."""
+
+    try:
+        completed = subprocess.run(
+            ["git", "-C", str(repo_path), *args],
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.decode("utf-8", errors="surrogateescape")
+
+
+def _git_paths(repo_path: Path, args: list[str]) -> list[str] | None:
+    """Run a `-z` git listing command and split its NUL-separated output."""
+
+    output = _run_git(repo_path, args)
+    if output is None:
+        return None
+    return [entry for entry in output.split("\0") if entry]
+
+
+def _walk_code_files(repo_path: Path) -> list[str]:
     files: list[str] = []
     for root, dirs, filenames in os.walk(repo_path):
         dirs[:] = [d for d in dirs if d not in _EXCLUDED_DIRS]
@@ -17,3 +49,125 @@ def discover_repository_code_files(repo_path: Path) -> list[str]:
             rel = path.relative_to(repo_path).as_posix()
             files.append(rel)
     return sorted(files)
+
+
+def _git_working_tree_code_files(repo_path: Path) -> list[str] | None:
+    """Tracked plus untracked-but-not-ignored files, read from the git index."""
+
+    listed = _git_paths(
+        repo_path, ["ls-files", "-z", "--cached", "--others", "--exclude-standard"]
+    )
+    if listed is None:
+        return None
+    deleted = set(_git_paths(repo_path, ["ls-files", "-z", "--deleted"]) or [])
+    return sorted({p for p in listed if p not in deleted and _is_code_file(p)})
+
+
+class GitDiscoveryCache:
+    """Code-file listing of one commit, advanced incrementally with `git diff`.
+
+    Listing a ref whose commit differs from the cached one applies
+    `git diff --name-status` between the two commits instead of re-listing the
+    whole tree, which keeps repeated runs at different refs cheap on very
+    large repositories.
+    """
+
+    def __init__(self, cache_path: Path) -> None:
+        self.cache_path = cache_path
+
+    @staticmethod
+    def default_path(repo_path: Path) -> Path | None:
+        git_dir = _run_git(repo_path, ["rev-parse", "--absolute-git-dir"])
+        if not git_dir:
+            return None
+        return Path(git_dir.strip()) / "coding-tool-reasoning" / "discovery.json"
+
+    def _load(self, repo_path: Path) -> tuple[str, list[str]] | None:
+        try:
+            payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if payload.get("root") != str(repo_path.resolve()):
+            return None
+        return str(payload.get("commit") or ""), list(payload.get("files") or [])
+
+    def _store(self, repo_path: Path, commit: str, files: list[str]) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"root": str(repo_path.resolve()), "commit": commit, "files": files}
+        self.cache_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    def files_at(self, repo_path: Path, ref: str) -> list[str]:
+        resolved = _run_git(repo_path, ["rev-parse", "--verify", f"{ref}^{{commit}}"])
+        if not resolved:
+            raise ValueError(f"Cannot resolve git reference '{ref}' in {repo_path}.")
+        commit = resolved.strip()
+
+        cached = self._load(repo_path)
+        if cached is not None and cached[0] == commit:
+            return cached[1]
+
+        files = self._advance(repo_path, cached, commit) if cached else None
+        if files is None:
+            listed = _git_paths(
+                repo_path, ["ls-tree", "-r", "-z", "--name-only", commit]
+            )
+            if listed is None:
+                raise ValueError(f"Cannot list files of '{ref}' in {repo_path}.")
+            files = sorted(p for p in listed if _is_code_file(p))
+
+        self._store(repo_path, commit, files)
+        return files
+
+    @staticmethod
+    def _advance(
+        repo_path: Path,
+        cached: tuple[str, list[str]],
+        commit: str,
+    ) -> list[str] | None:
+        changes = _git_paths(
+            repo_path,
+            [
+                "diff",
+                "-z",
+                "--name-status",
+                "--no-renames",
+                "--relative",
+                cached[0],
+                commit,
+            ],
+        )
+        if changes is None:
+            return None
+
+        files = set(cached[1])
+        for status, rel_path in zip(changes[::2], changes[1::2]):
+            if status.startswith("D"):
+                files.discard(rel_path)
+            elif _is_code_file(rel_path):
+                files.add(rel_path)
+        return sorted(files)
+
+
+def discover_repository_code_files(
+    repo_path: Path,
+    ref: str | None = None,
+    cache_path: Path | None = None,
+) -> list[str]:
+    """List candidate code files under `repo_path`.
+
+    Git checkouts are listed from the index (`git ls-files`), which honors
+    `.gitignore` and never descends into ignored vendored trees; other
+    directories fall back to `os.walk`. With `ref`, the listing describes that
+    commit and is served from an incrementally updated `GitDiscoveryCache`.
+    """
+
+    if ref is not None:
+        cache_path = cache_path or GitDiscoveryCache.default_path(repo_path)
+        if cache_path is None:
+            raise ValueError(f"{repo_path} is not a git repository.")
+        return GitDiscoveryCache(cache_path).files_at(repo_path, ref)
+
+    files = _git_working_tree_code_files(repo_path)
+    if files is None:
+        return _walk_code_files(repo_path)
+    return files
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import posixpath
+import re
+from collections import deque
+from typing import Callable, Iterable
+
+from src.service.localizer.corpus import CorpusDocument
+
+_PACKAGE_MARKERS = {"__init__", "index", "mod"}
+
+DocumentLoader = Callable[[str], "CorpusDocument | None"]
+
+_QUOTED_IMPORT_PATTERNS = [
+    re.compile(r'#\s*include\s*[<"]([^>"]+)[>"]'),
+    re.compile(r"\bfrom\s+['\"]([^'\"]+)['\"]"),
+    re.compile(r"\brequire(?:_once)?\s*\(?\s*['\"]([^'\"]+)['\"]"),
+    re.compile(r"\bimport\s+['\"]([^'\"]+)['\"]"),
+]
+_GO_IMPORT_BLOCK = re.compile(r"\bimport\s*\(([^)]*)\)")
+_QUOTED = re.compile(r'"([^"]+)"')
+_DOTTED_IMPORT_PATTERNS = [
+    re.compile(r"^\s*import\s+(?:static\s+)?([A-Za-z_][\w.]*)", re.MULTILINE),
+    re.compile(r"^\s*using\s+(?:static\s+)?([A-Za-z_][\w.]*)\s*;", re.MULTILINE),
+    re.compile(r"^\s*(?:pub\s+)?use\s+([A-Za-z_][\w:\\]*)", re.MULTILINE),
+]
+_RUST_PREFIXES = {"crate", "self", "super"}
+
+
+def extract_generic_import_specs(source: str) -> set[str]:
+    """Heuristic import specs for non-Python sources.
+
+    Quoted specs (C includes, JS/TS modules, Go packages) are kept as paths;
+    namespace-style imports (Java, Kotlin, C#, Rust, PHP) are normalized to
+    dotted names.
+    """
+
+    specs: set[str] = set()
+    for pattern in _QUOTED_IMPORT_PATTERNS:
+        specs.update(pattern.findall(source))
+    for block in _GO_IMPORT_BLOCK.findall(source):
+        specs.update(_QUOTED.findall(block))
+    for pattern in _DOTTED_IMPORT_PATTERNS:
+        for spec in pattern.findall(source):
+            parts = [p for p in re.split(r"::|\\|\.", spec) if p]
+            while parts and parts[0] in _RUST_PREFIXES:
+                parts.pop(0)
+            if parts:
+                specs.add(".".join(parts))
+    return specs
+
+
+def _module_parts(rel_path: str) -> list[str]:
+    root, _ = posixpath.splitext(rel_path)
+    return [part for part in root.split("/") if part]
+
+
+class ImportGraph:
+    """Module-level dependency graph between candidate files.
+
+    Import specs are extracted per document (and persisted with the rest of the
+    corpus analyses) and resolved against dotted module keys derived from the
+    candidate paths: `src/pkg/mod.py` answers to `src.pkg.mod`, `pkg.mod` and
+    `mod`. Ambiguous keys prefer the files closest to the importer.
+    """
+
+    def __init__(self, candidate_paths: Iterable[str]) -> None:
+        self.paths = list(candidate_paths)
+        self._by_key: dict[str, list[str]] = {}
+        for rel_path in self.paths:
+            parts = _module_parts(rel_path)
+            keys = [parts]
+            if len(parts) > 1 and parts[-1] in _PACKAGE_MARKERS:
+                keys.append(parts[:-1])
+            for key_parts in keys:
+                for start in range(len(key_parts)):
+                    key = ".".join(key_parts[start:])
+                    self._by_key.setdefault(key, []).append(rel_path)
+        self._imports: dict[str, set[str]] = {}
+        self._dependents: dict[str, set[str]] | None = None
+
+    @staticmethod
+    def import_specs(document: CorpusDocument) -> set[str]:
+        if document.suffix == ".py":
+            return document.python_symbols().modules
+        return document.cached("import_specs", extract_generic_import_specs)
+
+    def _lookup(self, key: str, importer: str) -> list[str]:
+        matches = [p for p in self._by_key.get(key, ()) if p != importer]
+        if len(matches) <= 1:
+            return matches
+
+        def shared_prefix(path: str) -> int:
+            return len(posixpath.commonpath([posixpath.dirname(path), importer]))
+
+        best = max(shared_prefix(p) for p in matches)
+        return [p for p in matches if shared_prefix(p) == best]
+
+    def _resolve(self, spec: str, importer: str, python: bool) -> list[str]:
+        if python and spec.startswith("."):
+            level = len(spec) - len(spec.lstrip("."))
+            package = _module_parts(importer)[:-1]
+            if level > 1:
+                package = package[: -(level - 1)] if level - 1 <= len(package) else []
+            remainder = spec[level:]
+            key = ".".join(package + ([remainder] if remainder else []))
+            return self._lookup(key, importer) if key else []
+
+        if "/" in spec or spec.startswith("."):
+            if spec.startswith("."):
+                spec = posixpath.normpath(
+                    posixpath.join(posixpath.dirname(importer), spec)
+                )
+            return self._lookup(".".join(_module_parts(spec)), importer)
+
+        resolved = self._lookup(spec, importer)
+        if not resolved and not python and "." in spec:
+            # `import com.acme.Widget` names a type inside com/acme/Widget.java,
+            # while `using Acme.Widgets;` names the namespace directory.
+            resolved = self._lookup(spec.rsplit(".", 1)[0], importer)
+        return resolved
+
+    def imports_of(self, document: CorpusDocument) -> set[str]:
+        """Candidate files imported by `document`."""
+
+        if document.path not in self._imports:
+            python = document.suffix == ".py"
+            targets: set[str] = set()
+            for spec in self.import_specs(document):
+                targets.update(self._resolve(spec, document.path, python))
+            self._imports[document.path] = targets
+        return self._imports[document.path]
+
+    def add_document(self, document: CorpusDocument) -> None:
+        self.imports_of(document)
+        self._dependents = None
+
+    def dependents(self) -> dict[str, set[str]]:
+        """Reverse adjacency (`file -> files importing it`) over added documents."""
+
+        if self._dependents is None:
+            dependents: dict[str, set[str]] = {}
+            for importer, targets in self._imports.items():
+                for target in targets:
+                    dependents.setdefault(target, set()).add(importer)
+            self._dependents = dependents
+        return self._dependents
+
+    def impact_distances(self, seeds: Iterable[str], max_depth: int) -> dict[str, int]:
+        """BFS over reverse dependencies: files depending on a seed, by hop count."""
+
+        dependents = self.dependents()
+        distances = {seed: 0 for seed in seeds}
+        queue = deque(distances)
+        while queue:
+            current = queue.popleft()
+            if distances[current] >= max_depth:
+                continue
+            for dependent in dependents.get(current, ()):
+                if dependent not in distances:
+                    distances[dependent] = distances[current] + 1
+                    queue.append(dependent)
+        return distances
+
+    def distance_to(
+        self,
+        document: CorpusDocument,
+        seeds: set[str],
+        max_depth: int,
+        load: DocumentLoader,
+    ) -> int | None:
+        """Forward BFS from one file to the nearest seed it (transitively) imports.
+
+        Equivalent to `impact_distances` for that file, but only parses the
+        files on its own import paths, which suits shortlisted scoring.
+        """
+
+        if document.path in seeds:
+            return 0
+        distances = {document.path: 0}
+        queue = deque([document])
+        while queue:
+            current = queue.popleft()
+            depth = distances[current.path]
+            if depth >= max_depth:
+                continue
+            for target in sorted(self.imports_of(current)):
+                if target in distances:
+                    continue
+                if target in seeds:
+                    return depth + 1
+                distances[target] = depth + 1
+                loaded = load(target)
+                if loaded is not None:
+                    queue.append(loaded)
+        return None
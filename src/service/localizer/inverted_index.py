@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from src.service.localizer.corpus import RepositoryCorpus
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def count_words(text: str) -> dict[str, int]:
+    """Count lowercase `\\w+` runs, i.e. every span a `\\b...\\b` pattern can match."""
+
+    counts: dict[str, int] = {}
+    for word in _WORD_PATTERN.findall(text):
+        key = word.lower()
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+class InvertedIndex:
+    """Word -> posting list (document ordinal, count) over a candidate set.
+
+    Built once from a `RepositoryCorpus`, it answers whole-word symbol lookups
+    by touching only the documents that contain each word instead of scanning
+    every candidate's text per issue.
+    """
+
+    def __init__(self, paths: list[str], postings: dict[str, list[tuple[int, int]]]):
+        self.paths = paths
+        self.postings = postings
+
+    @classmethod
+    def build(
+        cls,
+        corpus: RepositoryCorpus,
+        candidate_paths: Iterable[str],
+        max_file_size_bytes: int,
+    ) -> "InvertedIndex":
+        paths: list[str] = []
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for document in corpus.documents(candidate_paths, max_file_size_bytes):
+            ordinal = len(paths)
+            paths.append(document.path)
+            for word, count in document.cached("word_counts", count_words).items():
+                postings.setdefault(word, []).append((ordinal, count))
+        return cls(paths, postings)
+
+    def match(self, symbols: Iterable[str]) -> dict[str, tuple[int, set[str]]]:
+        """Return `path -> (total hits, matched lowercase symbols)` in corpus order."""
+
+        freq: dict[int, int] = {}
+        unique: dict[int, set[str]] = {}
+        for symbol in {s.lower() for s in symbols}:
+            for ordinal, count in self.postings.get(symbol, ()):
+                freq[ordinal] = freq.get(ordinal, 0) + count
+                unique.setdefault(ordinal, set()).add(symbol)
+        return {
+            self.paths[ordinal]: (freq[ordinal], unique[ordinal])
+            for ordinal in sorted(freq)
+        }
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Protocol
+from typing import Collection, Iterable, Protocol
+
+from src.service.localizer.corpus import RepositoryCorpus
 
 
 @dataclass
@@ -26,4 +28,12 @@ class LocalizationStrategy(Protocol):
         repo_path: Path,
         issue_text: str,
         candidate_paths: Iterable[str],
-    ) -> dict[str, LocalizationHit]: ...
+        corpus: RepositoryCorpus | None = None,
+        shortlist: Collection[str] | None = None,
+    ) -> dict[str, LocalizationHit]:
+        """Score candidates; with cascade ranking, only `shortlist` needs scores.
+
+        `corpus` and `shortlist` are optional: the orchestrator only passes
+        them to strategies whose `score` accepts them.
+        """
+        ...
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import heapq
+import inspect
 from pathlib import Path
 
+from src.models.swe_config import LocalizerConfig
+from src.service.localizer.corpus import RepositoryCorpus
 from src.service.localizer.discovery import discover_repository_code_files
 from src.service.localizer.models import (
     LocalizationHit,
@@ -13,6 +17,26 @@ from src.service.localizer.strategies.filename import FilenameMatchingStrategy
 from src.service.localizer.strategies.regex_content import RegexContentMatchingStrategy
 from src.service.localizer.strategies.semantic_nlp import SemanticNlpMatchingStrategy
 from src.service.localizer.strategies.symbol_impact import SymbolImpactStrategy
+from src.service.localizer.symbol_index import SymbolIndex
+
+_MAX_REASONS = 8
+_OPTIONAL_SCORE_ARGS = frozenset({"corpus", "shortlist"})
+
+
+def _optional_score_args(strategy: LocalizationStrategy) -> frozenset[str]:
+    """Which of `corpus`/`shortlist` a strategy's `score` accepts.
+
+    Strategies written against the original three-argument protocol keep
+    working; they just score every candidate without the shared corpus.
+    """
+
+    try:
+        parameters = inspect.signature(strategy.score).parameters.values()
+    except (TypeError, ValueError):
+        return frozenset()
+    if any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters):
+        return _OPTIONAL_SCORE_ARGS
+    return _OPTIONAL_SCORE_ARGS.intersection(parameter.name for parameter in parameters)
 
 
 class RepositoryIssueLocalizer:
@@ -23,21 +47,39 @@ class RepositoryIssueLocalizer:
         strategies: list[LocalizationStrategy] | None = None,
         *,
         enable_semantic_nlp: bool = False,
+        use_inverted_index: bool | None = None,
+        symbol_index: SymbolIndex | None = None,
+        max_workers: int = 1,
+        cascade: bool = False,
     ) -> None:
-        if strategies is not None:
-            self.strategies = strategies
-            return
+        self.symbol_index = symbol_index
+        self.max_workers = max_workers
+        self.cascade = cascade
+        if strategies is None:
+            strategies = [
+                FilenameMatchingStrategy(),
+                RegexContentMatchingStrategy(use_inverted_index=use_inverted_index),
+                AstMatchingStrategy(),
+                SymbolImpactStrategy(),
+            ]
+            if enable_semantic_nlp:
+                strategies.insert(2, SemanticNlpMatchingStrategy())
 
-        assembled: list[LocalizationStrategy] = [
-            FilenameMatchingStrategy(),
-            RegexContentMatchingStrategy(),
-            AstMatchingStrategy(),
-            SymbolImpactStrategy(),
-        ]
-        if enable_semantic_nlp:
-            assembled.insert(2, SemanticNlpMatchingStrategy())
+        self.strategies = strategies
+        self._score_args = [_optional_score_args(s) for s in strategies]
 
-        self.strategies = assembled
+    @classmethod
+    def from_config(
+        cls,
+        config: LocalizerConfig,
+        symbol_index: SymbolIndex | None = None,
+    ) -> "RepositoryIssueLocalizer":
+        return cls(
+            enable_semantic_nlp=config.enable_semantic_nlp,
+            symbol_index=symbol_index,
+            max_workers=config.max_workers,
+            cascade=config.enable_cascade_ranking,
+        )
 
     def localize(
         self,
@@ -46,31 +88,135 @@ class RepositoryIssueLocalizer:
         top_k: int = 5,
         candidate_paths: list[str] | None = None,
     ) -> LocalizerResult:
+        return self.localize_many(repo_path, [issue_text], top_k, candidate_paths)[0]
+
+    def localize_many(
+        self,
+        repo_path: Path,
+        issue_texts: list[str],
+        top_k: int = 5,
+        candidate_paths: list[str] | None = None,
+    ) -> list[LocalizerResult]:
+        """Localize several issues against one repository snapshot.
+
+        Discovery runs once and every issue is scored against the same corpus,
+        so file reads, parsed symbols and corpus-wide structures (inverted
+        index, TF-IDF matrix) are built once for the whole batch. With
+        `max_workers > 1` the per-file analyses are computed in a process pool
+        before scoring.
+        """
+
         candidates = candidate_paths or discover_repository_code_files(repo_path)
         if not candidates:
-            return LocalizerResult(selected_files=[], details=[])
+            return [LocalizerResult(selected_files=[], details=[]) for _ in issue_texts]
 
+        corpus = RepositoryCorpus(
+            repo_path,
+            index=self.symbol_index,
+            expected_queries=len(issue_texts),
+        )
+        if self.max_workers > 1:
+            self._preload(corpus, candidates)
+        results = [
+            self._rank(repo_path, issue_text, candidates, corpus, top_k)
+            for issue_text in issue_texts
+        ]
+
+        if self.symbol_index is not None:
+            self.symbol_index.flush()
+        return results
+
+    def _preload(self, corpus: RepositoryCorpus, candidates: list[str]) -> None:
+        # Only strategies exposing `prepare` have per-file work worth sharding.
+        preparing = [s for s in self.strategies if hasattr(s, "prepare")]
+        if not preparing:
+            return
+        corpus.preload(
+            candidates,
+            preparers=[strategy.prepare for strategy in preparing],
+            max_file_size_bytes=max(
+                getattr(strategy, "max_file_size_bytes", 0) for strategy in preparing
+            ),
+            max_workers=self.max_workers,
+        )
+
+    def _stages(self, issue_text: str) -> list[tuple[int, float | None]]:
+        """Strategy indexes in execution order with their per-file score bounds.
+
+        Without cascade ranking strategies run in declaration order and are
+        never pruned. With it, cheap strategies (low `cost`) run first and each
+        strategy's `upper_bound` lets later stages skip hopeless files.
+        """
+
+        if not self.cascade:
+            return [(position, None) for position in range(len(self.strategies))]
+
+        stages: list[tuple[int, float | None]] = []
+        for position, strategy in enumerate(self.strategies):
+            upper_bound = getattr(strategy, "upper_bound", None)
+            stages.append((position, upper_bound(issue_text) if upper_bound else None))
+        return sorted(
+            stages,
+            key=lambda stage: getattr(self.strategies[stage[0]], "cost", 0),
+        )
+
+    def _rank(
+        self,
+        repo_path: Path,
+        issue_text: str,
+        candidates: list[str],
+        corpus: RepositoryCorpus,
+        top_k: int,
+    ) -> LocalizerResult:
+        keep = max(top_k, 10)
+        stages = self._stages(issue_text)
+        hits_by_strategy: dict[int, dict[str, LocalizationHit]] = {}
+        running: dict[str, float] = dict.fromkeys(candidates, 0.0)
+        live = candidates
+
+        for stage_number, (position, _) in enumerate(stages):
+            remaining = [bound for _, bound in stages[stage_number:]]
+            if stage_number and len(live) > keep and None not in remaining:
+                threshold = heapq.nlargest(keep, (running[p] for p in live))[-1]
+                slack = sum(remaining)  # type: ignore[arg-type]
+                live = [p for p in live if running[p] + slack >= threshold - 1e-9]
+
+            optional = {
+                "corpus": corpus,
+                "shortlist": None if len(live) == len(candidates) else live,
+            }
+            accepted = self._score_args[position]
+            strategy_hits = self.strategies[position].score(
+                repo_path,
+                issue_text,
+                candidates,
+                **{name: value for name, value in optional.items() if name in accepted},
+            )
+            hits_by_strategy[position] = strategy_hits
+            for rel_path, hit in strategy_hits.items():
+                running[rel_path] = running.get(rel_path, 0.0) + hit.score
+
+        # Sum in declaration order so scores do not depend on execution order.
         aggregate: dict[str, LocalizationHit] = {
             path: LocalizationHit(path=path, score=0.0, reasons=[])
             for path in candidates
         }
-
-        for strategy in self.strategies:
-            strategy_hits = strategy.score(repo_path, issue_text, candidates)
-            for rel_path, hit in strategy_hits.items():
+        for position, strategy in enumerate(self.strategies):
+            for rel_path, hit in hits_by_strategy[position].items():
                 current = aggregate.setdefault(
                     rel_path,
                     LocalizationHit(path=rel_path, score=0.0),
                 )
                 current.score += hit.score
-                current.reasons.extend(
-                    f"[{strategy.name}] {reason}" for reason in hit.reasons
-                )
+                if len(current.reasons) < _MAX_REASONS:
+                    current.reasons.extend(
+                        f"[{strategy.name}] {reason}" for reason in hit.reasons
+                    )
 
-        ranked = sorted(
+        ranked = heapq.nlargest(
+            keep,
             aggregate.values(),
             key=lambda item: (item.score, -len(item.path)),
-            reverse=True,
         )
 
         selected = [item.path for item in ranked if item.score > 0][: max(1, top_k)]
@@ -81,8 +227,8 @@ class RepositoryIssueLocalizer:
             {
                 "path": item.path,
                 "score": round(item.score, 4),
-                "reasons": item.reasons[:8],
+                "reasons": item.reasons[:_MAX_REASONS],
             }
-            for item in ranked[: max(top_k, 10)]
+            for item in ranked
         ]
         return LocalizerResult(selected_files=selected, details=details)
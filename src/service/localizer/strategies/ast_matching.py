@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Collection, Iterable
 
-from src.service.localizer.ast.extractors import (
-    PythonSymbolExtractor,
-    RegexSymbolExtractor,
-)
+from src.service.localizer.ast.extractors import RegexSymbolExtractor
+from src.service.localizer.corpus import CorpusDocument, RepositoryCorpus
 from src.service.localizer.models import LocalizationHit
-from src.service.localizer.utils import extract_symbols, safe_read_text
+from src.service.localizer.utils import extract_symbols
 
 _PYTHON_EXTENSIONS = {".py", ".pyi", ".pyw"}
 
@@ -21,37 +19,49 @@ class AstMatchingStrategy:
     """
 
     name = "ast"
+    cost = 3
 
     def __init__(self, max_file_size_bytes: int = 500_000) -> None:
         self.max_file_size_bytes = max_file_size_bytes
-        self._python_extractor = PythonSymbolExtractor()
         self._generic_extractor = RegexSymbolExtractor()
 
-    def _extract_definitions(self, rel_path: str, source: str) -> set[str]:
-        path = Path(rel_path)
-        if path.suffix.lower() in _PYTHON_EXTENSIONS:
-            return self._python_extractor.extract(path, source).definitions
-        return self._generic_extractor.extract(path, source).definitions
+    def _extract_definitions(self, document: CorpusDocument) -> set[str]:
+        if document.suffix in _PYTHON_EXTENSIONS:
+            return document.python_symbols().definitions
+        return document.cached(
+            "regex_definitions",
+            lambda source: (
+                self._generic_extractor.extract(Path(document.path), source).definitions
+            ),
+        )
+
+    def upper_bound(self, issue_text: str) -> float:
+        symbols = {s.lower() for s in extract_symbols(issue_text)}
+        return 10.0 + 4.0 * len(symbols) if symbols else 0.0
+
+    def prepare(self, document: CorpusDocument) -> None:
+        if document.size <= self.max_file_size_bytes:
+            self._extract_definitions(document)
 
     def score(
         self,
         repo_path: Path,
         issue_text: str,
         candidate_paths: Iterable[str],
+        corpus: RepositoryCorpus | None = None,
+        shortlist: Collection[str] | None = None,
     ) -> dict[str, LocalizationHit]:
         symbols = {s.lower() for s in extract_symbols(issue_text)}
         if not symbols:
             return {}
 
+        corpus = corpus or RepositoryCorpus(repo_path)
         results: dict[str, LocalizationHit] = {}
 
-        for rel_path in candidate_paths:
-            abs_path = repo_path / rel_path
-            source = safe_read_text(abs_path, self.max_file_size_bytes)
-            if not source:
-                continue
-
-            names = self._extract_definitions(rel_path, source)
+        scored = candidate_paths if shortlist is None else shortlist
+        for document in corpus.documents(scored, self.max_file_size_bytes):
+            rel_path = document.path
+            names = self._extract_definitions(document)
             if not names:
                 continue
 
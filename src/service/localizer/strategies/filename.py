@@ -1,25 +1,32 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Collection, Iterable
 
+from src.service.localizer.corpus import RepositoryCorpus
 from src.service.localizer.models import LocalizationHit
 from src.service.localizer.utils import extract_tokens
 
 
 class FilenameMatchingStrategy:
     name = "filename"
+    cost = 0
+
+    def upper_bound(self, issue_text: str) -> float:
+        return 8.0 * len(extract_tokens(issue_text))
 
     def score(
         self,
         repo_path: Path,
         issue_text: str,
         candidate_paths: Iterable[str],
+        corpus: RepositoryCorpus | None = None,
+        shortlist: Collection[str] | None = None,
     ) -> dict[str, LocalizationHit]:
         tokens = extract_tokens(issue_text)
         results: dict[str, LocalizationHit] = {}
 
-        for rel_path in candidate_paths:
+        for rel_path in candidate_paths if shortlist is None else shortlist:
             rel_lower = rel_path.lower()
             stem = Path(rel_path).stem.lower()
             score = 0.0
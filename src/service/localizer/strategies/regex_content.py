@@ -2,52 +2,155 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Iterable
+from typing import Collection, Iterable
 
+from src.service.localizer.corpus import CorpusDocument, RepositoryCorpus
+from src.service.localizer.inverted_index import InvertedIndex, count_words
 from src.service.localizer.models import LocalizationHit
-from src.service.localizer.utils import extract_symbols, safe_read_text
+from src.service.localizer.utils import extract_symbols, mmap_findall
 
 
 class RegexContentMatchingStrategy:
+    """Whole-word symbol matching over file contents.
+
+    With `use_inverted_index=True` matches are answered from an inverted index
+    shared through the corpus, which yields the same scores as the regex scan
+    but only touches files that contain the issue's symbols. The default
+    (`None`) builds the index only when the corpus serves a batch of issues or
+    was preloaded by parallel workers, which already paid for word counting.
+
+    Files above `max_file_size_bytes` are not decoded at all: their first
+    `large_file_scan_bytes` (defaulting to the size limit, 0 disables it) are
+    searched as raw bytes through a memory map.
+    """
+
     name = "regex"
+    cost = 1
 
-    def __init__(self, max_file_size_bytes: int = 350_000) -> None:
+    def __init__(
+        self,
+        max_file_size_bytes: int = 350_000,
+        use_inverted_index: bool | None = None,
+        large_file_scan_bytes: int | None = None,
+    ) -> None:
         self.max_file_size_bytes = max_file_size_bytes
+        self.use_inverted_index = use_inverted_index
+        self.large_file_scan_bytes = (
+            max_file_size_bytes
+            if large_file_scan_bytes is None
+            else large_file_scan_bytes
+        )
 
-    def score(
+    def upper_bound(self, issue_text: str) -> float:
+        return 20.0 if extract_symbols(issue_text) else 0.0
+
+    def _use_index(self, corpus: RepositoryCorpus) -> bool:
+        if self.use_inverted_index is not None:
+            return self.use_inverted_index
+        return corpus.expected_queries > 1 or corpus.preloaded
+
+    def prepare(self, document: CorpusDocument) -> None:
+        if self.use_inverted_index is False:
+            return
+        if document.size <= self.max_file_size_bytes:
+            document.cached("word_counts", count_words)
+
+    def _scan(
         self,
-        repo_path: Path,
-        issue_text: str,
+        corpus: RepositoryCorpus,
+        symbols: list[str],
         candidate_paths: Iterable[str],
-    ) -> dict[str, LocalizationHit]:
-        symbols = extract_symbols(issue_text)
-        if not symbols:
+    ) -> dict[str, tuple[int, set[str]]]:
+        # Match word boundaries for extracted symbols.
+        pattern = re.compile(
+            r"\b(" + "|".join(re.escape(s) for s in symbols) + r")\b",
+            re.IGNORECASE,
+        )
+        matched: dict[str, tuple[int, set[str]]] = {}
+        for document in corpus.documents(candidate_paths, self.max_file_size_bytes):
+            matches = pattern.findall(document.text)
+            if matches:
+                matched[document.path] = (len(matches), {m.lower() for m in matches})
+        return matched
+
+    def _scan_large_files(
+        self,
+        corpus: RepositoryCorpus,
+        symbols: list[str],
+        candidate_paths: Iterable[str],
+    ) -> dict[str, tuple[int, set[str]]]:
+        oversized = [
+            rel_path
+            for rel_path in candidate_paths
+            if (corpus.size(rel_path) or 0) > self.max_file_size_bytes
+        ]
+        if not oversized or self.large_file_scan_bytes <= 0:
             return {}
 
-        # Match word boundaries for extracted symbols.
+        # Symbols are ASCII identifiers, so they can be matched without decoding.
         pattern = re.compile(
-            r"\b(" + "|".join(re.escape(s) for s in symbols[:20]) + r")\b",
+            rb"\b("
+            + b"|".join(re.escape(s.encode("ascii")) for s in symbols)
+            + rb")\b",
             re.IGNORECASE,
         )
-        results: dict[str, LocalizationHit] = {}
+        matched: dict[str, tuple[int, set[str]]] = {}
+        for rel_path in oversized:
+            matches = mmap_findall(
+                corpus.repo_path / rel_path, pattern, self.large_file_scan_bytes
+            )
+            if matches:
+                matched[rel_path] = (
+                    len(matches),
+                    {m.decode("ascii").lower() for m in matches},
+                )
+        return matched
 
-        for rel_path in candidate_paths:
-            abs_path = repo_path / rel_path
-            text = safe_read_text(abs_path, self.max_file_size_bytes)
-            if not text:
-                continue
+    def _index(
+        self,
+        corpus: RepositoryCorpus,
+        candidate_set_id: int,
+        candidates: tuple[str, ...],
+    ) -> InvertedIndex:
+        return corpus.shared(
+            ("inverted_index", self.max_file_size_bytes, candidate_set_id),
+            lambda: InvertedIndex.build(corpus, candidates, self.max_file_size_bytes),
+        )
 
-            matches = pattern.findall(text)
-            if not matches:
-                continue
+    def score(
+        self,
+        repo_path: Path,
+        issue_text: str,
+        candidate_paths: Iterable[str],
+        corpus: RepositoryCorpus | None = None,
+        shortlist: Collection[str] | None = None,
+    ) -> dict[str, LocalizationHit]:
+        symbols = extract_symbols(issue_text)[:20]
+        if not symbols:
+            return {}
 
-            freq = len(matches)
-            unique = sorted({m.lower() for m in matches})
+        corpus = corpus or RepositoryCorpus(repo_path)
+        candidate_set_id, candidates = corpus.candidate_set(candidate_paths)
+        scanned = candidates if shortlist is None else shortlist
+        if self._use_index(corpus):
+            matched = self._index(corpus, candidate_set_id, candidates).match(symbols)
+            if shortlist is not None:
+                allowed = set(shortlist)
+                matched = {p: m for p, m in matched.items() if p in allowed}
+        else:
+            matched = self._scan(corpus, symbols, scanned)
+        large_matched = self._scan_large_files(corpus, symbols, scanned)
+
+        results: dict[str, LocalizationHit] = {}
+        for rel_path, (freq, unique) in [*matched.items(), *large_matched.items()]:
             score = min(20.0, 1.5 * freq + len(unique))
+            reason = f"regex content matched {len(unique)} symbols ({freq} hits)"
+            if rel_path in large_matched:
+                reason += f" in the first {self.large_file_scan_bytes} bytes"
             results[rel_path] = LocalizationHit(
                 path=rel_path,
                 score=score,
-                reasons=[f"regex content matched {len(unique)} symbols ({freq} hits)"],
+                reasons=[reason],
             )
 
         return results
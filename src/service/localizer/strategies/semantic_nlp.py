@@ -1,89 +1,67 @@
 from __future__ import annotations
 
-import math
 from pathlib import Path
-from typing import Iterable
+from typing import Collection, Iterable
 
+from src.service.localizer.corpus import CorpusDocument, RepositoryCorpus
 from src.service.localizer.models import LocalizationHit
-from src.service.localizer.utils import count_token_frequency, safe_read_text
+from src.service.localizer.tfidf import TfidfMatrix
+from src.service.localizer.utils import count_token_frequency
 
 
 class SemanticNlpMatchingStrategy:
     """Local NLP strategy using TF-IDF cosine similarity for semantic reranking."""
 
     name = "semantic_nlp"
+    cost = 2
 
     def __init__(self, max_file_size_bytes: int = 350_000) -> None:
         self.max_file_size_bytes = max_file_size_bytes
 
-    @staticmethod
-    def _idf(num_docs: int, doc_freq: int) -> float:
-        return math.log((1 + num_docs) / (1 + doc_freq)) + 1.0
+    def upper_bound(self, issue_text: str) -> float:
+        return 25.0 if count_token_frequency(issue_text) else 0.0
 
-    @staticmethod
-    def _cosine(left: dict[str, float], right: dict[str, float]) -> float:
-        if not left or not right:
-            return 0.0
+    def prepare(self, document: CorpusDocument) -> None:
+        if document.size <= self.max_file_size_bytes:
+            document.token_frequency()
 
-        dot = 0.0
-        for token, value in left.items():
-            dot += value * right.get(token, 0.0)
-
-        left_norm = math.sqrt(sum(value * value for value in left.values()))
-        right_norm = math.sqrt(sum(value * value for value in right.values()))
-        if left_norm == 0.0 or right_norm == 0.0:
-            return 0.0
-        return dot / (left_norm * right_norm)
+    def _matrix(
+        self,
+        corpus: RepositoryCorpus,
+        candidate_paths: Iterable[str],
+    ) -> TfidfMatrix:
+        candidate_set_id, candidates = corpus.candidate_set(candidate_paths)
+        return corpus.shared(
+            ("tfidf", self.max_file_size_bytes, candidate_set_id),
+            lambda: TfidfMatrix.build(corpus, candidates, self.max_file_size_bytes),
+        )
 
     def score(
         self,
         repo_path: Path,
         issue_text: str,
         candidate_paths: Iterable[str],
+        corpus: RepositoryCorpus | None = None,
+        shortlist: Collection[str] | None = None,
     ) -> dict[str, LocalizationHit]:
         issue_tf = count_token_frequency(issue_text)
         if not issue_tf:
             return {}
 
-        docs_tf: dict[str, dict[str, int]] = {}
-        doc_freq: dict[str, int] = {}
-
-        for rel_path in candidate_paths:
-            text = safe_read_text(repo_path / rel_path, self.max_file_size_bytes)
-            if not text:
-                continue
-
-            tf = count_token_frequency(text)
-            if not tf:
-                continue
-
-            docs_tf[rel_path] = tf
-            for token in tf.keys():
-                doc_freq[token] = doc_freq.get(token, 0) + 1
-
-        if not docs_tf:
+        corpus = corpus or RepositoryCorpus(repo_path)
+        matrix = self._matrix(corpus, candidate_paths)
+        if not matrix.paths:
             return {}
 
-        num_docs = len(docs_tf)
-
-        issue_vector: dict[str, float] = {}
-        for token, freq in issue_tf.items():
-            issue_vector[token] = float(freq) * self._idf(
-                num_docs, doc_freq.get(token, 0)
-            )
-
+        cosines = matrix.cosine(issue_tf)
+        # IDF stays global to all candidates; a shortlist only limits reporting.
+        allowed = None if shortlist is None else set(shortlist)
         results: dict[str, LocalizationHit] = {}
-        for rel_path, tf in docs_tf.items():
-            doc_vector: dict[str, float] = {}
-            for token, freq in tf.items():
-                doc_vector[token] = float(freq) * self._idf(
-                    num_docs, doc_freq.get(token, 0)
-                )
-
-            cosine = self._cosine(issue_vector, doc_vector)
-            if cosine <= 0.0:
+        for row in (cosines > 0.0).nonzero()[0]:
+            cosine = float(cosines[row])
+            rel_path = matrix.paths[row]
+            if allowed is not None and rel_path not in allowed:
                 continue
-
             score = min(25.0, cosine * 40.0)
             results[rel_path] = LocalizationHit(
                 path=rel_path,
@@ -1,50 +1,35 @@
 from __future__ import annotations
 
-import ast
 import re
 from pathlib import Path
-from typing import Iterable
+from typing import Collection, Iterable
 
+from src.service.localizer.corpus import CorpusDocument, RepositoryCorpus
+from src.service.localizer.import_graph import ImportGraph
+from src.service.localizer.inverted_index import InvertedIndex
 from src.service.localizer.models import LocalizationHit
-from src.service.localizer.utils import extract_symbols, safe_read_text
+from src.service.localizer.utils import extract_symbols
 
 
 class SymbolImpactStrategy:
-    """Estimate refactor impact using symbol definitions/references across files."""
+    """Estimate refactor impact using symbol definitions/references across files.
+
+    Seeds are the files defining the issue's symbols (or referencing them when
+    nothing defines them). Impact follows the resolved import graph: files
+    reaching a seed within `max_impact_depth` imports score by the seed
+    definitions they use, decayed by distance.
+    """
 
     name = "symbol_impact"
+    cost = 4
 
-    def __init__(self, max_file_size_bytes: int = 350_000) -> None:
+    def __init__(
+        self,
+        max_file_size_bytes: int = 350_000,
+        max_impact_depth: int = 2,
+    ) -> None:
         self.max_file_size_bytes = max_file_size_bytes
-
-    @staticmethod
-    def _collect_python_symbols(source: str) -> tuple[set[str], set[str], set[str]]:
-        definitions: set[str] = set()
-        references: set[str] = set()
-        imports: set[str] = set()
-
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            return definitions, references, imports
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                definitions.add(node.name.lower())
-            elif isinstance(node, ast.Name):
-                references.add(node.id.lower())
-            elif isinstance(node, ast.Attribute):
-                references.add(node.attr.lower())
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.add(alias.name.split(".")[-1].lower())
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.add(node.module.split(".")[-1].lower())
-                for alias in node.names:
-                    imports.add(alias.name.split(".")[-1].lower())
-
-        return definitions, references, imports
+        self.max_impact_depth = max_impact_depth
 
     @staticmethod
     def _collect_generic_symbols(source: str) -> tuple[set[str], set[str], set[str]]:
@@ -68,31 +53,97 @@ class SymbolImpactStrategy:
         }
         return definitions, references, imports
 
+    def _collect_symbols(
+        self, document: CorpusDocument
+    ) -> tuple[set[str], set[str], set[str]]:
+        if document.suffix == ".py":
+            symbols = document.python_symbols()
+            return symbols.definitions, symbols.references, symbols.imports
+        return document.cached("impact_symbols", self._collect_generic_symbols)
+
+    def upper_bound(self, issue_text: str) -> float:
+        count = len({s.lower() for s in extract_symbols(issue_text)})
+        return (8.0 + 2.0 * count) + (6.0 + 2.0 * count) + 10.0 + 5.0 if count else 0.0
+
+    def _analysed_paths(
+        self,
+        corpus: RepositoryCorpus,
+        candidate_set_id: int,
+        candidates: tuple[str, ...],
+        target_symbols: set[str],
+        shortlist: Collection[str],
+    ) -> list[str]:
+        """Shortlisted files plus every file that could seed impact.
+
+        Definitions and references are identifiers, so a file that never
+        mentions a target symbol as a whole word cannot be a seed. The regex
+        strategy's word index answers that when it was already built;
+        otherwise a whole-word search over the (corpus-cached) texts does,
+        without word-counting or parsing files that cannot be seeds.
+        """
+
+        index = corpus.built_shared(
+            ("inverted_index", self.max_file_size_bytes, candidate_set_id)
+        )
+        if isinstance(index, InvertedIndex):
+            wanted = set(index.match(target_symbols)).union(shortlist)
+            return [path for path in candidates if path in wanted]
+
+        pattern = re.compile(
+            r"\b(?:" + "|".join(re.escape(s) for s in sorted(target_symbols)) + r")\b",
+            re.IGNORECASE,
+        )
+        allowed = set(shortlist)
+        return [
+            document.path
+            for document in corpus.documents(candidates, self.max_file_size_bytes)
+            if document.path in allowed or pattern.search(document.text)
+        ]
+
+    def prepare(self, document: CorpusDocument) -> None:
+        if document.size <= self.max_file_size_bytes:
+            self._collect_symbols(document)
+            ImportGraph.import_specs(document)
+
+    @staticmethod
+    def _graph(
+        corpus: RepositoryCorpus,
+        candidate_set_id: int,
+        candidates: tuple[str, ...],
+    ) -> ImportGraph:
+        return corpus.shared(
+            ("import_graph", candidate_set_id), lambda: ImportGraph(candidates)
+        )
+
     def score(
         self,
         repo_path: Path,
         issue_text: str,
         candidate_paths: Iterable[str],
+        corpus: RepositoryCorpus | None = None,
+        shortlist: Collection[str] | None = None,
     ) -> dict[str, LocalizationHit]:
         target_symbols = {s.lower() for s in extract_symbols(issue_text)}
         if not target_symbols:
             return {}
 
+        corpus = corpus or RepositoryCorpus(repo_path)
+        candidate_set_id, candidates = corpus.candidate_set(candidate_paths)
+        analysed: Iterable[str] = candidates
+        if shortlist is not None:
+            analysed = self._analysed_paths(
+                corpus, candidate_set_id, candidates, target_symbols, shortlist
+            )
+        graph = self._graph(corpus, candidate_set_id, candidates)
+        documents: dict[str, CorpusDocument] = {}
         defs_by_file: dict[str, set[str]] = {}
         refs_by_file: dict[str, set[str]] = {}
         imports_by_file: dict[str, set[str]] = {}
 
-        for rel_path in candidate_paths:
-            abs_path = repo_path / rel_path
-            source = safe_read_text(abs_path, self.max_file_size_bytes)
-            if not source:
-                continue
-
-            if Path(rel_path).suffix.lower() == ".py":
-                defs, refs, imports = self._collect_python_symbols(source)
-            else:
-                defs, refs, imports = self._collect_generic_symbols(source)
-
+        for document in corpus.documents(analysed, self.max_file_size_bytes):
+            rel_path = document.path
+            defs, refs, imports = self._collect_symbols(document)
+            documents[rel_path] = document
             defs_by_file[rel_path] = defs
             refs_by_file[rel_path] = refs
             imports_by_file[rel_path] = imports
@@ -105,29 +156,49 @@ class SymbolImpactStrategy:
             for rel_path, defs in defs_by_file.items()
             if defs.intersection(target_symbols)
         }
-        seed_files.update(
-            {
+        if not seed_files:
+            seed_files = {
                 rel_path
                 for rel_path, refs in refs_by_file.items()
                 if refs.intersection(target_symbols)
             }
-        )
 
         seed_definitions: set[str] = set()
         for rel_path in seed_files:
-            seed_definitions.update(defs_by_file.get(rel_path, set()))
+            seed_definitions.update(defs_by_file[rel_path])
+
+        scored = defs_by_file.keys()
+        if shortlist is None:
+            for document in documents.values():
+                graph.add_document(document)
+            distances = graph.impact_distances(seed_files, self.max_impact_depth)
+        else:
+            allowed = set(shortlist)
+            scored = [path for path in defs_by_file if path in allowed]
+
+            def load(rel_path: str) -> CorpusDocument | None:
+                return corpus.document(rel_path, self.max_file_size_bytes)
+
+            distances = {}
+            for rel_path in scored:
+                distance = graph.distance_to(
+                    documents[rel_path], seed_files, self.max_impact_depth, load
+                )
+                if distance is not None:
+                    distances[rel_path] = distance
 
         results: dict[str, LocalizationHit] = {}
-        for rel_path in defs_by_file.keys():
+        for rel_path in scored:
             definition_overlap = defs_by_file.get(rel_path, set()).intersection(
                 target_symbols
             )
             direct_overlap = refs_by_file.get(rel_path, set()).intersection(
                 target_symbols
             )
-            impact_overlap = refs_by_file.get(rel_path, set()).intersection(
-                seed_definitions
-            )
+            distance = distances.get(rel_path, 0)
+            impact_overlap: set[str] = set()
+            if distance:
+                impact_overlap = refs_by_file[rel_path].intersection(seed_definitions)
             import_overlap = imports_by_file.get(rel_path, set()).intersection(
                 target_symbols
             )
@@ -148,11 +219,17 @@ class SymbolImpactStrategy:
                     "direct symbol refs: " + ", ".join(sorted(direct_overlap)[:8])
                 )
 
-            if impact_overlap:
-                score += min(10.0, 1.5 * len(impact_overlap))
-                reasons.append(
-                    "depends on seed defs: " + ", ".join(sorted(impact_overlap)[:8])
-                )
+            if distance:
+                impact = min(10.0, 2.0 + 1.5 * len(impact_overlap)) / distance
+                score += impact
+                if impact_overlap:
+                    reasons.append(
+                        "depends on seed defs: "
+                        + ", ".join(sorted(impact_overlap)[:8])
+                        + f" (import distance {distance})"
+                    )
+                else:
+                    reasons.append(f"imports a seed module (distance {distance})")
 
             if import_overlap:
                 score += min(5.0, float(len(import_overlap)))
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+
+# Bump whenever the shape of a persisted analysis changes so stale rows are dropped.
+_SCHEMA_VERSION = "2"
+
+
+def default_symbol_index_path() -> Path:
+    cache_root = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_root) / "coding-tool-reasoning" / "localizer_index.sqlite"
+
+
+class SymbolIndex:
+    """Persistent per-blob store of localizer analyses.
+
+    Rows are keyed by the git blob SHA of a file plus an analysis name
+    (for example `python_symbols` or `token_frequency`). Because the key is the
+    content hash, unchanged files are never re-extracted across runs, refs or
+    even checkouts of different repositories sharing the same index file.
+    """
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        self.db_path = db_path or default_symbol_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.db_path), timeout=30.0)
+        # WAL lets parallel localizer workers read while another one commits.
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._pending = 0
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        cursor = self._connection.cursor()
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        row = cursor.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        if row is None or row[0] != _SCHEMA_VERSION:
+            cursor.execute("DROP TABLE IF EXISTS analyses")
+            cursor.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (_SCHEMA_VERSION,),
+            )
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS analyses ("
+            "blob_sha TEXT NOT NULL, "
+            "analysis TEXT NOT NULL, "
+            "payload BLOB NOT NULL, "
+            "PRIMARY KEY (blob_sha, analysis))"
+        )
+        self._connection.commit()
+
+    def get(self, blob_sha: str, analysis: str) -> object | None:
+        row = self._connection.execute(
+            "SELECT payload FROM analyses WHERE blob_sha = ? AND analysis = ?",
+            (blob_sha, analysis),
+        ).fetchone()
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+
+    def put(self, blob_sha: str, analysis: str, value: object) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO analyses (blob_sha, analysis, payload) "
+            "VALUES (?, ?, ?)",
+            (blob_sha, analysis, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)),
+        )
+        self._pending += 1
+
+    def flush(self) -> None:
+        if self._pending:
+            self._connection.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+import numpy as np
+
+from src.service.localizer.corpus import RepositoryCorpus
+
+
+def smoothed_idf(num_docs: int, doc_freq: np.ndarray | int) -> np.ndarray | float:
+    return np.log((1 + num_docs) / (1 + np.asarray(doc_freq, dtype=np.float64))) + 1.0
+
+
+class TfidfMatrix:
+    """Row-normalized TF-IDF weights for a candidate set in CSR layout.
+
+    `indptr`/`indices`/`data` follow the usual compressed-sparse-row convention:
+    row `r` owns `data[indptr[r]:indptr[r + 1]]` at vocabulary columns
+    `indices[indptr[r]:indptr[r + 1]]`. Rows are L2-normalized once at build
+    time so scoring a query is a single sparse mat-vec.
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        vocabulary: dict[str, int],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        data: np.ndarray,
+        doc_freq: np.ndarray,
+    ) -> None:
+        self.paths = paths
+        self.vocabulary = vocabulary
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.doc_freq = doc_freq
+        self.idf = smoothed_idf(len(paths), doc_freq)
+        self._rows = np.repeat(np.arange(len(paths)), np.diff(indptr))
+
+        weights = data * self.idf[indices]
+        norms = np.sqrt(np.bincount(self._rows, weights * weights, len(paths)))
+        self.normalized = weights / norms[self._rows]
+
+    @classmethod
+    def build(
+        cls,
+        corpus: RepositoryCorpus,
+        candidate_paths: Iterable[str],
+        max_file_size_bytes: int,
+    ) -> "TfidfMatrix":
+        paths: list[str] = []
+        vocabulary: dict[str, int] = {}
+        indptr = [0]
+        indices: list[int] = []
+        data: list[float] = []
+
+        for document in corpus.documents(candidate_paths, max_file_size_bytes):
+            tf = document.token_frequency()
+            if not tf:
+                continue
+            paths.append(document.path)
+            for token, freq in tf.items():
+                indices.append(vocabulary.setdefault(token, len(vocabulary)))
+                data.append(float(freq))
+            indptr.append(len(indices))
+
+        indices_array = np.asarray(indices, dtype=np.int64)
+        return cls(
+            paths=paths,
+            vocabulary=vocabulary,
+            indptr=np.asarray(indptr, dtype=np.int64),
+            indices=indices_array,
+            data=np.asarray(data, dtype=np.float64),
+            doc_freq=np.bincount(indices_array, minlength=len(vocabulary)),
+        )
+
+    def cosine(self, query_tf: dict[str, int]) -> np.ndarray:
+        """Cosine similarity of every row against a raw query term-frequency map."""
+
+        num_docs = len(self.paths)
+        query = np.zeros(len(self.vocabulary), dtype=np.float64)
+        query_norm_sq = 0.0
+        for token, freq in query_tf.items():
+            column = self.vocabulary.get(token)
+            if column is None:
+                # Unseen tokens still count towards the query norm (df = 0).
+                weight = float(freq) * float(smoothed_idf(num_docs, 0))
+            else:
+                weight = float(freq) * float(self.idf[column])
+                query[column] = weight
+            query_norm_sq += weight * weight
+
+        if num_docs == 0 or query_norm_sq == 0.0:
+            return np.zeros(num_docs, dtype=np.float64)
+
+        products = self.normalized * query[self.indices]
+        dots = np.bincount(self._rows, products, num_docs)
+        return dots / math.sqrt(query_norm_sq)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import mmap
+import os
 import re
 from pathlib import Path
 
@@ -24,13 +27,36 @@ def extract_symbols(text: str) -> list[str]:
     return cleaned
 
 
-def safe_read_text(path: Path, max_file_size_bytes: int) -> str:
+def _is_identifier_byte(byte: int) -> bool:
+    # Non-ASCII bytes may belong to a UTF-8 encoded letter, so never split them.
+    return byte >= 0x80 or chr(byte).isalnum() or byte == 0x5F
+
+
+def mmap_findall(
+    path: Path,
+    pattern: re.Pattern[bytes],
+    max_scan_bytes: int,
+) -> list[bytes]:
+    """Run `pattern.findall` over the first `max_scan_bytes` of a file, undecoded.
+
+    The file is memory-mapped, so only the pages the regex engine visits are
+    read and nothing is copied or decoded. A truncated window ends before the
+    identifier it would otherwise cut in half.
+    """
+
     try:
-        if not path.exists() or path.stat().st_size > max_file_size_bytes:
-            return ""
-        return path.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return ""
+        with path.open("rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size == 0 or max_scan_bytes <= 0:
+                return []
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                end = min(size, max_scan_bytes)
+                if end < size:
+                    while end > 0 and _is_identifier_byte(mapped[end]):
+                        end -= 1
+                return pattern.findall(mapped, 0, end)
+    except (OSError, ValueError):
+        return []
 
 
 def count_token_frequency(text: str) -> dict[str, int]:
@@ -38,3 +64,17 @@ def count_token_frequency(text: str) -> dict[str, int]:
     for token in extract_tokens(text):
         counts[token] = counts.get(token, 0) + 1
     return counts
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Return the SHA-1 git assigns to a blob with these bytes (`git hash-object`)."""
+
+    header = f"blob {len(data)}\0".encode("ascii")
+    return hashlib.sha1(header + data).hexdigest()
+
+
+def decode_source(data: bytes) -> str:
+    """Decode file bytes the way `Path.read_text(errors="ignore")` would."""
+
+    text = data.decode("utf-8", errors="ignore")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
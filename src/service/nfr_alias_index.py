@@ -0,0 +1,108 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+from src.models.swe_node import SweNode
+
+
+class AhoCorasickMatcher:
+    """Finds which of a fixed set of patterns occur in a text in one pass.
+
+    Classic Aho-Corasick automaton: a trie over the patterns plus failure links,
+    so scanning costs O(len(text) + matches) regardless of how many patterns
+    there are.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Set[str]] = [set()]
+        for pattern in patterns:
+            if pattern:
+                self._insert(pattern)
+        self._link()
+
+    def _insert(self, pattern: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(set())
+            state = next_state
+        self._outputs[state].add(pattern)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._outputs[next_state] |= self._outputs[self._fail[next_state]]
+                queue.append(next_state)
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return every pattern that occurs in ``text`` as a substring."""
+
+        found: Set[str] = set()
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._outputs[state]:
+                found |= self._outputs[state]
+        return found
+
+
+class NfrAliasIndex:
+    """Lowercased id/name/category lookups over the NFR nodes of a knowledge base.
+
+    Results are reported in node order, matching a linear scan of the nodes.
+    """
+
+    def __init__(self, nodes: Iterable[SweNode]) -> None:
+        self._nfr_nodes = [node for node in nodes if node.type.upper() == "NFR"]
+        self._positions_by_alias: Dict[str, List[int]] = {}
+        self._mentions_by_pattern: Dict[str, List[Tuple[int, bool]]] = {}
+        for position, node in enumerate(self._nfr_nodes):
+            name = (node.name or "").lower()
+            category = (node.nfr_category or "").lower()
+            for alias in {node.id.lower(), name, category}:
+                self._positions_by_alias.setdefault(alias, []).append(position)
+            if name:
+                self._mentions_by_pattern.setdefault(name, []).append((position, True))
+            if category:
+                self._mentions_by_pattern.setdefault(category, []).append(
+                    (position, False)
+                )
+        self._matcher = AhoCorasickMatcher(self._mentions_by_pattern)
+
+    def resolve(self, names_or_ids: Iterable[str]) -> List[str]:
+        """Ids of NFR nodes whose id, name or category equals any requested value."""
+
+        positions: Set[int] = set()
+        for value in {v.lower() for v in names_or_ids}:
+            positions.update(self._positions_by_alias.get(value, ()))
+        return [self._nfr_nodes[position].id for position in sorted(positions)]
+
+    def mentions(self, text: str) -> List[str]:
+        """Name (or, failing that, category) of each NFR mentioned in ``text``."""
+
+        found = self._matcher.find_all(text.lower())
+        name_hits: Set[int] = set()
+        category_hits: Set[int] = set()
+        for pattern in found:
+            for position, is_name in self._mentions_by_pattern[pattern]:
+                (name_hits if is_name else category_hits).add(position)
+
+        labels: List[str] = []
+        for position in sorted(name_hits | category_hits):
+            node = self._nfr_nodes[position]
+            labels.append(node.name if position in name_hits else node.nfr_category)
+        return labels
@@ -0,0 +1,296 @@
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Set, overload
+
+from src.models.swe_edge import SweEdge
+
+_NO_ROW = -1
+
+
+class SweEdgeRow(SweEdge):
+    """Read-only `SweEdge` view of one `SweEdgeTable` row.
+
+    Rows are rebuilt from the table's columns on every access, so assigning to
+    one could never change the table; it raises instead. Rows compare equal to
+    plain `SweEdge` instances with the same fields and unpickle as `SweEdge`.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, source_id: str, relation: str, target_id: str, description: str
+    ) -> None:
+        object.__setattr__(self, "source_id", source_id)
+        object.__setattr__(self, "relation", relation)
+        object.__setattr__(self, "target_id", target_id)
+        object.__setattr__(self, "description", description)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(
+            f"{type(self).__name__} is read-only; change edges through the table"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _fields(self) -> tuple:
+        return (self.source_id, self.relation, self.target_id, self.description)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SweEdge):
+            return NotImplemented
+        return self._fields() == (
+            other.source_id,
+            other.relation,
+            other.target_id,
+            other.description,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return (SweEdge, self._fields())
+
+
+class SweEdgeTable(Sequence):
+    """Columnar storage for knowledge base edges.
+
+    Node ids and relations are interned into integer codes and every edge is a
+    row across parallel ``array`` columns (source, relation, target) plus its
+    description. Adjacency is kept as per-code first/last rows with per-row
+    "next" links, so the indexes are flat arrays too and no per-edge Python
+    object is kept; ``SweEdge`` instances are built on access as views over a
+    row. Lookups return rows in insertion order.
+
+    Like the ``list[SweEdge]`` it replaces, ``append`` takes an edge; rows come
+    back as read-only `SweEdgeRow` views.
+    """
+
+    def __init__(self, edges: Iterable[SweEdge] = ()) -> None:
+        self._ids: List[str] = []
+        self._id_codes: Dict[str, int] = {}
+        self._relations: List[str] = []
+        self._relation_codes: Dict[str, int] = {}
+        self._sources = array("i")
+        self._targets = array("i")
+        self._relation_column = array("i")
+        self._descriptions: List[str] = []
+        self._first_out = array("i")
+        self._last_out = array("i")
+        self._next_out = array("i")
+        self._first_in = array("i")
+        self._last_in = array("i")
+        self._next_in = array("i")
+        self._first_by_relation = array("i")
+        self._last_by_relation = array("i")
+        self._next_by_relation = array("i")
+        self._keys: Set[int] = set()
+        for edge in edges:
+            self.append(edge)
+
+    def _id_code(self, node_id: str) -> int:
+        code = self._id_codes.get(node_id)
+        if code is None:
+            code = len(self._ids)
+            node_id = sys.intern(node_id)
+            self._id_codes[node_id] = code
+            self._ids.append(node_id)
+            for heads in (
+                self._first_out,
+                self._last_out,
+                self._first_in,
+                self._last_in,
+            ):
+                heads.append(_NO_ROW)
+        return code
+
+    def _relation_code(self, relation: str) -> int:
+        code = self._relation_codes.get(relation)
+        if code is None:
+            code = len(self._relations)
+            relation = sys.intern(relation)
+            self._relation_codes[relation] = code
+            self._relations.append(relation)
+            self._first_by_relation.append(_NO_ROW)
+            self._last_by_relation.append(_NO_ROW)
+        return code
+
+    @staticmethod
+    def _link(first: array, last: array, next_row: array, code: int, row: int) -> None:
+        next_row.append(_NO_ROW)
+        if last[code] == _NO_ROW:
+            first[code] = row
+        else:
+            next_row[last[code]] = row
+        last[code] = row
+
+    @staticmethod
+    def _chain(first: array, next_row: array, code: int) -> Iterator[int]:
+        row = first[code]
+        while row != _NO_ROW:
+            yield row
+            row = next_row[row]
+
+    def _incident_rows(self, code: int) -> Iterator[int]:
+        # Both chains are ascending; merge them, yielding self-loops once.
+        out_row = self._first_out[code]
+        in_row = self._first_in[code]
+        while out_row != _NO_ROW or in_row != _NO_ROW:
+            if in_row == _NO_ROW or (out_row != _NO_ROW and out_row <= in_row):
+                row = out_row
+                if in_row == out_row:
+                    in_row = self._next_in[in_row]
+                out_row = self._next_out[out_row]
+            else:
+                row = in_row
+                in_row = self._next_in[in_row]
+            yield row
+
+    @staticmethod
+    def _pack_key(source: int, relation: int, target: int) -> int:
+        return (source << 64) | (relation << 32) | target
+
+    def _key(self, source_id: str, relation: str, target_id: str) -> int | None:
+        source = self._id_codes.get(source_id)
+        target = self._id_codes.get(target_id)
+        relation_code = self._relation_codes.get(relation)
+        if source is None or target is None or relation_code is None:
+            return None
+        return self._pack_key(source, relation_code, target)
+
+    def contains(self, source_id: str, relation: str, target_id: str) -> bool:
+        """Whether an edge with this (source, relation, target) is stored."""
+
+        key = self._key(source_id, relation, target_id)
+        return key is not None and key in self._keys
+
+    def append(self, edge: SweEdge) -> None:
+        self.add(edge.source_id, edge.relation, edge.target_id, edge.description)
+
+    def add(
+        self, source_id: str, relation: str, target_id: str, description: str
+    ) -> None:
+        """Append a row from its fields without building a `SweEdge` first."""
+
+        source = self._id_code(source_id)
+        target = self._id_code(target_id)
+        relation_code = self._relation_code(relation)
+        row = len(self._descriptions)
+        self._sources.append(source)
+        self._targets.append(target)
+        self._relation_column.append(relation_code)
+        self._descriptions.append(description)
+        self._keys.add(self._pack_key(source, relation_code, target))
+        self._link(self._first_out, self._last_out, self._next_out, source, row)
+        self._link(self._first_in, self._last_in, self._next_in, target, row)
+        self._link(
+            self._first_by_relation,
+            self._last_by_relation,
+            self._next_by_relation,
+            relation_code,
+            row,
+        )
+
+    def _edge(self, row: int) -> SweEdgeRow:
+        return SweEdgeRow(
+            source_id=self._ids[self._sources[row]],
+            relation=self._relations[self._relation_column[row]],
+            target_id=self._ids[self._targets[row]],
+            description=self._descriptions[row],
+        )
+
+    def __len__(self) -> int:
+        return len(self._descriptions)
+
+    @overload
+    def __getitem__(self, index: int) -> SweEdge: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[SweEdge]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._edge(row) for row in range(len(self))[index]]
+        return self._edge(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[SweEdge]:
+        for row in range(len(self)):
+            yield self._edge(row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            edge == other_edge for edge, other_edge in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SweEdgeTable({list(self)!r})"
+
+    def _views(self, rows: Iterable[int]) -> List[SweEdge]:
+        return [self._edge(row) for row in rows]
+
+    def outgoing(self, node_id: str) -> List[SweEdge]:
+        code = self._id_codes.get(node_id)
+        if code is None:
+            return []
+        return self._views(self._chain(self._first_out, self._next_out, code))
+
+    def incoming(self, node_id: str) -> List[SweEdge]:
+        code = self._id_codes.get(node_id)
+        if code is None:
+            return []
+        return self._views(self._chain(self._first_in, self._next_in, code))
+
+    def incident(self, node_id: str) -> List[SweEdge]:
+        code = self._id_codes.get(node_id)
+        if code is None:
+            return []
+        return self._views(self._incident_rows(code))
+
+    def with_relation(self, relation: str) -> List[SweEdge]:
+        code = self._relation_codes.get(relation)
+        if code is None:
+            return []
+        return self._views(
+            self._chain(self._first_by_relation, self._next_by_relation, code)
+        )
+
+    def degree(self, node_id: str) -> int:
+        """Number of edges touching ``node_id`` (self-loops count once)."""
+
+        code = self._id_codes.get(node_id)
+        if code is None:
+            return 0
+        return sum(1 for _ in self._incident_rows(code))
+
+    def iter_target_ids(self, node_id: str) -> Iterator[str]:
+        """Targets of the edges leaving ``node_id``, without building edge views."""
+
+        code = self._id_codes.get(node_id)
+        if code is None:
+            return
+        for row in self._chain(self._first_out, self._next_out, code):
+            yield self._ids[self._targets[row]]
+
+    def iter_source_ids(self, node_id: str) -> Iterator[str]:
+        """Sources of the edges pointing at ``node_id``, without building edge views."""
+
+        code = self._id_codes.get(node_id)
+        if code is None:
+            return
+        for row in self._chain(self._first_in, self._next_in, code):
+            yield self._ids[self._sources[row]]
+
+    def iter_adjacent_ids(self, node_id: str) -> Iterator[str]:
+        """The other endpoint of each edge touching ``node_id``, in row order."""
+
+        code = self._id_codes.get(node_id)
+        if code is None:
+            return
+        for row in self._incident_rows(code):
+            source = self._sources[row]
+            yield self._ids[self._targets[row] if source == code else source]
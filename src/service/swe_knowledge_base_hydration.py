@@ -0,0 +1,197 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+Payload = Dict[str, object]
+
+
+@dataclass
+class HydrationMetrics:
+    """Counters describing how lazily discovered node payloads were served."""
+
+    cache_hits: int = 0
+    prefetch_hits: int = 0
+    cache_misses: int = 0
+    prefetch_requests: int = 0
+    evictions: int = 0
+    loads: int = 0
+    total_load_seconds: float = 0.0
+    max_load_seconds: float = 0.0
+    total_wait_seconds: float = 0.0
+
+    @property
+    def average_load_seconds(self) -> float:
+        return self.total_load_seconds / self.loads if self.loads else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        values = asdict(self)
+        values["average_load_seconds"] = self.average_load_seconds
+        return values
+
+
+class KnowledgeNodeHydrator:
+    """Loads `data.json` payloads for lazily discovered knowledge base nodes.
+
+    Payloads are kept in an LRU cache of at most `max_cached_payloads` entries
+    (0 keeps everything) and can be prefetched on a thread pool, so that the
+    caller only waits for reads that are still in flight. Finished prefetches
+    move into that cache right away, and at most `max_cached_payloads` of them
+    are in flight or unread at once, so payloads that are prefetched but never
+    read stay within the bound too. Evicted node ids are
+    queued until `drain_evicted()` so the owner can release their details on its
+    own thread. `metrics` records load latency (file read and parse) and the
+    time callers spent blocked on hydration.
+    """
+
+    def __init__(
+        self,
+        load_payload: Callable[[str], Payload],
+        max_cached_payloads: int = 0,
+        max_workers: int = 4,
+    ) -> None:
+        self._load_payload = load_payload
+        self._max_cached_payloads = max_cached_payloads
+        self._max_workers = max_workers
+        self._cache: "OrderedDict[str, Payload]" = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        # Cached payloads that came from a prefetch and have not been read yet.
+        self._prefetched: set[str] = set()
+        # Bumped by `clear`/`shutdown` so older reads are not cached.
+        self._generation = 0
+        self._evicted: List[str] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self.metrics = HydrationMetrics()
+
+    def _read(self, source_path: str) -> Payload:
+        started = time.perf_counter()
+        payload = self._load_payload(source_path)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.metrics.loads += 1
+            self.metrics.total_load_seconds += elapsed
+            self.metrics.max_load_seconds = max(self.metrics.max_load_seconds, elapsed)
+        return payload
+
+    def _prefetch_read(
+        self, node_id: str, source_path: str, generation: int
+    ) -> Payload:
+        payload = self._read(source_path)
+        with self._lock:
+            # A caller already waiting on this read pops it and stores it itself.
+            if generation == self._generation and self._pending.pop(node_id, None):
+                if payload:
+                    self._store(node_id, payload)
+                    self._prefetched.add(node_id)
+        return payload
+
+    def _store(self, node_id: str, payload: Payload) -> None:
+        # Caller holds the lock.
+        self._cache[node_id] = payload
+        self._cache.move_to_end(node_id)
+        while 0 < self._max_cached_payloads < len(self._cache):
+            evicted_id, _ = self._cache.popitem(last=False)
+            self._prefetched.discard(evicted_id)
+            self._evicted.append(evicted_id)
+            self.metrics.evictions += 1
+
+    def payload(self, node_id: str, source_path: str) -> Payload:
+        """Return the payload for `node_id`, reading it now if not cached or pending."""
+
+        started = time.perf_counter()
+        with self._lock:
+            cached = self._cache.get(node_id)
+            if cached is not None:
+                self._cache.move_to_end(node_id)
+                if node_id in self._prefetched:
+                    self._prefetched.discard(node_id)
+                    self.metrics.prefetch_hits += 1
+                else:
+                    self.metrics.cache_hits += 1
+                return cached
+            future = self._pending.pop(node_id, None)
+            if future is not None:
+                self.metrics.prefetch_hits += 1
+            else:
+                self.metrics.cache_misses += 1
+
+        payload = None
+        if future is not None:
+            try:
+                payload = future.result()
+            except CancelledError:
+                # Queued read dropped by `shutdown`; fall back to reading now.
+                pass
+        if payload is None:
+            payload = self._read(source_path)
+        with self._lock:
+            if payload:
+                self._store(node_id, payload)
+            self.metrics.total_wait_seconds += time.perf_counter() - started
+        return payload
+
+    def prefetch(self, specs: Iterable[Tuple[str, str]]) -> int:
+        """Start background reads for `(node_id, source_path)` pairs; returns count."""
+
+        submitted = 0
+        with self._lock:
+            if self._closed:
+                return 0
+            for node_id, source_path in specs:
+                if node_id in self._cache or node_id in self._pending:
+                    continue
+                if self._max_cached_payloads > 0 and (
+                    len(self._pending) + len(self._prefetched)
+                    >= self._max_cached_payloads
+                ):
+                    # More would only evict unread prefetches from the cache.
+                    break
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="kb-hydration",
+                    )
+                self._pending[node_id] = self._executor.submit(
+                    self._prefetch_read, node_id, source_path, self._generation
+                )
+                submitted += 1
+            self.metrics.prefetch_requests += submitted
+        return submitted
+
+    def drain_evicted(self) -> List[str]:
+        with self._lock:
+            evicted, self._evicted = self._evicted, []
+        return evicted
+
+    def clear(self) -> None:
+        """Forget cached and in-flight payloads (e.g. before a reload)."""
+
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+            self._pending.clear()
+            self._prefetched.clear()
+            self._evicted.clear()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the prefetch pool and drop cached payloads.
+
+        Queued prefetches are cancelled and later `prefetch` calls are ignored;
+        `payload` keeps working by reading synchronously, so callers still
+        holding a retired knowledge base are not broken.
+        """
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._closed = True
+            self._generation += 1
+            self._cache.clear()
+            self._pending.clear()
+            self._prefetched.clear()
+            self._evicted.clear()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,16 +1,50 @@
 import csv
+import heapq
+import itertools
 import json
 import logging
+import math
 import os
-from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+import re
+from collections import OrderedDict, deque
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 from src.models.swe_edge import SweEdge
 from src.models.swe_node import SweNode
+from src.service.nfr_alias_index import NfrAliasIndex
+from src.service.swe_edge_table import SweEdgeTable
+from src.service.swe_knowledge_base_hydration import KnowledgeNodeHydrator
+from src.service.swe_knowledge_base_snapshot import (
+    SweKnowledgeBaseSnapshot,
+    source_fingerprint,
+)
+from src.service.swe_knowledge_base_watcher import KnowledgeSourceCache
+from src.service.swe_knowledge_graph_query import KnowledgeGraphQuery
 
 logger = logging.getLogger(__name__)
 
 _STRUCTURAL_RELATIONS = {"maps_to_folder", "organized_as", "contains"}
 
+# Budgeted summaries: structural edges rank below semantic ones, and traversal
+# stops once less than a minimal line's worth of budget is left.
+_STRUCTURAL_RELATION_WEIGHT = 0.5
+_MIN_SUMMARY_LINE_CHARS = 24
+_SUMMARY_TERM_PATTERN = re.compile(r"[a-z0-9]{3,}")
+
+# (relation weight, target terms, degree bonus, edge) of one candidate line.
+_SummaryEdge = Tuple[float, frozenset, float, SweEdge]
+
 _KNOWLEDGE_DOMAIN_NODE_KINDS = {
     "clean_code": ("Principle", "clean_code_"),
     "code_smells": ("Smell", "smell_"),
@@ -22,6 +56,26 @@ _KNOWLEDGE_DOMAIN_NODE_KINDS = {
 }
 
 
+class _SummaryNeighborhood:
+    """Focus-independent inputs of budgeted summaries for one cache key.
+
+    Node labels and scored outgoing edges are filled in as fills reach them,
+    so later calls with a different ``focus_text`` only redo the ranking.
+    """
+
+    __slots__ = ("nodes", "edges")
+
+    def __init__(self) -> None:
+        # node id -> (formatted label, name), or None when the node is missing.
+        self.nodes: Dict[str, Optional[Tuple[str, str]]] = {}
+        self.edges: Dict[str, List[_SummaryEdge]] = {}
+
+
+# (NFR ids, depth, max_chars) -> whole summary, or its budgeted neighborhood.
+_SummaryCacheKey = Tuple[Tuple[str, ...], int, Optional[int]]
+_SummarySource = Union[str, _SummaryNeighborhood]
+
+
 class SweKnowledgeBase:
     """Loads SWE knowledge base nodes and edges from configurable directories.
 
@@ -30,6 +84,25 @@ class SweKnowledgeBase:
     it will recursively load all CSVs under those roots that match the
     expected column names, so you can colocate knowledge base data under
     knowledge/linked_data without separate node and edge roots.
+
+    When ``snapshot_path`` is set, ``load()`` restores the loaded state from
+    that snapshot while the source files are unchanged and rewrites it after
+    a full load otherwise.
+
+    ``summarize_for_prompt`` keeps an LRU cache of ``summary_cache_size``
+    entries (0 disables it) keyed by NFR ids, depth and budget: unbudgeted
+    summaries are cached whole, budgeted ones as their neighborhood so that
+    only the ``focus_text`` ranking runs per call. It is cleared whenever the
+    graph is reloaded or its edges are replaced.
+
+    With ``lazy_load_nodes``, payloads are read through a
+    ``KnowledgeNodeHydrator``: resolving NFR ids or building a summary
+    prefetches the ``prefetch_depth`` neighborhood on ``hydration_workers``
+    threads, and at most ``hydration_cache_size`` nodes (0 = unbounded) keep
+    their details before being released back to their lightweight form.
+
+    A shared ``source_cache`` lets successive instances reuse the parsed
+    ``data.json`` and CSV files that did not change between loads.
     """
 
     def __init__(
@@ -37,20 +110,41 @@ class SweKnowledgeBase:
         ground_data_dir: Optional[str] = None,
         linked_data_dir: Optional[str] = None,
         lazy_load_nodes: bool = False,
+        snapshot_path: Optional[str] = None,
+        summary_cache_size: int = 256,
+        hydration_cache_size: int = 0,
+        hydration_workers: int = 4,
+        prefetch_depth: int = 1,
+        source_cache: Optional[KnowledgeSourceCache] = None,
     ) -> None:
         # Allow directory paths to be provided explicitly, or read from
         # environment variables as a fallback.
         self._ground_data_dir = ground_data_dir or os.environ.get("SWE_GROUND_DATA_DIR")
         self._linked_data_dir = linked_data_dir or os.environ.get("SWE_LINKED_DATA_DIR")
         self._lazy_load_nodes = lazy_load_nodes
-        self.nodes: Dict[str, SweNode] = {}
-        self.edges: List[SweEdge] = []
+        self._snapshot_path = snapshot_path
+        self._nodes: Dict[str, SweNode] = {}
+        self._nfr_alias_index: Optional[NfrAliasIndex] = None
+        self._graph_query: Optional[KnowledgeGraphQuery] = None
+        self._edges = SweEdgeTable()
         self._node_specs: Dict[str, Tuple[str, str, str]] = {}
         self._hydrated_node_ids: set[str] = set()
         self._knowledge_entries: Dict[str, Dict[str, str]] = {}
         self._folder_nfr_hints: Dict[str, set[str]] = {}
         self._category_nfr_hints: Dict[str, set[str]] = {}
-        self._edge_keys: set[Tuple[str, str, str]] = set()
+        self._summary_cache: "OrderedDict[_SummaryCacheKey, _SummarySource]" = (
+            OrderedDict()
+        )
+        self._summary_cache_size = summary_cache_size
+        self._summary_cache_hits = 0
+        self._summary_cache_misses = 0
+        self._hydrator = KnowledgeNodeHydrator(
+            load_payload=self._load_json_payload,
+            max_cached_payloads=hydration_cache_size,
+            max_workers=hydration_workers,
+        )
+        self._prefetch_depth = prefetch_depth
+        self._source_cache = source_cache
 
     @property
     def ground_data_dir(self) -> Optional[str]:
@@ -64,6 +158,63 @@ class SweKnowledgeBase:
     def lazy_load_nodes(self) -> bool:
         return self._lazy_load_nodes
 
+    @property
+    def snapshot_path(self) -> Optional[str]:
+        return self._snapshot_path
+
+    @property
+    def hydration_stats(self) -> Dict[str, float]:
+        """Lazy hydration counters and payload load latency, for monitoring."""
+
+        return self._hydrator.metrics.as_dict()
+
+    def close(self, wait: bool = True) -> None:
+        """Stop background hydration and release cached node payloads."""
+
+        self._hydrator.shutdown(wait=wait)
+
+    @property
+    def nodes(self) -> Dict[str, SweNode]:
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes: Dict[str, SweNode]) -> None:
+        self._nodes = nodes
+        self._invalidate_node_caches()
+
+    def _invalidate_node_caches(self) -> None:
+        self._summary_cache.clear()
+        self._nfr_alias_index = None
+        self._graph_query = None
+
+    @property
+    def edges(self) -> SweEdgeTable:
+        """Columnar edge store; indexing or iterating it yields ``SweEdge`` views."""
+
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges: Iterable[SweEdge]) -> None:
+        self._edges = SweEdgeTable(edges)
+        self._summary_cache.clear()
+        self._graph_query = None
+
+    @property
+    def summary_cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters and occupancy of the ``summarize_for_prompt`` cache."""
+
+        return {
+            "hits": self._summary_cache_hits,
+            "misses": self._summary_cache_misses,
+            "size": len(self._summary_cache),
+            "max_size": self._summary_cache_size,
+        }
+
+    def clear_summary_cache(self) -> None:
+        """Drop cached summaries and lookups, e.g. after mutating ``nodes`` in place."""
+
+        self._invalidate_node_caches()
+
     @staticmethod
     def _iter_csv_lines(file_obj: TextIO) -> Iterator[str]:
         for line in file_obj:
@@ -76,6 +227,17 @@ class SweKnowledgeBase:
     def _clean_cell(value: Optional[str]) -> str:
         return (value or "").strip()
 
+    @classmethod
+    def _read_csv_rows(cls, path: str) -> Tuple[List[str], List[Dict[str, str]]]:
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(cls._iter_csv_lines(f))
+            return list(reader.fieldnames or []), list(reader)
+
+    def _read_source(self, path: str, parse: Callable[[str], Any]) -> Any:
+        if self._source_cache is None:
+            return parse(path)
+        return self._source_cache.get(path, parse)
+
     @staticmethod
     def _iter_csv_paths(root_dir: str) -> Iterator[str]:
         for current_root, _, files in os.walk(root_dir):
@@ -83,9 +245,13 @@ class SweKnowledgeBase:
                 if name.lower().endswith(".csv"):
                     yield os.path.join(current_root, name)
 
-    def load(self) -> None:
+    def load(self, refresh_snapshot: bool = False) -> None:
         """Load all known node and edge CSVs into memory.
 
+        Args:
+            refresh_snapshot: Ignore a fresh snapshot and rebuild it from the
+                source files (only meaningful when ``snapshot_path`` is set).
+
         Raises:
             ValueError: If knowledge base directories are not configured.
             FileNotFoundError: If configured directories do not exist.
@@ -110,25 +276,64 @@ class SweKnowledgeBase:
                 f"linked_data_dir does not exist: {self.linked_data_dir}"
             )
 
+        self._hydrator.clear()
+        snapshot: Optional[SweKnowledgeBaseSnapshot] = None
+        fingerprint = ""
+        if self._snapshot_path:
+            snapshot = SweKnowledgeBaseSnapshot(self._snapshot_path)
+            fingerprint = source_fingerprint(self.ground_data_dir, self.linked_data_dir)
+            state = None
+            if not refresh_snapshot:
+                state = snapshot.read(fingerprint, self.lazy_load_nodes)
+            if state is not None:
+                self._restore_state(state)
+                logger.info(
+                    f"Loaded {len(self.nodes)} nodes and {len(self.edges)} edges "
+                    f"from snapshot {self._snapshot_path}"
+                )
+                return
+
         # Rebuild in-memory state on each call so repeated loads are idempotent.
         self.nodes.clear()
-        self.edges.clear()
+        self.edges = []
         self._node_specs.clear()
         self._hydrated_node_ids.clear()
         self._knowledge_entries.clear()
         self._folder_nfr_hints.clear()
         self._category_nfr_hints.clear()
-        self._edge_keys.clear()
 
         self._load_nodes()
         self._load_edges()
         self._rebuild_edges_from_ground_truth()
         self._ensure_nodes_for_edges()
         self._infer_nfr_categories()
+        self._invalidate_node_caches()
         logger.info(
             f"Loaded {len(self.nodes)} nodes and {len(self.edges)} edges "
             f"from {self.ground_data_dir} and {self.linked_data_dir}"
         )
+        if snapshot is not None:
+            snapshot.write(self._export_state(), fingerprint, self.lazy_load_nodes)
+
+    def _export_state(self) -> Dict[str, Any]:
+        return {
+            "nodes": self.nodes,
+            "edges": self._edges,
+            "node_specs": self._node_specs,
+            "hydrated_node_ids": self._hydrated_node_ids,
+            "knowledge_entries": self._knowledge_entries,
+            "folder_nfr_hints": self._folder_nfr_hints,
+            "category_nfr_hints": self._category_nfr_hints,
+        }
+
+    def _restore_state(self, state: Dict[str, Any]) -> None:
+        self.nodes = state["nodes"]
+        self.edges = state["edges"]
+        self._node_specs = state["node_specs"]
+        self._hydrated_node_ids = state["hydrated_node_ids"]
+        self._knowledge_entries = state["knowledge_entries"]
+        self._folder_nfr_hints = state["folder_nfr_hints"]
+        self._category_nfr_hints = state["category_nfr_hints"]
 
     def _load_nodes(self) -> None:
         if not os.path.isdir(self.ground_data_dir):
@@ -140,21 +345,20 @@ class SweKnowledgeBase:
     def _load_nodes_from_csv(self) -> None:
         expected_cols = {"Id", "Type", "Name", "NFRCategory", "Description"}
         for path in self._iter_csv_paths(self.ground_data_dir):
-            with open(path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(self._iter_csv_lines(f))
-                if not expected_cols.issubset(reader.fieldnames or []):
+            fieldnames, rows = self._read_source(path, self._read_csv_rows)
+            if not expected_cols.issubset(fieldnames):
+                continue
+            for row in rows:
+                node_id = self._clean_cell(row.get("Id"))
+                if not node_id:
                     continue
-                for row in reader:
-                    node_id = self._clean_cell(row.get("Id"))
-                    if not node_id:
-                        continue
-                    self.nodes[node_id] = SweNode(
-                        id=node_id,
-                        type=self._clean_cell(row.get("Type")),
-                        name=self._clean_cell(row.get("Name")),
-                        nfr_category=self._clean_cell(row.get("NFRCategory")),
-                        description=self._clean_cell(row.get("Description")),
-                    )
+                self.nodes[node_id] = SweNode(
+                    id=node_id,
+                    type=self._clean_cell(row.get("Type")),
+                    name=self._clean_cell(row.get("Name")),
+                    nfr_category=self._clean_cell(row.get("NFRCategory")),
+                    description=self._clean_cell(row.get("Description")),
+                )
 
     def _load_nodes_from_knowledge_data(self) -> None:
         for current_root, _, files in os.walk(self.ground_data_dir):
@@ -172,7 +376,7 @@ class SweKnowledgeBase:
             if not node_id:
                 continue
 
-            payload = self._load_json_payload(data_path)
+            payload = self._read_source(data_path, self._load_json_payload)
             if not payload:
                 continue
 
@@ -307,7 +511,9 @@ class SweKnowledgeBase:
         if node_id.startswith("category_"):
             node_type = "Category"
             name = self._humanize(node_id.replace("category_", ""))
-            description = f"knowledge base category discovered for {name.lower()} guidance."
+            description = (
+                f"knowledge base category discovered for {name.lower()} guidance."
+            )
         elif node_id.startswith("folder_"):
             node_type = "Folder"
             folder_name = node_id.replace("folder_", "")
@@ -339,10 +545,17 @@ class SweKnowledgeBase:
         )
 
     def _infer_nfr_categories(self) -> None:
-        adjacency: Dict[str, List[str]] = {}
-        for edge in self.edges:
-            adjacency.setdefault(edge.source_id, []).append(edge.target_id)
-            adjacency.setdefault(edge.target_id, []).append(edge.source_id)
+        """Propagate NFR categories to uncategorized nodes through edges.
+
+        Uncategorized nodes take the category of their first neighbor (in edge
+        load order) that is already categorized when a sweep over ``nodes``
+        reaches them, and sweeps repeat until nothing changes. Instead of
+        re-running those sweeps, the sweep in which each node gets categorized
+        is computed directly as a 0-1 BFS from the categorized nodes: a
+        neighbor categorized earlier in the same sweep costs 0 extra sweeps,
+        any other neighbor costs 1. Nodes are then assigned in (sweep, node
+        order), which reproduces the sweeps' result in linear time.
+        """
 
         known_categories: Dict[str, str] = {}
         for node_id, node in self.nodes.items():
@@ -356,21 +569,40 @@ class SweKnowledgeBase:
                     node_id.replace("nfr_", "")
                 )
                 node.nfr_category = inferred_category
-                known_categories[node_id] = inferred_category
+                if inferred_category:
+                    known_categories[node_id] = inferred_category
 
-        changed = True
-        while changed:
-            changed = False
-            for node_id, node in self.nodes.items():
-                if (node.nfr_category or "").strip():
+        order = {node_id: position for position, node_id in enumerate(self.nodes)}
+        sweeps: Dict[str, int] = {node_id: 0 for node_id in known_categories}
+        queue = deque(known_categories)
+        while queue:
+            node_id = queue.popleft()
+            for neighbor_id in self._edges.iter_adjacent_ids(node_id):
+                if neighbor_id in known_categories:
                     continue
-                for neighbor_id in adjacency.get(node_id, []):
-                    inferred_category = known_categories.get(neighbor_id, "").strip()
-                    if not inferred_category:
-                        continue
-                    node.nfr_category = inferred_category
-                    known_categories[node_id] = inferred_category
-                    changed = True
+                same_sweep = (
+                    node_id not in known_categories
+                    and order[node_id] < order[neighbor_id]
+                )
+                sweep = sweeps[node_id] + (0 if same_sweep else 1)
+                if sweep < sweeps.get(neighbor_id, sweep + 1):
+                    sweeps[neighbor_id] = sweep
+                    if same_sweep:
+                        queue.appendleft(neighbor_id)
+                    else:
+                        queue.append(neighbor_id)
+
+        inferred = sorted(
+            (node_id for node_id in sweeps if node_id not in known_categories),
+            key=lambda node_id: (sweeps[node_id], order[node_id]),
+        )
+        for node_id in inferred:
+            # Exactly the neighbors ordered before this node are known by now.
+            for neighbor_id in self._edges.iter_adjacent_ids(node_id):
+                category = known_categories.get(neighbor_id)
+                if category:
+                    self.nodes[node_id].nfr_category = category
+                    known_categories[node_id] = category
                     break
 
     def _ensure_node_details_loaded(self, node_id: str) -> None:
@@ -382,7 +614,7 @@ class SweKnowledgeBase:
             return
 
         domain, slug, source_path = spec
-        payload = self._load_json_payload(source_path)
+        payload = self._hydrator.payload(node_id, source_path)
         if not payload:
             return
 
@@ -399,11 +631,74 @@ class SweKnowledgeBase:
         if existing_node and not hydrated_node.nfr_category:
             hydrated_node.nfr_category = existing_node.nfr_category
 
+        node_count = len(self.nodes)
         self.nodes[node_id] = hydrated_node
         self._hydrated_node_ids.add(node_id)
+        if hydrated_node.type.upper() == "NFR":
+            self._nfr_alias_index = None
 
         if domain == "clean_code":
             self._register_category_node(str(payload.get("category") or ""))
+        if (
+            existing_node is None
+            or len(self.nodes) != node_count
+            or existing_node.type != hydrated_node.type
+            or existing_node.nfr_category != hydrated_node.nfr_category
+        ):
+            self._graph_query = None
+
+        for evicted_id in self._hydrator.drain_evicted():
+            self._release_node_details(evicted_id)
+
+    def _release_node_details(self, node_id: str) -> None:
+        """Swap a hydrated node back to its payload-free form to bound memory."""
+
+        if node_id not in self._hydrated_node_ids or node_id not in self._node_specs:
+            return
+        domain, slug, source_path = self._node_specs[node_id]
+        light_node = self._build_node_from_payload(
+            domain=domain,
+            slug=slug,
+            payload=None,
+            source_path=source_path,
+        )
+        existing_node = self.nodes.get(node_id)
+        if light_node is None or existing_node is None:
+            return
+        light_node.nfr_category = existing_node.nfr_category
+        self.nodes[node_id] = light_node
+        self._hydrated_node_ids.discard(node_id)
+
+    def prefetch_neighborhood(
+        self, node_ids: List[str], depth: Optional[int] = None
+    ) -> int:
+        """Start loading details of nodes within ``depth`` outgoing hops.
+
+        Only meaningful with ``lazy_load_nodes``; returns how many payload reads
+        were scheduled. Details are applied when the nodes are next read.
+        """
+
+        if not self.lazy_load_nodes:
+            return 0
+        depth = self._prefetch_depth if depth is None else depth
+
+        specs: List[Tuple[str, str]] = []
+        seen = set(node_ids)
+        frontier = list(dict.fromkeys(node_ids))
+        for hop in range(depth + 1):
+            next_frontier: List[str] = []
+            for node_id in frontier:
+                spec = self._node_specs.get(node_id)
+                if spec and node_id not in self._hydrated_node_ids:
+                    specs.append((node_id, spec[2]))
+                if hop == depth:
+                    continue
+                for target_id in self._edges.iter_target_ids(node_id):
+                    if target_id not in seen:
+                        seen.add(target_id)
+                        next_frontier.append(target_id)
+            frontier = next_frontier
+        return self._hydrator.prefetch(specs)
 
     def get_node(self, node_id: str, load_details: bool = True) -> Optional[SweNode]:
         if load_details:
@@ -445,18 +740,9 @@ class SweKnowledgeBase:
         target_id: str,
         description: str,
     ) -> None:
-        edge_key = (source_id, relation, target_id)
-        if edge_key in self._edge_keys:
+        if self._edges.contains(source_id, relation, target_id):
             return
-        self._edge_keys.add(edge_key)
-        self.edges.append(
-            SweEdge(
-                source_id=source_id,
-                relation=relation,
-                target_id=target_id,
-                description=description,
-            )
-        )
+        self._edges.add(source_id, relation, target_id, description)
 
     def _is_ground_truth_endpoint(self, node_id: str) -> bool:
         if node_id in self.nodes or node_id in self._node_specs:
@@ -515,59 +801,158 @@ class SweKnowledgeBase:
         if not os.path.isdir(self.linked_data_dir):
             return
         for path in self._iter_csv_paths(self.linked_data_dir):
-            with open(path, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(self._iter_csv_lines(f))
-                if not reader.fieldnames or not set(reader.fieldnames).issuperset(
-                    expected_cols
-                ):
+            fieldnames, rows = self._read_source(path, self._read_csv_rows)
+            if not fieldnames or not set(fieldnames).issuperset(expected_cols):
+                continue
+            for row in rows:
+                source = self._clean_cell(row.get("SourceId"))
+                target = self._clean_cell(row.get("TargetId"))
+                relation = self._clean_cell(row.get("Relation"))
+                description = self._clean_cell(row.get("Description"))
+                if not source or not target:
                     continue
-                for row in reader:
-                    source = self._clean_cell(row.get("SourceId"))
-                    target = self._clean_cell(row.get("TargetId"))
-                    relation = self._clean_cell(row.get("Relation"))
-                    description = self._clean_cell(row.get("Description"))
-                    if not source or not target:
-                        continue
-                    if relation == "maps_to_folder" and target.startswith("folder_"):
-                        self._folder_nfr_hints.setdefault(target, set()).add(source)
-                    elif relation == "organized_as" and target.startswith("category_"):
-                        self._category_nfr_hints.setdefault(target, set()).add(source)
-
-                    if relation in _STRUCTURAL_RELATIONS:
-                        continue
-                    if not self._is_ground_truth_endpoint(source):
-                        continue
-                    if not self._is_ground_truth_endpoint(target):
-                        continue
-
-                    self._add_edge(source, relation, target, description)
+                if relation == "maps_to_folder" and target.startswith("folder_"):
+                    self._folder_nfr_hints.setdefault(target, set()).add(source)
+                elif relation == "organized_as" and target.startswith("category_"):
+                    self._category_nfr_hints.setdefault(target, set()).add(source)
+
+                if relation in _STRUCTURAL_RELATIONS:
+                    continue
+                if not self._is_ground_truth_endpoint(source):
+                    continue
+                if not self._is_ground_truth_endpoint(target):
+                    continue
+
+                self._add_edge(source, relation, target, description)
+
+    def _nfr_index(self) -> NfrAliasIndex:
+        if self._nfr_alias_index is None:
+            self._nfr_alias_index = NfrAliasIndex(self.nodes.values())
+        return self._nfr_alias_index
 
     def find_nfr_ids(self, nfr_names_or_ids: List[str]) -> List[str]:
-        """Resolve a list of NFR names or IDs to node IDs."""
+        """Resolve a list of NFR names or IDs to node IDs.
 
-        requested = {v.lower() for v in nfr_names_or_ids}
-        resolved: List[str] = []
-        for node in self.nodes.values():
-            if node.type.upper() == "NFR":
-                if (
-                    node.id.lower() in requested
-                    or node.name.lower() in requested
-                    or node.nfr_category.lower() in requested
-                ):
-                    resolved.append(node.id)
+        In lazy mode this also starts prefetching the resolved neighborhood,
+        which is what a following ``summarize_for_prompt`` will read.
+        """
+
+        resolved = self._nfr_index().resolve(nfr_names_or_ids)
+        self.prefetch_neighborhood(resolved)
         return resolved
 
+    def _query(self) -> KnowledgeGraphQuery:
+        if self._graph_query is None:
+            domains = {
+                node_id: entry["domain"]
+                for node_id, entry in self._knowledge_entries.items()
+            }
+            for node_id in self.nodes:
+                if node_id.startswith("folder_"):
+                    domains[node_id] = node_id[len("folder_") :]
+            self._graph_query = KnowledgeGraphQuery(self.nodes, self._edges, domains)
+        return self._graph_query
+
+    def find_nodes(
+        self,
+        node_type: Optional[str] = None,
+        nfr_category: Optional[str] = None,
+        domain: Optional[str] = None,
+    ) -> List[SweNode]:
+        """Nodes matching every given filter (case-insensitive), in node order.
+
+        ``domain`` is the ``knowledge/data`` folder a node was discovered in
+        (e.g. ``code_smells``); folder nodes belong to their own domain.
+        """
+
+        return [
+            self.nodes[node_id]
+            for node_id in self._query().find_nodes(node_type, nfr_category, domain)
+        ]
+
+    def get_neighborhood(
+        self,
+        node_ids: List[str],
+        hops: int = 1,
+        direction: str = "both",
+        node_types: Optional[Iterable[str]] = None,
+    ) -> Dict[str, int]:
+        """Hop distance of each node within ``hops`` of ``node_ids``, in BFS order.
+
+        ``direction`` is ``"out"``, ``"in"`` or ``"both"``. With ``node_types``
+        the walk only enters nodes of those types; the start nodes are always
+        included at distance 0.
+        """
+
+        return self._query().neighborhood(node_ids, hops, direction, node_types)
+
+    def find_shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        direction: str = "both",
+        max_hops: Optional[int] = None,
+    ) -> Optional[List[str]]:
+        """Fewest-hop path of node ids from ``source_id`` to ``target_id``, or None."""
+
+        return self._query().shortest_path(source_id, target_id, direction, max_hops)
+
+    def find_nearest_of_types(
+        self,
+        source_id: str,
+        node_types: Iterable[str],
+        direction: str = "both",
+        max_hops: Optional[int] = None,
+    ) -> Dict[str, List[str]]:
+        """Shortest path to every reachable node of ``node_types``, nearest first.
+
+        E.g. ``find_nearest_of_types("nfr_maintainability", ["Smell", "Refactoring"])``.
+        """
+
+        return self._query().nearest_of_types(
+            source_id, node_types, direction, max_hops
+        )
+
+    def find_nfr_mentions(self, text: str) -> List[str]:
+        """Names (or categories) of the NFRs mentioned in ``text``, in node order.
+
+        A node contributes its name when the name occurs in the lowercased
+        text, otherwise its category when that occurs. The text is scanned once
+        with a multi-pattern matcher, however many NFRs the catalog holds.
+        """
+
+        return self._nfr_index().mentions(text)
+
+    def get_outgoing_edges(self, node_id: str) -> List[SweEdge]:
+        """Edges leaving `node_id`, in load order."""
+
+        return self._edges.outgoing(node_id)
+
+    def get_incoming_edges(self, node_id: str) -> List[SweEdge]:
+        """Edges pointing at `node_id`, in load order."""
+
+        return self._edges.incoming(node_id)
+
+    def get_incident_edges(self, node_id: str) -> List[SweEdge]:
+        """Edges touching `node_id` in either direction, in load order."""
+
+        return self._edges.incident(node_id)
+
+    def get_edges_by_relation(self, relation: str) -> List[SweEdge]:
+        return self._edges.with_relation(relation)
+
     def get_neighbors(self, node_ids: List[str]) -> Dict[str, List[SweEdge]]:
         """Return outgoing edges for the given node IDs."""
 
-        node_set = set(node_ids)
-        neighbors: Dict[str, List[SweEdge]] = {nid: [] for nid in node_ids}
-        for edge in self.edges:
-            if edge.source_id in node_set:
-                neighbors.setdefault(edge.source_id, []).append(edge)
-        return neighbors
+        return {nid: self.get_outgoing_edges(nid) for nid in node_ids}
 
-    def summarize_for_prompt(self, nfr_ids: List[str], depth: int = 1) -> str:
+    def summarize_for_prompt(
+        self,
+        nfr_ids: List[str],
+        depth: int = 1,
+        max_chars: Optional[int] = None,
+        focus_text: str = "",
+    ) -> str:
         """Build a compact text summary suitable for prompt injection.
 
         Args:
@@ -575,8 +960,46 @@ class SweKnowledgeBase:
             depth: How many relationship hops to traverse (default 1 = direct
                    neighbours only). Honour ``KnowledgeBaseConfig.relationship_depth``
                    by passing ``config.knowledge_base.relationship_depth`` here.
+            max_chars: Optional size budget. When set, the starting nodes come
+                   first and neighbours are added best-first (semantic relations,
+                   overlap with ``focus_text``, then node degree, preferring
+                   nearer hops) while they fit; traversal stops once the
+                   budget is spent, so the result never exceeds ``max_chars``.
+            focus_text: Free text (e.g. the plan) used to rank neighbours by
+                   relevance when ``max_chars`` is set.
         """
 
+        key = (tuple(nfr_ids), depth, max_chars)
+        source = self._summary_cache.get(key)
+        if source is not None:
+            self._summary_cache_hits += 1
+            self._summary_cache.move_to_end(key)
+        else:
+            source = self._summary_source(nfr_ids, depth, max_chars)
+            if self._summary_cache_size > 0:
+                self._summary_cache_misses += 1
+                self._summary_cache[key] = source
+                if len(self._summary_cache) > self._summary_cache_size:
+                    self._summary_cache.popitem(last=False)
+
+        if isinstance(source, str):
+            return source
+        return self._build_budgeted_summary(
+            source, nfr_ids, depth, max_chars, focus_text
+        )
+
+    def _summary_source(
+        self, nfr_ids: List[str], depth: int, max_chars: Optional[int]
+    ) -> _SummarySource:
+        """The cacheable, focus-independent part of a summary."""
+
+        if max_chars is None:
+            return self._build_summary(nfr_ids, depth)
+        self.prefetch_neighborhood(nfr_ids, depth)
+        return _SummaryNeighborhood()
+
+    def _build_summary(self, nfr_ids: List[str], depth: int) -> str:
+        self.prefetch_neighborhood(nfr_ids, depth)
         lines: List[str] = []
         visited: set = set()
 
@@ -589,26 +1012,130 @@ class SweKnowledgeBase:
                 return
             label = self._format_node_summary(node)
             lines.append(f"{indent}{label}")
+            outgoing = self._edges.outgoing(node_id)
             if current_depth < depth:
-                for e in self.edges:
-                    if e.source_id == node_id:
-                        rel_line = f"{indent}  [{e.relation}] â†’"
-                        lines.append(rel_line)
-                        _expand(e.target_id, current_depth + 1, indent + "    ")
+                for e in outgoing:
+                    rel_line = f"{indent}  [{e.relation}] â†’"
+                    lines.append(rel_line)
+                    _expand(e.target_id, current_depth + 1, indent + "    ")
             else:
-                for e in self.edges:
-                    if e.source_id == node_id:
-                        target = self.get_node(e.target_id)
-                        target_label = target.name if target else e.target_id
-                        lines.append(
-                            f"{indent}  - {e.relation}: {target_label} - {e.description}"
-                        )
+                for e in outgoing:
+                    target = self.get_node(e.target_id)
+                    target_label = target.name if target else e.target_id
+                    lines.append(
+                        f"{indent}  - {e.relation}: {target_label} - {e.description}"
+                    )
 
         for nid in nfr_ids:
             _expand(nid, 1, "")
 
         return "\n".join(lines)
 
-    def get_all_nfrs(self) -> List[SweNode]:
-        return [n for n in self.nodes.values() if n.type.upper() == "NFR"]
+    def _summary_node(
+        self, neighborhood: _SummaryNeighborhood, node_id: str
+    ) -> Optional[Tuple[str, str]]:
+        if node_id not in neighborhood.nodes:
+            node = self.get_node(node_id)
+            neighborhood.nodes[node_id] = (
+                (self._format_node_summary(node), node.name) if node else None
+            )
+        return neighborhood.nodes[node_id]
+
+    def _summary_edges(
+        self, neighborhood: _SummaryNeighborhood, node_id: str
+    ) -> List[_SummaryEdge]:
+        scored = neighborhood.edges.get(node_id)
+        if scored is None:
+            scored = []
+            for edge in self._edges.outgoing(node_id):
+                weight = 1.0
+                if edge.relation in _STRUCTURAL_RELATIONS:
+                    weight = _STRUCTURAL_RELATION_WEIGHT
+                target = self.get_node(edge.target_id)
+                text = f"{edge.relation} {edge.description}"
+                if target is not None:
+                    text = f"{text} {target.name} {target.description}"
+                terms = frozenset(_SUMMARY_TERM_PATTERN.findall(text.lower()))
+                degree_bonus = 0.1 * math.log1p(self._edges.degree(edge.target_id))
+                scored.append((weight, terms, degree_bonus, edge))
+            neighborhood.edges[node_id] = scored
+        return scored
+
+    def _build_budgeted_summary(
+        self,
+        neighborhood: _SummaryNeighborhood,
+        nfr_ids: List[str],
+        depth: int,
+        max_chars: int,
+        focus_text: str,
+    ) -> str:
+        """Same layout as ``_build_summary``, filled best-first within ``max_chars``."""
+
+        if depth < 1:
+            # ``_build_summary`` lists nothing below the first hop either.
+            return ""
+        focus_terms = set(_SUMMARY_TERM_PATTERN.findall(focus_text.lower()))
+        blocks: List[str] = []
+        children: Dict[int, List[int]] = {}
+        roots: List[int] = []
+        placed: set = set()
+        # Every block is followed by a newline except the last one.
+        remaining = max_chars + 1
+        candidates: List[Tuple[float, int, int, int, SweEdge]] = []
+        tie_breaker = itertools.count()
+
+        def _push_edges(node_id: str, block: int, level: int) -> None:
+            for weight, terms, degree_bonus, edge in self._summary_edges(
+                neighborhood, node_id
+            ):
+                score = weight
+                if focus_terms:
+                    score += 0.5 * len(focus_terms & terms)
+                score += degree_bonus
+                heapq.heappush(
+                    candidates, (-score / level, next(tie_breaker), block, level, edge)
+                )
 
+        for nid in nfr_ids:
+            node = None if nid in placed else self._summary_node(neighborhood, nid)
+            if not node:
+                continue
+            label = node[0]
+            if len(label) + 1 > remaining:
+                break
+            remaining -= len(label) + 1
+            placed.add(nid)
+            roots.append(len(blocks))
+            blocks.append(label)
+            _push_edges(nid, roots[-1], 1)
+
+        while candidates and remaining >= _MIN_SUMMARY_LINE_CHARS:
+            _, _, parent, level, e = heapq.heappop(candidates)
+            indent = "    " * (level - 1)
+            target = self._summary_node(neighborhood, e.target_id)
+            if level < depth:
+                if not target or e.target_id in placed:
+                    continue
+                block = f"{indent}  [{e.relation}] â†’\n{indent}    {target[0]}"
+            else:
+                target_label = target[1] if target else e.target_id
+                block = f"{indent}  - {e.relation}: {target_label} - {e.description}"
+            if len(block) + 1 > remaining:
+                continue
+            remaining -= len(block) + 1
+            children.setdefault(parent, []).append(len(blocks))
+            blocks.append(block)
+            if level < depth:
+                placed.add(e.target_id)
+                _push_edges(e.target_id, len(blocks) - 1, level + 1)
+
+        ordered: List[str] = []
+        stack = list(reversed(roots))
+        while stack:
+            block = stack.pop()
+            ordered.append(blocks[block])
+            stack.extend(reversed(children.get(block, ())))
+        return "\n".join(ordered)
+
+    def get_all_nfrs(self) -> List[SweNode]:
+        return self.find_nodes(node_type="NFR")
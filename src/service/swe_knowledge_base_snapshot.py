@@ -0,0 +1,116 @@
+"""Versioned on-disk snapshot of a fully loaded `SweKnowledgeBase`.
+
+Loading the knowledge base parses every `data.json` and CSV under the
+configured roots, rebuilds ground-truth edges and infers NFR categories. The
+snapshot stores the resulting in-memory state together with a content hash of
+those source files, so a later `load()` can restore it with a single
+deserialization as long as the sources are unchanged.
+
+Build or refresh it ahead of time with::
+
+    python -m scripts.build_kb_snapshot [repo_root]
+
+from the repository root, so the ``src`` package is importable.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the shape of the persisted state changes.
+_SNAPSHOT_VERSION = 2
+_SOURCE_EXTENSIONS = (".json", ".csv")
+
+
+def default_snapshot_path(ground_data_dir: str, linked_data_dir: str) -> str:
+    """Per-source-tree snapshot location under the user cache directory."""
+
+    cache_root = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    roots = f"{os.path.abspath(ground_data_dir)}\0{os.path.abspath(linked_data_dir)}"
+    digest = hashlib.sha1(roots.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_root, "coding-tool-reasoning", f"kb_{digest}.pickle")
+
+
+def iter_source_files(root_dir: str) -> Iterator[str]:
+    """Knowledge source files (`.json`, `.csv`) under `root_dir`, in sorted order."""
+
+    for current_root, dirs, files in os.walk(root_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(_SOURCE_EXTENSIONS):
+                yield os.path.join(current_root, name)
+
+
+def source_fingerprint(ground_data_dir: str, linked_data_dir: str) -> str:
+    """SHA-256 over the relative path and bytes of every knowledge source file."""
+
+    digest = hashlib.sha256()
+    for label, root_dir in (("ground", ground_data_dir), ("linked", linked_data_dir)):
+        for path in iter_source_files(root_dir):
+            relative = os.path.relpath(path, root_dir).replace(os.sep, "/")
+            digest.update(f"{label}:{relative}\0".encode("utf-8"))
+            with open(path, "rb") as file_handle:
+                digest.update(hashlib.sha256(file_handle.read()).digest())
+    return digest.hexdigest()
+
+
+class SweKnowledgeBaseSnapshot:
+    """Reads and writes knowledge base state pickled next to its fingerprint."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def read(self, fingerprint: str, lazy_load_nodes: bool) -> Optional[Dict[str, Any]]:
+        """Return the stored state, or None when missing, stale or unreadable."""
+
+        try:
+            with open(self.path, "rb") as file_handle:
+                payload = pickle.load(file_handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        if payload.get("version") != _SNAPSHOT_VERSION:
+            return None
+        if payload.get("fingerprint") != fingerprint:
+            return None
+        if payload.get("lazy_load_nodes") != lazy_load_nodes:
+            return None
+        return payload.get("state")
+
+    def write(
+        self,
+        state: Dict[str, Any],
+        fingerprint: str,
+        lazy_load_nodes: bool,
+    ) -> None:
+        """Atomically replace the snapshot; failures only cost the next cold start."""
+
+        payload = {
+            "version": _SNAPSHOT_VERSION,
+            "fingerprint": fingerprint,
+            "lazy_load_nodes": lazy_load_nodes,
+            "state": state,
+        }
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as file_handle:
+                    pickle.dump(payload, file_handle, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as exc:
+            logger.warning(
+                f"Could not write knowledge base snapshot {self.path}: {exc}"
+            )
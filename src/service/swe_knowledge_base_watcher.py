@@ -0,0 +1,131 @@
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.service.swe_knowledge_base_snapshot import iter_source_files
+
+logger = logging.getLogger(__name__)
+
+FileSignature = Tuple[int, int]
+
+
+def _file_signature(path: str) -> Optional[FileSignature]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class KnowledgeSourceCache:
+    """Parsed knowledge source files, reused while their mtime and size match.
+
+    Shared between successive `SweKnowledgeBase` instances so a reload only
+    re-parses the `data.json` and CSV files that actually changed. Cached
+    values are treated as read-only by the knowledge base.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[FileSignature, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str, parse: Callable[[str], Any]) -> Any:
+        """Return ``parse(path)``, reusing the previous result if the file is unchanged."""
+
+        signature = _file_signature(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if signature is not None and entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = parse(path)
+        if signature is not None:
+            with self._lock:
+                self._entries[path] = (signature, value)
+        return value
+
+    def discard(self, paths: Iterable[str]) -> None:
+        """Forget cached results for ``paths`` (e.g. deleted source files)."""
+
+        with self._lock:
+            for path in paths:
+                self._entries.pop(path, None)
+
+
+class KnowledgeBaseWatcher:
+    """Polls knowledge base roots and reports which source files changed.
+
+    Polling (rather than inotify) keeps this dependency-free and portable; a
+    poll only stats the `.json`/`.csv` files, so it is cheap at the default
+    interval. ``on_change`` receives the sorted added, modified and removed
+    paths and runs on the watcher thread.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[str],
+        on_change: Callable[[List[str]], None],
+        interval_seconds: float = 2.0,
+    ) -> None:
+        self._roots = list(roots)
+        self._on_change = on_change
+        self._interval_seconds = interval_seconds
+        self._signatures = self._scan()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _scan(self) -> Dict[str, FileSignature]:
+        signatures: Dict[str, FileSignature] = {}
+        for root in self._roots:
+            if not os.path.isdir(root):
+                continue
+            for path in iter_source_files(root):
+                signature = _file_signature(path)
+                if signature is not None:
+                    signatures[path] = signature
+        return signatures
+
+    def poll(self) -> List[str]:
+        """Rescan once; invoke ``on_change`` and return the changed paths, if any."""
+
+        current = self._scan()
+        previous, self._signatures = self._signatures, current
+        changed = sorted(
+            path
+            for path in previous.keys() | current.keys()
+            if previous.get(path) != current.get(path)
+        )
+        if changed:
+            self._on_change(changed)
+        return changed
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval_seconds):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Knowledge base reload failed; keeping current one")
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="kb-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,254 @@
+from collections import OrderedDict, deque
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from src.models.swe_node import SweNode
+from src.service.swe_edge_table import SweEdgeTable
+
+T = TypeVar("T")
+
+DIRECTIONS = ("out", "in", "both")
+
+
+class KnowledgeGraphQuery:
+    """Indexed filters and traversals over a loaded knowledge graph.
+
+    Node ids are indexed by lowercased type, NFR category and knowledge domain;
+    traversals walk the edge table's adjacency chains directly. Traversal
+    results are memoized in an LRU of ``cache_size`` entries, so the owner must
+    build a new instance whenever nodes or edges change.
+    """
+
+    def __init__(
+        self,
+        nodes: Mapping[str, SweNode],
+        edges: SweEdgeTable,
+        domains: Mapping[str, str],
+        cache_size: int = 256,
+    ) -> None:
+        self._nodes = nodes
+        self._edges = edges
+        self._ids_by_type: Dict[str, List[str]] = {}
+        self._ids_by_category: Dict[str, List[str]] = {}
+        self._ids_by_domain: Dict[str, List[str]] = {}
+        for node_id, node in nodes.items():
+            self._ids_by_type.setdefault(node.type.lower(), []).append(node_id)
+            self._ids_by_category.setdefault(node.nfr_category.lower(), []).append(
+                node_id
+            )
+            domain = domains.get(node_id)
+            if domain:
+                self._ids_by_domain.setdefault(domain.lower(), []).append(node_id)
+        self._cache: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def _cached(self, key: Hashable, compute: Callable[[], T]) -> T:
+        if self._cache_size <= 0:
+            return compute()
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]  # type: ignore[return-value]
+        value = compute()
+        self._cache[key] = value
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return value
+
+    def find_nodes(
+        self,
+        node_type: Optional[str] = None,
+        nfr_category: Optional[str] = None,
+        domain: Optional[str] = None,
+    ) -> List[str]:
+        """Ids of nodes matching every given filter (case-insensitive), in node order."""
+
+        selections = [
+            index.get(value.lower(), [])
+            for index, value in (
+                (self._ids_by_type, node_type),
+                (self._ids_by_category, nfr_category),
+                (self._ids_by_domain, domain),
+            )
+            if value is not None
+        ]
+        if not selections:
+            return list(self._nodes)
+        selections.sort(key=len)
+        others = [set(selection) for selection in selections[1:]]
+        return [
+            node_id
+            for node_id in selections[0]
+            if all(node_id in other for other in others)
+        ]
+
+    def _iter_neighbor_ids(self, node_id: str, direction: str) -> Iterator[str]:
+        if direction == "out":
+            return self._edges.iter_target_ids(node_id)
+        if direction == "in":
+            return self._edges.iter_source_ids(node_id)
+        return self._edges.iter_adjacent_ids(node_id)
+
+    def _allows(self, node_id: str, node_types: Optional[Set[str]]) -> bool:
+        if node_types is None:
+            return True
+        node = self._nodes.get(node_id)
+        return node is not None and node.type.lower() in node_types
+
+    @staticmethod
+    def _normalize(
+        direction: str, node_types: Optional[Iterable[str]]
+    ) -> Optional[Set[str]]:
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction must be one of {DIRECTIONS}: {direction!r}")
+        if node_types is None:
+            return None
+        return {node_type.lower() for node_type in node_types}
+
+    def neighborhood(
+        self,
+        node_ids: Iterable[str],
+        hops: int = 1,
+        direction: str = "both",
+        node_types: Optional[Iterable[str]] = None,
+    ) -> Dict[str, int]:
+        """Hop distance of every node within ``hops`` of ``node_ids``, in BFS order.
+
+        With ``node_types``, traversal only enters nodes of those types (the
+        start nodes are always included at distance 0).
+        """
+
+        starts = tuple(dict.fromkeys(node_ids))
+        allowed = self._normalize(direction, node_types)
+        key = (
+            "neighborhood",
+            starts,
+            hops,
+            direction,
+            None if allowed is None else frozenset(allowed),
+        )
+
+        def compute() -> Dict[str, int]:
+            distances = {node_id: 0 for node_id in starts}
+            frontier = list(starts)
+            for hop in range(1, hops + 1):
+                next_frontier: List[str] = []
+                for node_id in frontier:
+                    for neighbor_id in self._iter_neighbor_ids(node_id, direction):
+                        if neighbor_id in distances:
+                            continue
+                        if not self._allows(neighbor_id, allowed):
+                            continue
+                        distances[neighbor_id] = hop
+                        next_frontier.append(neighbor_id)
+                if not next_frontier:
+                    break
+                frontier = next_frontier
+            return distances
+
+        return dict(self._cached(key, compute))
+
+    def _bfs_parents(
+        self,
+        source_id: str,
+        direction: str,
+        max_hops: Optional[int],
+        stop: Callable[[str], bool],
+        first_only: bool = False,
+    ) -> Tuple[Dict[str, Optional[str]], List[str]]:
+        parents: Dict[str, Optional[str]] = {source_id: None}
+        reached: List[str] = []
+        queue = deque([(source_id, 0)])
+        while queue:
+            node_id, hop = queue.popleft()
+            if max_hops is not None and hop >= max_hops:
+                continue
+            for neighbor_id in self._iter_neighbor_ids(node_id, direction):
+                if neighbor_id in parents:
+                    continue
+                parents[neighbor_id] = node_id
+                if stop(neighbor_id):
+                    reached.append(neighbor_id)
+                    if first_only:
+                        return parents, reached
+                    continue
+                queue.append((neighbor_id, hop + 1))
+        return parents, reached
+
+    @staticmethod
+    def _path(parents: Dict[str, Optional[str]], node_id: str) -> List[str]:
+        path = [node_id]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])  # type: ignore[arg-type]
+        path.reverse()
+        return path
+
+    def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        direction: str = "both",
+        max_hops: Optional[int] = None,
+    ) -> Optional[List[str]]:
+        """Fewest-hop node path from ``source_id`` to ``target_id``, or None."""
+
+        self._normalize(direction, None)
+        if source_id not in self._nodes or target_id not in self._nodes:
+            return None
+        if source_id == target_id:
+            return [source_id]
+        key = ("shortest_path", source_id, target_id, direction, max_hops)
+
+        def compute() -> Optional[List[str]]:
+            parents, reached = self._bfs_parents(
+                source_id,
+                direction,
+                max_hops,
+                lambda node_id: node_id == target_id,
+                first_only=True,
+            )
+            return self._path(parents, target_id) if reached else None
+
+        path = self._cached(key, compute)
+        return list(path) if path is not None else None
+
+    def nearest_of_types(
+        self,
+        source_id: str,
+        node_types: Iterable[str],
+        direction: str = "both",
+        max_hops: Optional[int] = None,
+    ) -> Dict[str, List[str]]:
+        """Shortest path to each reachable node of ``node_types``, nearest first.
+
+        Paths end at the first matching node; traversal does not continue
+        through it.
+        """
+
+        allowed = self._normalize(direction, node_types) or set()
+        if source_id not in self._nodes:
+            return {}
+        key = ("nearest", source_id, frozenset(allowed), direction, max_hops)
+
+        def compute() -> Dict[str, List[str]]:
+            parents, reached = self._bfs_parents(
+                source_id,
+                direction,
+                max_hops,
+                lambda node_id: self._allows(node_id, allowed),
+            )
+            return {node_id: self._path(parents, node_id) for node_id in reached}
+
+        return {
+            node_id: list(path) for node_id, path in self._cached(key, compute).items()
+        }
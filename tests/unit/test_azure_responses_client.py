@@ -8,9 +8,26 @@ from src.llm_client.azure_responses_client import AzureResponsesClient
 
 
 class _FakeResponse:
-    def __init__(self, payload: dict | None = None, raise_exc: Exception | None = None):
+    def __init__(
+        self,
+        payload: dict | None = None,
+        raise_exc: Exception | None = None,
+        lines: list[str] | None = None,
+    ):
         self._payload = payload or {}
         self._raise_exc = raise_exc
+        self._lines = lines or []
+        self.encoding: str | None = None
+        self.closed = False
+
+    def __enter__(self) -> "_FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.closed = True
+
+    def iter_lines(self, decode_unicode: bool = False):
+        return iter(self._lines)
 
     def raise_for_status(self) -> None:
         if self._raise_exc:
@@ -111,3 +128,33 @@ def test_chat_wraps_unexpected_and_preserves_text_exception() -> None:
     client.session = _FakeSession(response=_FakeResponse({}))
     with pytest.raises(TextLLMException, match="no textual output"):
         client.chat("hello")
+
+
+def test_stream_chat_yields_output_text_deltas() -> None:
+    client = AzureResponsesClient(endpoint="https://example", default_model="gpt")
+    response = _FakeResponse(
+        lines=[
+            "event: response.created",
+            'data: {"type": "response.created"}',
+            "",
+            "event: response.output_text.delta",
+            'data: {"type": "response.output_text.delta", "delta": "he"}',
+            "",
+            'data: {"type": "response.output_text.delta", "delta": "llo"}',
+            "",
+            'data: {"type": "response.completed"}',
+            "",
+        ]
+    )
+    fake = _FakeSession(response=response)
+    client.session = fake
+
+    assert list(client.stream_chat("hello")) == ["he", "llo"]
+    assert fake.last_post["kwargs"]["json"]["stream"] is True
+    assert response.closed is True
+
+    client.session = _FakeSession(
+        response=_FakeResponse(lines=['data: {"type": "response.failed"}', ""])
+    )
+    with pytest.raises(TextLLMException, match="stream failed"):
+        list(client.stream_chat("hello"))
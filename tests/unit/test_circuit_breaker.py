@@ -264,7 +264,7 @@ def test_build_swe_code_context_writes_prompt_assets(tmp_path):
         def find_nfr_ids(self, nfr_focus):
             return ["NFR-1"] if nfr_focus else []
 
-        def summarize_for_prompt(self, nfr_ids):
+        def summarize_for_prompt(self, nfr_ids, **kwargs):
             if not nfr_ids:
                 return "No NFR focus"
             return "NFR: Reliability"
@@ -279,6 +279,7 @@ def test_build_swe_code_context_writes_prompt_assets(tmp_path):
                 "content": "Template body",
             }
         ],
+        config=SweMcpConfig(),
     )
 
     mcp = FakeMCP()
@@ -443,7 +444,7 @@ def test_class_based_tool_registry_plan_and_build(monkeypatch, tmp_path):
         def find_nfr_ids(self, nfr_focus):
             return ["NFR-1"] if nfr_focus else []
 
-        def summarize_for_prompt(self, nfr_ids):
+        def summarize_for_prompt(self, nfr_ids, **kwargs):
             return "NFR summary"
 
     fake_ctx = SimpleNamespace(
@@ -0,0 +1,40 @@
+import re
+
+from src.llm_client.code_block_stream import CodeBlockStreamParser
+
+_FENCED = re.compile(r"```([a-zA-Z0-9_+-]*)\n(.*?)```", re.DOTALL)
+
+
+def _regex_blocks(text):
+    blocks = []
+    for match in _FENCED.finditer(text):
+        code = match.group(2).strip()
+        if code:
+            blocks.append({"language": match.group(1) or "text", "code": code})
+    return blocks
+
+
+def test_reports_block_on_the_piece_with_its_closing_fence():
+    parser = CodeBlockStreamParser()
+    pieces = ["Here:\n`", "``pyt", "hon\nprint(1)\n`", "``", "\ntrailing prose"]
+
+    completed = [parser.feed(piece) for piece in pieces]
+
+    assert completed[:3] == [[], [], []]
+    assert completed[3] == [{"language": "python", "code": "print(1)"}]
+    assert completed[4] == []
+
+
+def test_matches_regex_extraction_for_any_split():
+    text = (
+        "intro ```not a fence``` then ````\nfour\n```\n"
+        "```\n\n```\n```c++\nint x;\n``` tail ```js\nopen"
+    )
+    expected = _regex_blocks(text)
+    assert expected
+
+    for size in range(1, 8):
+        parser = CodeBlockStreamParser()
+        for start in range(0, len(text), size):
+            parser.feed(text[start : start + size])
+        assert parser.blocks == expected
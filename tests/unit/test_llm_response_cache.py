@@ -0,0 +1,70 @@
+import pytest
+
+from src.errors.LLMCacheMissError import LLMCacheMissError
+from src.llm_client.response_cache import LLMResponseCache, response_cache_key
+
+
+def test_key_covers_model_prompt_and_sampling_params():
+    base = response_cache_key("m1", "hello", {"temperature": 0, "seed": 42})
+
+    assert base == response_cache_key("m1", "hello", {"seed": 42, "temperature": 0})
+    assert base != response_cache_key("m2", "hello", {"temperature": 0, "seed": 42})
+    assert base != response_cache_key("m1", "hello!", {"temperature": 0, "seed": 42})
+    assert base != response_cache_key("m1", "hello", {"temperature": 0, "seed": 7})
+
+
+def test_modes_share_one_store(tmp_path):
+    db_path = tmp_path / "llm.sqlite"
+    params = {"temperature": 0}
+
+    recorder = LLMResponseCache(mode="record", db_path=db_path)
+    assert recorder.lookup("m1", "hi", params) is None
+    recorder.store("m1", "hi", params, "first")
+    recorder.store("m1", "hi", params, "second")
+    recorder.close()
+
+    reader = LLMResponseCache(mode="read_through", db_path=db_path)
+    assert reader.lookup("m1", "hi", params) == "second"
+    assert reader.lookup("m1", "other", params) is None
+    reader.close()
+
+    replay = LLMResponseCache(mode="replay", db_path=db_path)
+    assert replay.lookup("m1", "hi", params) == "second"
+    replay.store("m1", "new", params, "ignored")
+    with pytest.raises(LLMCacheMissError):
+        replay.lookup("m1", "new", params)
+    assert len(replay) == 1
+
+
+def test_evicts_least_recently_used_over_budget(tmp_path):
+    cache = LLMResponseCache(
+        db_path=tmp_path / "llm.sqlite", max_bytes=20, touch_interval_s=0
+    )
+
+    cache.store("m1", "a", {}, "x" * 8)
+    cache.store("m1", "b", {}, "y" * 8)
+    assert cache.lookup("m1", "a", {}) == "x" * 8
+    cache.store("m1", "c", {}, "z" * 8)
+
+    assert cache.lookup("m1", "a", {}) == "x" * 8
+    assert cache.lookup("m1", "b", {}) is None
+    assert cache.lookup("m1", "c", {}) == "z" * 8
+
+
+def test_recent_hits_and_small_stores_skip_bookkeeping_writes(tmp_path):
+    cache = LLMResponseCache(db_path=tmp_path / "llm.sqlite", touch_interval_s=3600)
+    cache.store("m1", "a", {}, "x" * 8)
+    cache.store("m1", "a", {}, "y" * 8)
+    writes = cache._connection.total_changes
+
+    for _ in range(3):
+        assert cache.lookup("m1", "a", {}) == "y" * 8
+
+    assert cache._connection.total_changes == writes
+    cache.close()
+
+    reopened = LLMResponseCache(db_path=tmp_path / "llm.sqlite", max_bytes=10)
+    assert reopened._total_bytes == 8
+    reopened.store("m1", "b", {}, "z" * 8)
+    assert reopened._total_bytes == 8
+    assert len(reopened) == 1
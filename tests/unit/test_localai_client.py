@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -89,3 +92,68 @@ def test_create_session_mounts_adapters(client):
     # Both http:// and https:// should have adapters mounted
     assert "http://" in session.adapters
     assert "https://" in session.adapters
+
+
+def test_achat_bounds_in_flight_requests_per_endpoint():
+    first = LocalAIClient(endpoint="http://shared:8080", max_concurrency=2)
+    second = LocalAIClient(endpoint="http://shared:8080", max_concurrency=2)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def slow_chat(prompt, model=None, **kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return prompt.upper()
+
+    first.chat = slow_chat
+    second.chat = slow_chat
+
+    async def run():
+        return await asyncio.gather(
+            *((first if index % 2 else second).achat(f"p{index}") for index in range(6))
+        )
+
+    assert asyncio.run(run()) == [f"P{index}" for index in range(6)]
+    assert state["peak"] == 2
+
+
+def test_stream_chat_yields_deltas_until_done(client):
+    resp = MagicMock()
+    resp.__enter__.return_value = resp
+    resp.raise_for_status.return_value = None
+    resp.iter_lines.return_value = iter(
+        [
+            'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            "",
+            'data: {"choices": [{"delta": {"content": "```py\\n"}}]}',
+            "",
+            ": keep-alive",
+            'data: {"choices": [{"delta": {"content": "x = 1"}}]}',
+            "",
+            "data: [DONE]",
+            "",
+            'data: {"choices": [{"delta": {"content": "ignored"}}]}',
+            "",
+        ]
+    )
+    with patch.object(client.session, "post", return_value=resp) as mock_post:
+        parts = list(client.stream_chat("prompt", seed=7))
+
+    assert parts == ["```py\n", "x = 1"]
+    kwargs = mock_post.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert kwargs["json"]["stream"] is True
+    assert kwargs["json"]["seed"] == 7
+    resp.__exit__.assert_called_once()
+
+
+def test_stream_chat_wraps_request_errors(client):
+    with patch.object(
+        client.session, "post", side_effect=requests.exceptions.Timeout("slow")
+    ):
+        with pytest.raises(TextLLMException, match="Request timeout"):
+            list(client.stream_chat("prompt"))
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.service.localizer import RepositoryCorpus, RepositoryIssueLocalizer
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_corpus_skips_missing_empty_and_oversized_files(tmp_path: Path) -> None:
+    _write(tmp_path / "src" / "small.py", "def run():\n    return 1\n")
+    _write(tmp_path / "src" / "empty.py", "")
+    _write(tmp_path / "src" / "big.py", "x = 1\n" * 100)
+
+    corpus = RepositoryCorpus(tmp_path)
+
+    assert corpus.document("src/small.py", 1_000) is not None
+    assert corpus.document("src/empty.py", 1_000) is None
+    assert corpus.document("src/missing.py", 1_000) is None
+    assert corpus.document("src/big.py", 100) is None
+    assert corpus.document("src/big.py", 10_000) is not None
+
+
+def test_corpus_parses_python_symbols_once(tmp_path: Path) -> None:
+    _write(
+        tmp_path / "src" / "service.py",
+        "from src.core import RetryPolicy\n\n\ndef run():\n    return RetryPolicy()\n",
+    )
+
+    corpus = RepositoryCorpus(tmp_path)
+    document = corpus.document("src/service.py", 1_000)
+
+    assert document is not None
+    symbols = document.python_symbols()
+    assert symbols is document.python_symbols()
+    assert "run" in symbols.definitions
+    assert "retrypolicy" in symbols.references
+    assert {"core", "retrypolicy"}.issubset(symbols.imports)
+
+
+def test_localizer_reads_each_candidate_once(tmp_path: Path, monkeypatch) -> None:
+    _write(
+        tmp_path / "src" / "auth_manager.py",
+        "def authenticate_with_retry(token):\n    return token\n",
+    )
+    _write(tmp_path / "src" / "view.py", "def render_page():\n    return 'ok'\n")
+
+    reads: list[str] = []
+    original_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self: Path) -> bytes:
+        reads.append(self.name)
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+
+    localizer = RepositoryIssueLocalizer(enable_semantic_nlp=True)
+    result = localizer.localize(
+        repo_path=tmp_path,
+        issue_text="authentication retry failing in manager",
+        candidate_paths=["src/auth_manager.py", "src/view.py"],
+    )
+
+    assert result.selected_files[0] == "src/auth_manager.py"
+    assert sorted(reads) == ["auth_manager.py", "view.py"]
+
+
+def test_corpus_candidate_set_is_computed_once_per_collection(tmp_path: Path) -> None:
+    corpus = RepositoryCorpus(tmp_path)
+    candidates = ["a.py", "b.py"]
+
+    first = corpus.candidate_set(candidates)
+
+    assert first == (0, ("a.py", "b.py"))
+    assert corpus.candidate_set(candidates) is first
+    assert corpus.candidate_set(["a.py", "b.py"])[0] == 0
+    assert corpus.candidate_set(["b.py"])[0] == 1
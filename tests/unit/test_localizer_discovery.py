@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import subprocess
 from pathlib import Path
 
 from src.service.localizer.discovery import discover_repository_code_files
@@ -26,3 +28,70 @@ def test_discover_repository_code_files_filters_extensions_and_excluded_dirs(
     assert "src/b.txt" not in found
     assert "docs/ignored.py" not in found
     assert all(not p.startswith("node_modules/") for p in found)
+
+
+def _git(repo: Path, *args: str) -> str:
+    completed = subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return completed.stdout.strip()
+
+
+def test_discover_repository_code_files_uses_git_and_honors_gitignore(
+    tmp_path: Path,
+) -> None:
+    _git(tmp_path, "init", "-q")
+    (tmp_path / ".gitignore").write_text("vendor/\n", encoding="utf-8")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "tracked.py").write_text("x = 1", encoding="utf-8")
+    (tmp_path / "src" / "removed.py").write_text("x = 2", encoding="utf-8")
+    (tmp_path / "vendor").mkdir()
+    (tmp_path / "vendor" / "lib.js").write_text("var x;", encoding="utf-8")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    (tmp_path / "src" / "removed.py").unlink()
+    (tmp_path / "src" / "untracked.py").write_text("x = 3", encoding="utf-8")
+
+    found = discover_repository_code_files(tmp_path)
+
+    assert found == ["src/tracked.py", "src/untracked.py"]
+
+
+def test_discover_repository_code_files_advances_ref_cache_with_git_diff(
+    tmp_path: Path,
+) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    cache_path = tmp_path / "discovery.json"
+    _git(repo, "init", "-q")
+    (repo / "a.py").write_text("a = 1", encoding="utf-8")
+    (repo / "b.py").write_text("b = 1", encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "first")
+    first = _git(repo, "rev-parse", "HEAD")
+
+    assert discover_repository_code_files(repo, ref="HEAD", cache_path=cache_path) == [
+        "a.py",
+        "b.py",
+    ]
+
+    (repo / "b.py").unlink()
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "c.go").write_text("package pkg", encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "second")
+
+    assert discover_repository_code_files(repo, ref="HEAD", cache_path=cache_path) == [
+        "a.py",
+        "pkg/c.go",
+    ]
+    assert json.loads(cache_path.read_text())["commit"] == _git(
+        repo, "rev-parse", "HEAD"
+    )
+    assert discover_repository_code_files(repo, ref=first, cache_path=cache_path) == [
+        "a.py",
+        "b.py",
+    ]
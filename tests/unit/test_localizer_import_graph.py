@@ -0,0 +1,117 @@
+from pathlib import Path
+
+from src.service.localizer.corpus import RepositoryCorpus
+from src.service.localizer.import_graph import (
+    ImportGraph,
+    extract_generic_import_specs,
+)
+from src.service.localizer.strategies.symbol_impact import SymbolImpactStrategy
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _graph(tmp_path: Path, paths: list[str]) -> tuple[ImportGraph, RepositoryCorpus]:
+    corpus = RepositoryCorpus(tmp_path)
+    graph = ImportGraph(paths)
+    for document in corpus.documents(paths, 350_000):
+        graph.add_document(document)
+    return graph, corpus
+
+
+def test_extract_generic_import_specs_normalizes_languages() -> None:
+    source = (
+        '#include "util/strings.h"\n'
+        "import { retry } from './retry';\n"
+        "import com.acme.net.Client;\n"
+        "use crate::net::client;\n"
+    )
+
+    specs = extract_generic_import_specs(source)
+
+    assert {"util/strings.h", "./retry", "com.acme.net.Client", "net.client"} <= specs
+
+
+def test_import_graph_resolves_python_absolute_and_relative_imports(
+    tmp_path: Path,
+) -> None:
+    _write(tmp_path / "src" / "pkg" / "__init__.py", "")
+    _write(tmp_path / "src" / "pkg" / "core.py", "class Policy:\n    pass\n")
+    _write(tmp_path / "src" / "pkg" / "helpers.py", "from .core import Policy\n")
+    _write(tmp_path / "src" / "app.py", "from src.pkg import helpers\n")
+    paths = [
+        "src/pkg/__init__.py",
+        "src/pkg/core.py",
+        "src/pkg/helpers.py",
+        "src/app.py",
+    ]
+
+    graph, corpus = _graph(tmp_path, paths)
+
+    assert graph.imports_of(corpus.document("src/pkg/helpers.py", 350_000)) == {
+        "src/pkg/core.py"
+    }
+    assert "src/pkg/helpers.py" in graph.imports_of(
+        corpus.document("src/app.py", 350_000)
+    )
+
+
+def test_import_graph_resolves_javascript_and_java_imports(tmp_path: Path) -> None:
+    _write(tmp_path / "web" / "retry.js", "export function retry() {}\n")
+    _write(tmp_path / "web" / "app.js", "import { retry } from './retry';\n")
+    _write(
+        tmp_path / "java" / "com" / "acme" / "Client.java", "public class Client {}\n"
+    )
+    _write(
+        tmp_path / "java" / "com" / "acme" / "Main.java",
+        "import com.acme.Client;\npublic class Main {}\n",
+    )
+    paths = [
+        "web/retry.js",
+        "web/app.js",
+        "java/com/acme/Client.java",
+        "java/com/acme/Main.java",
+    ]
+
+    graph, corpus = _graph(tmp_path, paths)
+
+    assert graph.imports_of(corpus.document("web/app.js", 350_000)) == {"web/retry.js"}
+    assert graph.imports_of(corpus.document("java/com/acme/Main.java", 350_000)) == {
+        "java/com/acme/Client.java"
+    }
+
+
+def test_impact_distances_follow_reverse_dependencies(tmp_path: Path) -> None:
+    _write(tmp_path / "core.py", "class Policy:\n    pass\n")
+    _write(tmp_path / "service.py", "from core import Policy\n")
+    _write(tmp_path / "api.py", "import service\n")
+    _write(tmp_path / "cli.py", "import api\n")
+    paths = ["core.py", "service.py", "api.py", "cli.py"]
+
+    graph, corpus = _graph(tmp_path, paths)
+
+    assert graph.impact_distances({"core.py"}, max_depth=2) == {
+        "core.py": 0,
+        "service.py": 1,
+        "api.py": 2,
+    }
+    load = lambda p: corpus.document(p, 350_000)  # noqa: E731
+    assert graph.distance_to(load("api.py"), {"core.py"}, 2, load) == 2
+    assert graph.distance_to(load("cli.py"), {"core.py"}, 2, load) is None
+
+
+def test_symbol_impact_ignores_files_that_do_not_import_seed(tmp_path: Path) -> None:
+    _write(tmp_path / "core.py", "class RetryPolicy:\n    pass\n")
+    _write(tmp_path / "service.py", "from core import RetryPolicy\n")
+    _write(tmp_path / "unrelated.py", "class Other:\n    pass\n")
+
+    hits = SymbolImpactStrategy().score(
+        repo_path=tmp_path,
+        issue_text="Refactor RetryPolicy behavior",
+        candidate_paths=["core.py", "service.py", "unrelated.py"],
+    )
+
+    assert any("distance 1" in reason for reason in hits["service.py"].reasons)
+    assert "unrelated.py" not in hits
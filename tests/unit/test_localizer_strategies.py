@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
-from src.service.localizer import RepositoryIssueLocalizer
+import src.service.localizer.orchestrator as orchestrator_module
+from src.models.swe_config import LocalizerConfig
+from src.service.localizer import LocalizationHit, RepositoryIssueLocalizer
+from src.service.localizer.corpus import RepositoryCorpus
 from src.service.localizer.strategies.ast_matching import AstMatchingStrategy
 from src.service.localizer.strategies.regex_content import RegexContentMatchingStrategy
 from src.service.localizer.strategies.semantic_nlp import SemanticNlpMatchingStrategy
 from src.service.localizer.strategies.symbol_impact import SymbolImpactStrategy
+from src.service.localizer.utils import mmap_findall
 
 
 def _write(path: Path, content: str) -> None:
@@ -74,6 +79,33 @@ def test_symbol_impact_strategy_finds_dependent_python_file(tmp_path: Path) -> N
     assert "src/service.py" in hits
 
 
+def test_symbol_impact_shortlist_skips_files_that_cannot_seed(
+    tmp_path: Path,
+) -> None:
+    _write(tmp_path / "src" / "core.py", "class RetryPolicy:\n    pass\n")
+    _write(
+        tmp_path / "src" / "service.py",
+        "from src.core import RetryPolicy\n\n\ndef run():\n    return RetryPolicy()\n",
+    )
+    _write(tmp_path / "src" / "unrelated.py", "def colors():\n    return 1\n")
+    candidates = ["src/core.py", "src/service.py", "src/unrelated.py"]
+    strategy = SymbolImpactStrategy()
+    issue = "Refactor RetryPolicy behavior"
+
+    full = strategy.score(tmp_path, issue, candidates)
+    corpus = RepositoryCorpus(tmp_path)
+    shortlisted = strategy.score(
+        tmp_path, issue, candidates, corpus=corpus, shortlist=["src/service.py"]
+    )
+
+    assert shortlisted == {"src/service.py": full["src/service.py"]}
+    unrelated = corpus.document("src/unrelated.py", strategy.max_file_size_bytes)
+    assert unrelated is not None and unrelated._analyses == {}
+    assert not any(
+        isinstance(key, tuple) and key[0] == "inverted_index" for key in corpus._shared
+    )
+
+
 def test_repository_issue_localizer_combines_strategies(tmp_path: Path) -> None:
     _write(
         tmp_path / "src" / "auth_manager.py",
@@ -122,3 +154,217 @@ def test_repository_issue_localizer_can_disable_semantic_nlp() -> None:
     assert any(
         strategy.name == "semantic_nlp" for strategy in localizer_with_nlp.strategies
     )
+
+
+def test_regex_content_inverted_index_matches_regex_scan(tmp_path: Path) -> None:
+    _write(
+        tmp_path / "src" / "retry.py",
+        "RETRY = 1\ndef retry_request(Request):\n    retrying = Retry(request)\n",
+    )
+    _write(tmp_path / "src" / "other.py", "request.get(); request.post()\n")
+    _write(tmp_path / "src" / "none.py", "nothing relevant here\n")
+    candidates = ["src/retry.py", "src/other.py", "src/none.py"]
+    issue = "Retry request fails for retry_request"
+
+    scanned = RegexContentMatchingStrategy().score(tmp_path, issue, candidates)
+    indexed = RegexContentMatchingStrategy(use_inverted_index=True).score(
+        tmp_path, issue, candidates
+    )
+
+    assert list(indexed) == list(scanned) == ["src/retry.py", "src/other.py"]
+    for rel_path, hit in scanned.items():
+        assert indexed[rel_path].score == hit.score
+        assert indexed[rel_path].reasons == hit.reasons
+
+
+def test_localize_many_matches_single_issue_runs_and_discovers_once(
+    tmp_path: Path, monkeypatch
+) -> None:
+    _write(
+        tmp_path / "src" / "auth_manager.py",
+        "def authenticate_with_retry(token):\n    return token\n",
+    )
+    _write(tmp_path / "src" / "view.py", "def render_page():\n    return 'ok'\n")
+    issues = ["authentication retry failing in manager", "render_page shows blank"]
+
+    localizer = RepositoryIssueLocalizer(enable_semantic_nlp=True)
+    expected = [localizer.localize(tmp_path, issue) for issue in issues]
+
+    discovered: list[Path] = []
+    original_discover = orchestrator_module.discover_repository_code_files
+
+    def counting_discover(repo_path: Path) -> list[str]:
+        discovered.append(repo_path)
+        return original_discover(repo_path)
+
+    monkeypatch.setattr(
+        orchestrator_module, "discover_repository_code_files", counting_discover
+    )
+    results = localizer.localize_many(tmp_path, issues)
+
+    assert discovered == [tmp_path]
+    assert results == expected
+    assert results[1].selected_files[0] == "src/view.py"
+
+
+def test_parallel_localizer_matches_sequential_ranking(tmp_path: Path) -> None:
+    for index in range(6):
+        _write(
+            tmp_path / "src" / f"module_{index}.py",
+            f"class Handler{index}:\n    def retry_request(self):\n"
+            f"        return {index}\n",
+        )
+    _write(
+        tmp_path / "src" / "AuthService.java",
+        "public class AuthService { public void retryFlow() {} }",
+    )
+    issues = ["retry_request fails in Handler3", "AuthService retryFlow broken"]
+
+    sequential = RepositoryIssueLocalizer(enable_semantic_nlp=True).localize_many(
+        tmp_path, issues
+    )
+    parallel = RepositoryIssueLocalizer(
+        enable_semantic_nlp=True, max_workers=2
+    ).localize_many(tmp_path, issues)
+
+    assert parallel == sequential
+    assert parallel[0].selected_files[0] == "src/module_3.py"
+
+
+def test_cascade_ranking_matches_full_ranking(tmp_path: Path) -> None:
+    for index in range(30):
+        _write(
+            tmp_path / "pkg" / f"widget_{index}.py",
+            f"def draw_{index}():\n    return {index}\n",
+        )
+    _write(
+        tmp_path / "pkg" / "retry_policy.py",
+        "class RetryPolicy:\n    def backoff(self):\n        return 1\n",
+    )
+    _write(
+        tmp_path / "pkg" / "client.py",
+        "from pkg.retry_policy import RetryPolicy\n\n\ndef call():\n"
+        "    return RetryPolicy().backoff()\n",
+    )
+    issue = "RetryPolicy backoff is too aggressive"
+
+    full = RepositoryIssueLocalizer(enable_semantic_nlp=True).localize(
+        tmp_path, issue, top_k=1
+    )
+    cascaded = RepositoryIssueLocalizer(
+        enable_semantic_nlp=True, cascade=True
+    ).localize(tmp_path, issue, top_k=1)
+
+    assert cascaded == full
+    assert full.selected_files == ["pkg/retry_policy.py"]
+
+
+def test_localizer_from_config_applies_every_setting() -> None:
+    localizer = RepositoryIssueLocalizer.from_config(
+        LocalizerConfig(
+            enable_semantic_nlp=True, max_workers=3, enable_cascade_ranking=True
+        )
+    )
+
+    assert localizer.max_workers == 3
+    assert localizer.cascade is True
+    assert any(
+        isinstance(strategy, SemanticNlpMatchingStrategy)
+        for strategy in localizer.strategies
+    )
+
+
+class _FixedScoreStrategy:
+    def __init__(self, name: str, cost: int, scores: dict[str, float], bound: float):
+        self.name = name
+        self.cost = cost
+        self.scores = scores
+        self.bound = bound
+        self.shortlists: list[list[str] | None] = []
+
+    def upper_bound(self, issue_text: str) -> float:
+        return self.bound
+
+    def score(
+        self, repo_path, issue_text, candidate_paths, corpus=None, shortlist=None
+    ):
+        self.shortlists.append(None if shortlist is None else list(shortlist))
+        paths = candidate_paths if shortlist is None else shortlist
+        return {
+            path: LocalizationHit(path=path, score=self.scores[path], reasons=["x"])
+            for path in paths
+            if self.scores.get(path)
+        }
+
+
+def test_cascade_ranking_runs_expensive_strategy_on_shortlist_only(
+    tmp_path: Path,
+) -> None:
+    candidates = [f"f{index:02d}.py" for index in range(20)]
+    cheap = _FixedScoreStrategy(
+        "cheap", 0, {path: float(index) for index, path in enumerate(candidates)}, 20.0
+    )
+    expensive = _FixedScoreStrategy(
+        "expensive", 5, {path: 1.0 for path in candidates}, 1.0
+    )
+
+    full = RepositoryIssueLocalizer([expensive, cheap]).localize(
+        tmp_path, "issue", candidate_paths=candidates
+    )
+    cascaded = RepositoryIssueLocalizer([expensive, cheap], cascade=True).localize(
+        tmp_path, "issue", candidate_paths=candidates
+    )
+
+    assert cascaded == full
+    assert expensive.shortlists[0] is None
+    # The 10th best cheap score is 10; files below 9 cannot catch up with +1.
+    assert expensive.shortlists[1] == candidates[9:]
+
+
+class _ThreeArgumentStrategy:
+    name = "legacy"
+
+    def score(self, repo_path, issue_text, candidate_paths):
+        return {
+            path: LocalizationHit(path=path, score=1.0, reasons=["legacy"])
+            for path in candidate_paths
+            if "retry" in path
+        }
+
+
+def test_strategies_without_corpus_or_shortlist_arguments_still_run(
+    tmp_path: Path,
+) -> None:
+    candidates = ["retry.py", "other.py"]
+    for cascade in (False, True):
+        result = RepositoryIssueLocalizer(
+            [_ThreeArgumentStrategy()], cascade=cascade
+        ).localize(tmp_path, "retry", top_k=1, candidate_paths=candidates)
+
+        assert result.selected_files == ["retry.py"]
+
+
+def test_regex_content_strategy_scans_prefix_of_large_files(tmp_path: Path) -> None:
+    _write(
+        tmp_path / "generated" / "client.py",
+        "def process_retry(request):\n    return request\n" + "#" * 2_000,
+    )
+    _write(tmp_path / "generated" / "tail.py", "#" * 2_000 + "\nprocess_retry\n")
+
+    hits = RegexContentMatchingStrategy(max_file_size_bytes=1_000).score(
+        repo_path=tmp_path,
+        issue_text="process_retry fails",
+        candidate_paths=["generated/client.py", "generated/tail.py"],
+    )
+
+    assert set(hits) == {"generated/client.py"}
+    assert "first 1000 bytes" in hits["generated/client.py"].reasons[0]
+
+
+def test_mmap_findall_never_splits_identifiers(tmp_path: Path) -> None:
+    path = tmp_path / "big.txt"
+    path.write_bytes(b"retry_policy retry")
+    pattern = re.compile(rb"\b(retry)\b")
+
+    assert mmap_findall(path, pattern, 5) == []
+    assert mmap_findall(path, pattern, 100) == [b"retry"]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.service.localizer import RepositoryCorpus, SymbolIndex
+from src.service.localizer.ast.python_symbol_extractor import PythonSymbolExtractor
+from src.service.localizer.utils import git_blob_sha
+
+
+def test_git_blob_sha_matches_git_hash_object() -> None:
+    assert git_blob_sha(b"") == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+    assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+def test_symbol_index_round_trips_values_across_connections(tmp_path: Path) -> None:
+    db_path = tmp_path / "index.sqlite"
+    index = SymbolIndex(db_path)
+    index.put("abc", "token_frequency", {"retry": 2})
+    index.close()
+
+    reopened = SymbolIndex(db_path)
+    assert reopened.get("abc", "token_frequency") == {"retry": 2}
+    assert reopened.get("abc", "python_symbols") is None
+    reopened.close()
+
+
+def test_corpus_reuses_indexed_analyses_for_unchanged_blobs(
+    tmp_path: Path, monkeypatch
+) -> None:
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "src" / "core.py").write_text("class RetryPolicy:\n    pass\n")
+    index = SymbolIndex(tmp_path / "index.sqlite")
+
+    calls: list[str] = []
+    original_extract = PythonSymbolExtractor.extract
+
+    def counting_extract(self, path, source):
+        calls.append(path.name)
+        return original_extract(self, path, source)
+
+    monkeypatch.setattr(PythonSymbolExtractor, "extract", counting_extract)
+
+    for _ in range(2):
+        document = RepositoryCorpus(repo, index=index).document("src/core.py", 1_000)
+        assert document is not None
+        assert "retrypolicy" in document.python_symbols().definitions
+    assert calls == ["core.py"]
+
+    (repo / "src" / "core.py").write_text("class BackoffPolicy:\n    pass\n")
+    document = RepositoryCorpus(repo, index=index).document("src/core.py", 1_000)
+    assert document is not None
+    assert "backoffpolicy" in document.python_symbols().definitions
+    assert calls == ["core.py", "core.py"]
+    index.close()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import pytest
+
+from src.service.localizer import RepositoryCorpus
+from src.service.localizer.tfidf import TfidfMatrix
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_tfidf_matrix_cosine_matches_reference_formula(tmp_path: Path) -> None:
+    _write(tmp_path / "a.py", "retry retry timeout")
+    _write(tmp_path / "b.py", "timeout render")
+    _write(tmp_path / "empty.py", "")
+
+    matrix = TfidfMatrix.build(
+        RepositoryCorpus(tmp_path), ["a.py", "b.py", "empty.py"], 10_000
+    )
+    assert matrix.paths == ["a.py", "b.py"]
+    assert list(matrix.indptr) == [0, 2, 4]
+
+    def idf(doc_freq: int) -> float:
+        return math.log(3 / (1 + doc_freq)) + 1.0
+
+    # "unknown" is out of vocabulary but still part of the query norm.
+    query = {"retry": 1, "unknown": 1}
+    doc_a = {"retry": 2 * idf(1), "timeout": idf(2)}
+    query_vec = {"retry": idf(1), "unknown": idf(0)}
+    expected_a = (query_vec["retry"] * doc_a["retry"]) / (
+        math.sqrt(sum(v * v for v in doc_a.values()))
+        * math.sqrt(sum(v * v for v in query_vec.values()))
+    )
+
+    cosines = matrix.cosine(query)
+    assert cosines[0] == pytest.approx(expected_a)
+    assert cosines[1] == 0.0
+
+
+def test_tfidf_matrix_handles_empty_candidate_set(tmp_path: Path) -> None:
+    matrix = TfidfMatrix.build(RepositoryCorpus(tmp_path), [], 10_000)
+    assert matrix.paths == []
+    assert matrix.cosine({"retry": 1}).shape == (0,)
@@ -12,7 +12,7 @@ def test_tool_registry_direct_method_usage(tmp_path):
         def find_nfr_ids(self, nfr_focus):
             return ["NFR-1"] if nfr_focus else []
 
-        def summarize_for_prompt(self, nfr_ids):
+        def summarize_for_prompt(self, nfr_ids, **kwargs):
             return "NFR summary"
 
     fake_ctx = SimpleNamespace(
@@ -62,7 +62,7 @@ def test_tool_registry_ranks_issue_candidates_from_current_pr(tmp_path):
         def find_nfr_ids(self, nfr_focus):
             return ["NFR-1"] if nfr_focus else []
 
-        def summarize_for_prompt(self, nfr_ids):
+        def summarize_for_prompt(self, nfr_ids, **kwargs):
             return "NFR summary"
 
     fake_ctx = SimpleNamespace(
@@ -183,7 +183,7 @@ def test_tools_registrar_registers_expected_tool_names(tmp_path):
         def find_nfr_ids(self, nfr_focus):
             return []
 
-        def summarize_for_prompt(self, nfr_ids):
+        def summarize_for_prompt(self, nfr_ids, **kwargs):
             return "summary"
 
     fake_ctx = SimpleNamespace(
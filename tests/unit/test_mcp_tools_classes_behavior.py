@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import re
+import threading
+import time
 from types import SimpleNamespace
 
 from src.mcp.tools.apply_plan_swe_code_change_tool import ApplyPlanSweCodeChangeTool
@@ -32,6 +35,41 @@ class _FakeLlmChunked:
         return "```\nUPDATED_CHUNK\n```"
 
 
+class _FakeLlmStreaming:
+    def __init__(self) -> None:
+        self.pieces_read = 0
+
+    def chat(self, prompt: str, **kwargs) -> str:
+        raise AssertionError("streaming clients should not use chat")
+
+    def stream_chat(self, prompt: str, **kwargs):
+        for piece in ["```python\n", "print('new')", "\n```", "\nprose", " more"]:
+            self.pieces_read += 1
+            yield piece
+
+
+class _FakeLlmSlowChunks:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def chat(self, prompt: str, **kwargs) -> str:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            chunk_index = int(re.search(r"Chunk: (\d+)/", prompt).group(1))
+            # Later chunks finish first, so order must come from reassembly.
+            time.sleep(0.02 * (5 - chunk_index))
+            if chunk_index == 2:
+                raise RuntimeError("chunk 2 failed")
+            return f"```\nCHUNK_{chunk_index}\n```"
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
 def _build_swe_context() -> SweContext:
     return SweContext(
         plan=CodeGenPlan(
@@ -47,13 +85,19 @@ def _build_swe_context() -> SweContext:
 
 
 def _build_registry(
-    llm_cls, *, max_single_shot_code_chars: int = 12000, chunk_lines: int = 3
+    llm_cls,
+    *,
+    max_single_shot_code_chars: int = 12000,
+    chunk_lines: int = 3,
+    max_parallel_chunks: int = 4,
 ):
     execution_cfg = SimpleNamespace(
         max_summary_chars=200,
         max_security_context_chars=120,
         max_single_shot_code_chars=max_single_shot_code_chars,
         chunk_lines=chunk_lines,
+        max_parallel_chunks=max_parallel_chunks,
+        stream_generation=True,
     )
     cfg = SimpleNamespace(execution=execution_cfg)
     ctx = SimpleNamespace(config=cfg, kb="kb")
@@ -84,6 +128,21 @@ def test_apply_plan_tool_executes_single_shot_and_forwards_chat_kwargs() -> None
     assert result["used_fallback_to_original"] is False
 
 
+def test_apply_plan_tool_streams_until_closing_fence() -> None:
+    llm = _FakeLlmStreaming()
+    registry = _build_registry(lambda: llm)
+    tool = ApplyPlanSweCodeChangeTool(registry)
+
+    result = tool.execute(swe_context=_build_swe_context(), original_code="x = 1")
+
+    assert result["generated_code"] == "print('new')"
+    assert result["raw_response"] == "```python\nprint('new')\n```"
+    assert llm.pieces_read == 3
+    assert result["streaming"]["enabled"] is True
+    assert result["streaming"]["stopped_at_closing_fence"] == 1
+    assert result["streaming"]["time_to_first_token_ms"] >= 0
+
+
 def test_apply_plan_tool_returns_fallback_on_llm_error() -> None:
     registry = _build_registry(_FakeLlmFailure)
     tool = ApplyPlanSweCodeChangeTool(registry)
@@ -117,6 +176,23 @@ def test_apply_plan_tool_chunked_mode_uses_multiple_chunks() -> None:
     assert "UPDATED_CHUNK" in result["generated_code"]
 
 
+def test_apply_plan_tool_chunks_run_concurrently_and_reassemble_in_order() -> None:
+    llm = _FakeLlmSlowChunks()
+    registry = _build_registry(
+        lambda: llm, max_single_shot_code_chars=5, chunk_lines=1, max_parallel_chunks=2
+    )
+    tool = ApplyPlanSweCodeChangeTool(registry)
+
+    result = tool.execute(
+        swe_context=_build_swe_context(),
+        original_code="\n".join(["a", "b", "c", "d"]),
+    )
+
+    assert result["generated_code"] == "CHUNK_1\nb\nCHUNK_3\nCHUNK_4"
+    assert [error["chunk_index"] for error in result["chunk_errors"]] == [2]
+    assert llm.peak == 2
+
+
 def test_apply_plan_tool_helpers_cover_edge_cases() -> None:
     assert ApplyPlanSweCodeChangeTool._split_code_chunks("", chunk_lines=5) == [
         {"start": 1, "end": 1, "code": ""}
@@ -147,6 +223,8 @@ def test_judge_tool_uses_injected_explanation_service() -> None:
         max_security_context_chars=120,
         max_single_shot_code_chars=12000,
         chunk_lines=3,
+        max_parallel_chunks=4,
+        stream_generation=True,
     )
     cfg = SimpleNamespace(execution=execution_cfg)
     ctx = SimpleNamespace(config=cfg, kb="kb")
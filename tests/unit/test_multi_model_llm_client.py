@@ -1,3 +1,4 @@
+import asyncio
 import os
 import tempfile
 from unittest.mock import MagicMock, patch
@@ -5,7 +6,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 import yaml
 
+from src.llm_client.localai_client import LocalAIClient
 from src.llm_client.multi_model_llm_client import MultiModelLLMClient
+from src.llm_client.response_cache import LLMResponseCache
 
 _YAML_LOCALAI = [
     {"model_name": "m1", "provider": "LocalAI", "endpoint": "http://localhost:8080"},
@@ -92,3 +95,168 @@ def test_openai_client_returns_client():
         client = _make_client(path)
     client.default_model = "m1"
     assert client.openai_client() is client.clients["m1"]
+
+
+def test_achat_fans_out_models_and_prompts():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_yaml(tmp, _YAML_LOCALAI)
+        client = _make_client(path)
+    client.clients["m1"].chat = MagicMock(side_effect=lambda p, m=None, **k: f"m1:{p}")
+    client.clients["m2"].chat = MagicMock(side_effect=lambda p, m=None, **k: f"m2:{p}")
+
+    by_model = asyncio.run(client.achat("hi", model=["m2", "m1"], temperature=0))
+    many = asyncio.run(client.achat_many(["a", "b", "c"], model="m1"))
+
+    assert list(by_model.items()) == [("m2", "m2:hi"), ("m1", "m1:hi")]
+    assert many == ["m1:a", "m1:b", "m1:c"]
+    client.clients["m2"].chat.assert_called_once_with("hi", None, temperature=0)
+
+
+def test_achat_many_can_isolate_failures():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_yaml(tmp, _YAML_LOCALAI)
+        client = _make_client(path)
+
+    def chat(prompt, model=None, **kwargs):
+        if prompt == "b":
+            raise RuntimeError("boom")
+        return "ok"
+
+    client.clients["m1"].chat = chat
+
+    results = asyncio.run(
+        client.achat_many(["a", "b"], model="m1", return_exceptions=True)
+    )
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_chat_serves_repeated_calls_from_response_cache(tmp_path):
+    path = _write_yaml(str(tmp_path), _YAML_LOCALAI)
+    cache = LLMResponseCache(mode="read_through", db_path=tmp_path / "llm.sqlite")
+    with (
+        patch("src.llm_client.multi_model_llm_client.os.path.join", return_value=path),
+        patch(
+            "src.llm_client.multi_model_llm_client.os.path.exists", return_value=False
+        ),
+    ):
+        client = MultiModelLLMClient(response_cache=cache)
+    client.clients["m1"].chat = MagicMock(return_value="r1")
+    client.clients["m2"].chat = MagicMock(return_value="r2")
+
+    first = client.chat("hello", model="m1", temperature=0, seed=42)
+    second = client.chat("hello", model="m1", temperature=0, seed=42)
+    fanned = client.chat("hello", model=["m1", "m2"], temperature=0, seed=42)
+
+    assert first == second == "r1"
+    assert fanned == {"m1": "r1", "m2": "r2"}
+    client.clients["m1"].chat.assert_called_once()
+    client.clients["m2"].chat.assert_called_once()
+
+
+def _streaming_client(tmp_path, pieces):
+    path = _write_yaml(str(tmp_path), _YAML_LOCALAI)
+    cache = LLMResponseCache(mode="read_through", db_path=tmp_path / "llm.sqlite")
+    with (
+        patch("src.llm_client.multi_model_llm_client.os.path.join", return_value=path),
+        patch(
+            "src.llm_client.multi_model_llm_client.os.path.exists", return_value=False
+        ),
+    ):
+        client = MultiModelLLMClient(response_cache=cache)
+
+    def stream_chat(prompt, **kwargs):
+        yield from pieces
+
+    client.clients["m1"].stream_chat = MagicMock(side_effect=stream_chat)
+    return client
+
+
+def test_stream_chat_does_not_cache_abandoned_streams(tmp_path):
+    client = _streaming_client(tmp_path, ["a", "b", "c"])
+
+    stream = client.stream_chat("hello", model="m1")
+    assert [next(stream), next(stream)] == ["a", "b"]
+    stream.close()
+
+    assert list(client.stream_chat("hello", model="m1")) == ["a", "b", "c"]
+    assert list(client.stream_chat("hello", model="m1")) == ["abc"]
+    assert client.clients["m1"].stream_chat.call_count == 2
+
+
+def test_stream_chat_caches_up_to_the_first_code_block(tmp_path):
+    client = _streaming_client(tmp_path, ["```py\n", "x = 1\n```", "\nprose"])
+
+    stream = client.stream_chat("hello", model="m1", stop_after_code_block=True)
+    assert [next(stream), next(stream)] == ["```py\n", "x = 1\n```"]
+    stream.close()
+
+    assert list(
+        client.stream_chat("hello", model="m1", stop_after_code_block=True)
+    ) == ["```py\nx = 1\n```"]
+    assert list(client.stream_chat("hello", model="m1")) == [
+        "```py\n",
+        "x = 1\n```",
+        "\nprose",
+    ]
+    assert client.clients["m1"].stream_chat.call_count == 2
+
+
+def test_provider_clients_are_lazy_and_share_endpoint_sessions(tmp_path):
+    path = _write_yaml(
+        str(tmp_path),
+        _YAML_LOCALAI
+        + [
+            {
+                "model_name": "m3",
+                "provider": "LocalAI",
+                "endpoint": "http://localhost:8080",
+                "max_concurrency": 16,
+            }
+        ],
+    )
+    with patch(
+        "src.llm_client.multi_model_llm_client.LocalAIClient",
+        wraps=LocalAIClient,
+    ) as client_cls:
+        client = _make_client(path)
+        assert client_cls.call_count == 0
+        assert set(client.clients) == {"m1", "m2", "m3"}
+
+        m1 = client.get_client("m1")
+        m3 = client.get_client("m3")
+        m2 = client.get_client("m2")
+        assert client.get_client("m1") is m1
+
+    assert client_cls.call_count == 3
+    assert m1.session is m3.session
+    assert m2.session is not m1.session
+    assert m1.pool_maxsize == m3.pool_maxsize == 16
+    assert m2.pool_maxsize == 10
+
+
+def test_shared_returns_one_instance_per_process(tmp_path):
+    path = _write_yaml(str(tmp_path), _YAML_LOCALAI)
+    MultiModelLLMClient.reset_shared()
+    try:
+        with (
+            patch(
+                "src.llm_client.multi_model_llm_client.os.path.join",
+                return_value=path,
+            ),
+            patch(
+                "src.llm_client.multi_model_llm_client.os.path.exists",
+                return_value=False,
+            ),
+            patch(
+                "src.llm_client.multi_model_llm_client.yaml.safe_load",
+                wraps=yaml.safe_load,
+            ) as safe_load,
+        ):
+            first = MultiModelLLMClient.shared()
+            second = MultiModelLLMClient.shared()
+        assert first is second
+        assert safe_load.call_count == 1
+    finally:
+        MultiModelLLMClient.reset_shared()
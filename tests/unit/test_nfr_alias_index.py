@@ -0,0 +1,40 @@
+from src.models.swe_node import SweNode
+from src.service.nfr_alias_index import AhoCorasickMatcher, NfrAliasIndex
+
+
+def _nfr(node_id, name, category):
+    return SweNode(
+        id=node_id, type="NFR", name=name, nfr_category=category, description=""
+    )
+
+
+def test_aho_corasick_matcher_finds_overlapping_patterns():
+    matcher = AhoCorasickMatcher(["he", "she", "his", "hers", ""])
+
+    assert matcher.find_all("ushers") == {"he", "she", "hers"}
+    assert matcher.find_all("nothing") == set()
+
+
+def test_nfr_alias_index_reports_mentions_in_node_order():
+    index = NfrAliasIndex(
+        [
+            _nfr("nfr_security", "Security", "Security"),
+            _nfr("nfr_maintainability", "Maintainability", "Code Quality"),
+            SweNode(
+                id="practice_retry",
+                type="Practice",
+                name="Retry",
+                nfr_category="Reliability",
+                description="",
+            ),
+            _nfr("nfr_reliability", "Reliability", "Reliability"),
+        ]
+    )
+
+    mentions = index.mentions("Retry flaky calls, improve code quality and SECURITY")
+
+    assert mentions == ["Security", "Code Quality"]
+    assert index.resolve(["code quality", "NFR_RELIABILITY", "retry"]) == [
+        "nfr_maintainability",
+        "nfr_reliability",
+    ]
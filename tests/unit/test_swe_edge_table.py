@@ -0,0 +1,74 @@
+import pickle
+
+import pytest
+
+from src.models.swe_edge import SweEdge
+from src.models.swe_node import SweNode
+from src.service.swe_edge_table import SweEdgeTable
+
+
+def _edges():
+    return [
+        SweEdge("a", "related_to", "b", "a to b"),
+        SweEdge("b", "supports", "a", "b to a"),
+        SweEdge("a", "related_to", "a", "self loop"),
+        SweEdge("c", "supports", "b", "c to b"),
+    ]
+
+
+def test_edge_table_views_match_edge_list_order():
+    edges = _edges()
+    table = SweEdgeTable(edges)
+
+    assert table == edges
+    assert len(table) == 4
+    assert table[-1] == edges[-1]
+    assert table[1:3] == edges[1:3]
+    assert table.outgoing("a") == [edges[0], edges[2]]
+    assert table.incoming("b") == [edges[0], edges[3]]
+    assert table.incident("a") == edges[:3]
+    assert table.with_relation("supports") == [edges[1], edges[3]]
+    assert list(table.iter_adjacent_ids("a")) == ["b", "b", "a"]
+    assert list(table.iter_target_ids("c")) == ["b"]
+    assert table.outgoing("missing") == []
+
+
+def test_edge_table_tracks_keys_and_survives_pickling():
+    table = SweEdgeTable(_edges())
+
+    assert table.contains("c", "supports", "b")
+    assert not table.contains("b", "supports", "c")
+    assert not table.contains("a", "unknown", "b")
+
+    restored = pickle.loads(pickle.dumps(table))
+    restored.append(SweEdge("b", "supports", "c", "b to c"))
+
+    assert restored.contains("b", "supports", "c")
+    assert restored.outgoing("b")[-1] == SweEdge("b", "supports", "c", "b to c")
+    assert table == _edges()
+
+
+def test_models_are_slotted_and_intern_repeated_strings():
+    node = SweNode(
+        id="".join(["nfr_", "readability"]),
+        type="".join(["N", "FR"]),
+        name="Readability",
+        nfr_category="",
+        description="",
+    )
+    edge = SweEdge("".join(["nfr_", "readability"]), "related_to", "x", "")
+
+    assert not hasattr(node, "__dict__")
+    assert not hasattr(edge, "__dict__")
+    assert node.id is edge.source_id
+    assert node.type is SweNode("b", "NFR", "", "", "").type
+
+
+def test_edge_table_rows_are_read_only_views():
+    table = SweEdgeTable(_edges())
+    row = table[0]
+
+    with pytest.raises(AttributeError, match="read-only"):
+        row.description = "changed"
+    assert SweEdge("a", "related_to", "b", "a to b") == row
+    assert type(pickle.loads(pickle.dumps(row))) is SweEdge
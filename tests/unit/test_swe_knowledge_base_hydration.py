@@ -0,0 +1,27 @@
+import threading
+
+from src.service.swe_knowledge_base_hydration import KnowledgeNodeHydrator
+
+
+def test_unread_prefetches_stay_within_the_cache_bound():
+    release = threading.Event()
+
+    def load(source_path):
+        release.wait(timeout=5)
+        return {"source": source_path}
+
+    hydrator = KnowledgeNodeHydrator(load, max_cached_payloads=2, max_workers=2)
+    specs = [(f"node_{index}", f"{index}.json") for index in range(5)]
+
+    assert hydrator.prefetch(specs) == 2
+    futures = list(hydrator._pending.values())
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+
+    assert hydrator._pending == {}
+    assert set(hydrator._cache) == {"node_0", "node_1"}
+    assert hydrator.payload("node_0", "0.json") == {"source": "0.json"}
+    assert hydrator.metrics.prefetch_hits == 1
+    assert hydrator.metrics.loads == 2
+    hydrator.shutdown()
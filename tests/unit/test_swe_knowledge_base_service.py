@@ -1,6 +1,8 @@
 import csv
 import json
 
+from src.models.swe_edge import SweEdge
+from src.models.swe_node import SweNode
 from src.service.swe_knowledge_base_service import SweKnowledgeBase
 
 
@@ -316,3 +318,296 @@ def test_swe_knowledge_base_rebuilt_edges_remain_idempotent_across_loads(tmp_pat
 
     assert second_edge_snapshot == first_edge_snapshot
 
+
+def test_swe_knowledge_base_adjacency_indexes_match_edge_list(tmp_path):
+    ground_dir = tmp_path / "knowledge" / "data"
+    linked_dir = tmp_path / "knowledge" / "linked_data"
+
+    entry_dir = ground_dir / "clean_code" / "add_meaningful_context"
+    entry_dir.mkdir(parents=True)
+    _write_data_json(
+        entry_dir / "data.json",
+        {"name": "Add Meaningful Context", "category": "naming"},
+    )
+
+    linked_dir.mkdir(parents=True)
+    _write_edge_csv(
+        linked_dir / "knowledge_edges.csv",
+        [
+            [
+                "nfr_readability",
+                "organized_as",
+                "category_naming",
+                "Naming guidance supports readability.",
+            ],
+            [
+                "nfr_readability",
+                "related_to",
+                "nfr_maintainability",
+                "Readable code is easier to change.",
+            ],
+        ],
+    )
+
+    kb = SweKnowledgeBase(
+        ground_data_dir=str(ground_dir),
+        linked_data_dir=str(linked_dir),
+    )
+    kb.load()
+
+    for node_id in kb.nodes:
+        assert kb.get_outgoing_edges(node_id) == [
+            edge for edge in kb.edges if edge.source_id == node_id
+        ]
+        assert kb.get_incoming_edges(node_id) == [
+            edge for edge in kb.edges if edge.target_id == node_id
+        ]
+    assert [edge.target_id for edge in kb.get_edges_by_relation("related_to")] == [
+        "nfr_maintainability"
+    ]
+
+    kb.edges = [edge for edge in kb.edges if edge.relation != "related_to"]
+
+    assert kb.get_incident_edges("nfr_maintainability") == []
+    assert kb.get_neighbors(["category_naming"])["category_naming"] == [
+        edge for edge in kb.edges if edge.source_id == "category_naming"
+    ]
+
+
+def test_swe_knowledge_base_snapshot_restores_state_until_sources_change(tmp_path):
+    ground_dir = tmp_path / "knowledge" / "data"
+    linked_dir = tmp_path / "knowledge" / "linked_data"
+    snapshot_path = tmp_path / "cache" / "kb.pickle"
+
+    entry_dir = ground_dir / "clean_code" / "add_meaningful_context"
+    entry_dir.mkdir(parents=True)
+    _write_data_json(
+        entry_dir / "data.json",
+        {"name": "Add Meaningful Context", "category": "naming"},
+    )
+    linked_dir.mkdir(parents=True)
+    edge_rows = [
+        [
+            "nfr_readability",
+            "organized_as",
+            "category_naming",
+            "Naming guidance supports readability.",
+        ]
+    ]
+    _write_edge_csv(linked_dir / "knowledge_edges.csv", edge_rows)
+
+    def load_kb():
+        kb = SweKnowledgeBase(
+            ground_data_dir=str(ground_dir),
+            linked_data_dir=str(linked_dir),
+            snapshot_path=str(snapshot_path),
+        )
+        kb.load()
+        return kb
+
+    first = load_kb()
+    assert snapshot_path.exists()
+
+    restored = load_kb()
+    assert restored.nodes == first.nodes
+    assert restored.edges == first.edges
+    assert restored.summarize_for_prompt(
+        ["nfr_readability"], depth=2
+    ) == first.summarize_for_prompt(["nfr_readability"], depth=2)
+
+    edge_rows.append(
+        [
+            "nfr_readability",
+            "related_to",
+            "nfr_maintainability",
+            "Readable code is easier to change.",
+        ]
+    )
+    _write_edge_csv(linked_dir / "knowledge_edges.csv", edge_rows)
+
+    reloaded = load_kb()
+    assert [edge.target_id for edge in reloaded.get_outgoing_edges("nfr_readability")]
+    assert "nfr_maintainability" in reloaded.nodes
+
+
+def test_swe_knowledge_base_caches_summaries_until_reload(tmp_path):
+    ground_dir = tmp_path / "knowledge" / "data"
+    linked_dir = tmp_path / "knowledge" / "linked_data"
+    ground_dir.mkdir(parents=True)
+    linked_dir.mkdir(parents=True)
+    edge_rows = [
+        [
+            "nfr_readability",
+            "related_to",
+            "nfr_maintainability",
+            "Readable code is easier to change.",
+        ]
+    ]
+    _write_edge_csv(linked_dir / "knowledge_edges.csv", edge_rows)
+
+    kb = SweKnowledgeBase(
+        ground_data_dir=str(ground_dir),
+        linked_data_dir=str(linked_dir),
+        summary_cache_size=1,
+    )
+    kb.load()
+
+    first = kb.summarize_for_prompt(["nfr_readability"])
+    assert kb.summarize_for_prompt(["nfr_readability"]) == first
+    kb.summarize_for_prompt(["nfr_maintainability"])
+    kb.summarize_for_prompt(["nfr_readability"])
+
+    assert kb.summary_cache_stats == {
+        "hits": 1,
+        "misses": 3,
+        "size": 1,
+        "max_size": 1,
+    }
+
+    edge_rows.append(
+        ["nfr_readability", "supports", "nfr_testability", "Clear code is testable."]
+    )
+    _write_edge_csv(linked_dir / "knowledge_edges.csv", edge_rows)
+    kb.load()
+
+    assert "Testability" in kb.summarize_for_prompt(["nfr_readability"])
+
+
+def test_swe_knowledge_base_infers_categories_in_sweep_order():
+    def node(node_id, category=""):
+        return SweNode(
+            id=node_id,
+            type="Practice",
+            name=node_id,
+            nfr_category=category,
+            description="",
+        )
+
+    kb = SweKnowledgeBase(ground_data_dir="", linked_data_dir="")
+    # "y" is visited before "x" in a sweep, so "x" already sees y's category.
+    kb.nodes = {
+        "y": node("y"),
+        "x": node("x"),
+        "s1": node("s1", "Reliability"),
+        "s2": node("s2", "Security"),
+        "chain_2": node("chain_2"),
+        "chain_1": node("chain_1"),
+        "orphan": node("orphan"),
+    }
+    kb.edges = [
+        SweEdge("x", "related_to", "y", ""),
+        SweEdge("x", "related_to", "s2", ""),
+        SweEdge("y", "related_to", "s1", ""),
+        SweEdge("s1", "related_to", "chain_1", ""),
+        SweEdge("chain_1", "related_to", "chain_2", ""),
+    ]
+
+    kb._infer_nfr_categories()
+
+    assert kb.nodes["y"].nfr_category == "Reliability"
+    assert kb.nodes["x"].nfr_category == "Reliability"
+    assert kb.nodes["chain_2"].nfr_category == "Reliability"
+    assert kb.nodes["orphan"].nfr_category == ""
+
+
+def test_swe_knowledge_base_prefetches_and_bounds_lazy_hydration(tmp_path):
+    ground_dir = tmp_path / "knowledge" / "data"
+    linked_dir = tmp_path / "knowledge" / "linked_data"
+    slugs = ["rate_limiting", "retry", "circuit_breaker"]
+    for slug in slugs:
+        entry_dir = ground_dir / "reliability" / slug
+        entry_dir.mkdir(parents=True)
+        _write_data_json(
+            entry_dir / "data.json",
+            {"name": f"{slug} pattern", "problem": f"Explains {slug}."},
+        )
+    linked_dir.mkdir(parents=True)
+    _write_edge_csv(
+        linked_dir / "knowledge_edges.csv",
+        [
+            ["nfr_reliability", "implemented_by", f"pattern_{slug}", ""]
+            for slug in slugs
+        ],
+    )
+
+    kb = SweKnowledgeBase(
+        ground_data_dir=str(ground_dir),
+        linked_data_dir=str(linked_dir),
+        lazy_load_nodes=True,
+        hydration_cache_size=1,
+    )
+    kb.load()
+
+    assert kb.find_nfr_ids(["Reliability"]) == ["nfr_reliability"]
+    summary = kb.summarize_for_prompt(["nfr_reliability"], depth=2)
+
+    for slug in slugs:
+        assert f"{slug} pattern" in summary
+    stats = kb.hydration_stats
+    # Only as many reads are prefetched as the cache can hold unread.
+    assert stats["prefetch_requests"] == 1
+    assert stats["loads"] == 3
+    assert stats["prefetch_hits"] == 1
+    assert stats["evictions"] == 2
+    hydrated = [slug for slug in slugs if kb.nodes[f"pattern_{slug}"].metadata]
+    assert hydrated == ["circuit_breaker"]
+
+
+def test_swe_knowledge_base_budgeted_summary_keeps_most_relevant_neighbors():
+    def node(node_id, name, node_type="Refactoring"):
+        return SweNode(
+            id=node_id,
+            type=node_type,
+            name=name,
+            nfr_category="Maintainability",
+            description=f"{name} guidance.",
+        )
+
+    kb = SweKnowledgeBase(ground_data_dir="", linked_data_dir="")
+    kb.nodes = {
+        "nfr_maintainability": node("nfr_maintainability", "Maintainability", "NFR"),
+        "folder_refactoring": node("folder_refactoring", "Refactoring", "Folder"),
+        "refactoring_rename": node("refactoring_rename", "Rename Variable"),
+        "refactoring_extract": node("refactoring_extract", "Extract Method"),
+    }
+    kb.edges = [
+        SweEdge("nfr_maintainability", "maps_to_folder", "folder_refactoring", ""),
+        SweEdge("nfr_maintainability", "improved_by", "refactoring_rename", ""),
+        SweEdge("nfr_maintainability", "improved_by", "refactoring_extract", ""),
+    ]
+
+    full = kb.summarize_for_prompt(["nfr_maintainability"], depth=2)
+    unbounded = kb.summarize_for_prompt(
+        ["nfr_maintainability"], depth=2, max_chars=len(full)
+    )
+    assert sorted(unbounded.splitlines()) == sorted(full.splitlines())
+
+    budget = len(full.splitlines()[0]) + 140
+    summary = kb.summarize_for_prompt(
+        ["nfr_maintainability"],
+        depth=2,
+        max_chars=budget,
+        focus_text="Extract a method from the long handler",
+    )
+
+    assert len(summary) <= budget
+    assert summary.splitlines()[0].startswith("NFR: Maintainability")
+    assert "Extract Method" in summary.splitlines()[2]
+    assert "Folder" not in summary
+
+    # The neighborhood is cached per budget; only the focus ranking is redone.
+    renamed = kb.summarize_for_prompt(
+        ["nfr_maintainability"],
+        depth=2,
+        max_chars=budget,
+        focus_text="Rename the variable",
+    )
+    assert "Rename Variable" in renamed.splitlines()[2]
+    assert kb.summary_cache_stats["hits"] == 1
+    assert kb.summary_cache_stats["misses"] == 3
+
+    assert kb.summarize_for_prompt(["nfr_maintainability"], depth=0) == ""
+    assert (
+        kb.summarize_for_prompt(["nfr_maintainability"], depth=0, max_chars=10_000)
+        == ""
+    )
@@ -0,0 +1,207 @@
+import csv
+import json
+import os
+import threading
+import time
+
+from src.mcp.swe_mcp_server import SweMcpServerContextProvider
+from src.service.swe_knowledge_base_service import SweKnowledgeBase
+from src.service.swe_knowledge_base_watcher import (
+    KnowledgeBaseWatcher,
+    KnowledgeSourceCache,
+)
+
+
+def _write_edge_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as file_handle:
+        writer = csv.writer(file_handle)
+        writer.writerow(["SourceId", "Relation", "TargetId", "Description"])
+        writer.writerows(rows)
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _make_knowledge_tree(root):
+    ground_dir = root / "knowledge" / "data"
+    linked_dir = root / "knowledge" / "linked_data"
+    entry_dir = ground_dir / "clean_code" / "add_meaningful_context"
+    entry_dir.mkdir(parents=True)
+    (entry_dir / "data.json").write_text(
+        json.dumps({"name": "Add Meaningful Context", "category": "naming"}),
+        encoding="utf-8",
+    )
+    linked_dir.mkdir(parents=True)
+    edges_path = linked_dir / "knowledge_edges.csv"
+    _write_edge_csv(
+        edges_path,
+        [["nfr_readability", "related_to", "nfr_maintainability", "Easier change."]],
+    )
+    return ground_dir, linked_dir, edges_path
+
+
+def test_watcher_reports_added_modified_and_removed_sources(tmp_path):
+    ground_dir, linked_dir, edges_path = _make_knowledge_tree(tmp_path)
+    batches = []
+    watcher = KnowledgeBaseWatcher(
+        roots=[str(ground_dir), str(linked_dir)], on_change=batches.append
+    )
+
+    assert watcher.poll() == []
+
+    _bump_mtime(edges_path)
+    extra_path = linked_dir / "extra_edges.csv"
+    _write_edge_csv(extra_path, [])
+    os.remove(ground_dir / "clean_code" / "add_meaningful_context" / "data.json")
+
+    changed = watcher.poll()
+
+    assert changed == sorted(
+        [
+            str(edges_path),
+            str(extra_path),
+            str(ground_dir / "clean_code" / "add_meaningful_context" / "data.json"),
+        ]
+    )
+    assert batches == [changed]
+    assert watcher.poll() == []
+
+
+def test_source_cache_only_reparses_changed_files(tmp_path):
+    ground_dir, linked_dir, edges_path = _make_knowledge_tree(tmp_path)
+    cache = KnowledgeSourceCache()
+
+    def load_kb():
+        kb = SweKnowledgeBase(
+            ground_data_dir=str(ground_dir),
+            linked_data_dir=str(linked_dir),
+            source_cache=cache,
+        )
+        kb.load()
+        return kb
+
+    first = load_kb()
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    _write_edge_csv(
+        edges_path,
+        [
+            ["nfr_readability", "related_to", "nfr_maintainability", "Easier change."],
+            [
+                "nfr_readability",
+                "supports",
+                "nfr_testability",
+                "Clear code is testable.",
+            ],
+        ],
+    )
+    _bump_mtime(edges_path)
+    second = load_kb()
+
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert "nfr_testability" in second.nodes
+    assert "nfr_testability" not in first.nodes
+
+
+def test_provider_reload_swaps_context_without_touching_previous(tmp_path):
+    _, _, edges_path = _make_knowledge_tree(tmp_path)
+    (tmp_path / "swe_mcp_config.yaml").write_text(
+        "knowledge_base:\n  watch_for_changes: true\n  watch_interval_seconds: 60\n",
+        encoding="utf-8",
+    )
+    provider = SweMcpServerContextProvider(repo_root=str(tmp_path))
+    try:
+        before = provider.create_swe_server_context()
+        assert "nfr_testability" not in before.kb.nodes
+
+        _write_edge_csv(
+            edges_path,
+            [["nfr_readability", "supports", "nfr_testability", "Testable."]],
+        )
+        _bump_mtime(edges_path)
+        assert provider._watcher.poll() == [str(edges_path)]
+
+        after = provider.create_swe_server_context()
+        assert after is not before
+        assert "nfr_testability" in after.kb.nodes
+        assert "nfr_testability" not in before.kb.nodes
+    finally:
+        provider.stop_knowledge_base_watcher()
+
+
+def _live_hydration_threads():
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("kb-hydration")
+    ]
+
+
+def test_reload_shuts_down_previous_hydration_pools(tmp_path):
+    _make_knowledge_tree(tmp_path)
+    (tmp_path / "swe_mcp_config.yaml").write_text(
+        "knowledge_base:\n"
+        "  lazy_load_nodes: true\n"
+        "  hydration_workers: 2\n"
+        "  watch_for_changes: true\n"
+        "  watch_interval_seconds: 60\n",
+        encoding="utf-8",
+    )
+    baseline = len(_live_hydration_threads())
+    provider = SweMcpServerContextProvider(repo_root=str(tmp_path))
+    try:
+        previous = []
+        for _ in range(4):
+            context = provider.create_swe_server_context()
+            assert context.kb.prefetch_neighborhood(list(context.kb.nodes)) > 0
+            previous.append(context.kb)
+            provider.reload_knowledge_base()
+
+        deadline = time.monotonic() + 5
+        while len(_live_hydration_threads()) > baseline and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(_live_hydration_threads()) == baseline
+        # Retired knowledge bases still answer, reading synchronously.
+        assert previous[0].get_node(next(iter(previous[0].nodes))) is not None
+    finally:
+        provider.stop_knowledge_base_watcher()
+        provider.create_swe_server_context().kb.close()
+
+
+def test_forced_and_watcher_reloads_retire_every_replaced_context(
+    tmp_path, monkeypatch
+):
+    _make_knowledge_tree(tmp_path)
+    provider = SweMcpServerContextProvider(repo_root=str(tmp_path))
+    original = provider.create_swe_server_context().kb
+    closed = []
+    monkeypatch.setattr(
+        SweKnowledgeBase, "close", lambda kb, wait=True: closed.append(kb)
+    )
+    build = provider._build_server_context
+    built = []
+
+    def slow_build(config):
+        context = build(config)
+        built.append(context.kb)
+        time.sleep(0.05)
+        return context
+
+    monkeypatch.setattr(provider, "_build_server_context", slow_build)
+    threads = [
+        threading.Thread(target=provider.reload_knowledge_base),
+        threading.Thread(
+            target=provider.create_swe_server_context, kwargs={"force_reload": True}
+        ),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    current = provider.create_swe_server_context().kb
+    replaced = [kb for kb in [original, *built] if kb is not current]
+    assert len(built) == 2
+    assert sorted(map(id, closed)) == sorted(map(id, replaced))
@@ -0,0 +1,114 @@
+import pytest
+
+from src.models.swe_edge import SweEdge
+from src.models.swe_node import SweNode
+from src.service.swe_knowledge_base_service import SweKnowledgeBase
+
+
+def _kb():
+    def node(node_id, node_type, category=""):
+        return SweNode(
+            id=node_id,
+            type=node_type,
+            name=node_id.replace("_", " ").title(),
+            nfr_category=category,
+            description="",
+        )
+
+    kb = SweKnowledgeBase(ground_data_dir="", linked_data_dir="")
+    kb.nodes = {
+        "nfr_maintainability": node("nfr_maintainability", "NFR", "Maintainability"),
+        "nfr_testability": node("nfr_testability", "NFR", "Testability"),
+        "nfr_security": node("nfr_security", "NFR", "Security"),
+        "refactoring_extract": node(
+            "refactoring_extract", "Refactoring", "Maintainability"
+        ),
+        "smell_long_method": node("smell_long_method", "Smell", "Maintainability"),
+        "smell_god_class": node("smell_god_class", "Smell", "Maintainability"),
+    }
+    kb.edges = [
+        SweEdge("nfr_maintainability", "improved_by", "refactoring_extract", ""),
+        SweEdge("refactoring_extract", "addresses", "smell_long_method", ""),
+        SweEdge("nfr_testability", "related_to", "nfr_maintainability", ""),
+        SweEdge("nfr_security", "related_to", "nfr_testability", ""),
+        SweEdge("smell_god_class", "related_to", "smell_long_method", ""),
+    ]
+    return kb
+
+
+def test_find_nodes_intersects_indexed_filters():
+    kb = _kb()
+
+    assert [node.id for node in kb.find_nodes(node_type="smell")] == [
+        "smell_long_method",
+        "smell_god_class",
+    ]
+    assert [
+        node.id
+        for node in kb.find_nodes(node_type="NFR", nfr_category="maintainability")
+    ] == ["nfr_maintainability"]
+    assert kb.find_nodes(node_type="Pattern") == []
+    assert [node.id for node in kb.get_all_nfrs()] == [
+        "nfr_maintainability",
+        "nfr_testability",
+        "nfr_security",
+    ]
+
+
+def test_neighborhood_respects_hops_direction_and_types():
+    kb = _kb()
+
+    assert kb.get_neighborhood(["nfr_maintainability"], hops=2) == {
+        "nfr_maintainability": 0,
+        "refactoring_extract": 1,
+        "nfr_testability": 1,
+        "smell_long_method": 2,
+        "nfr_security": 2,
+    }
+    assert kb.get_neighborhood(["nfr_maintainability"], hops=2, direction="out") == {
+        "nfr_maintainability": 0,
+        "refactoring_extract": 1,
+        "smell_long_method": 2,
+    }
+    assert kb.get_neighborhood(["nfr_security"], hops=5, node_types=["NFR"]) == {
+        "nfr_security": 0,
+        "nfr_testability": 1,
+        "nfr_maintainability": 2,
+    }
+    with pytest.raises(ValueError):
+        kb.get_neighborhood(["nfr_security"], direction="sideways")
+
+
+def test_shortest_paths_from_nfrs_to_smells_and_refactorings():
+    kb = _kb()
+
+    assert kb.find_shortest_path("nfr_security", "smell_god_class") == [
+        "nfr_security",
+        "nfr_testability",
+        "nfr_maintainability",
+        "refactoring_extract",
+        "smell_long_method",
+        "smell_god_class",
+    ]
+    assert (
+        kb.find_shortest_path("smell_god_class", "nfr_security", direction="out")
+        is None
+    )
+    assert kb.find_shortest_path("nfr_security", "smell_god_class", max_hops=3) is None
+
+    assert kb.find_nearest_of_types("nfr_testability", ["Smell", "Refactoring"]) == {
+        "refactoring_extract": [
+            "nfr_testability",
+            "nfr_maintainability",
+            "refactoring_extract",
+        ]
+    }
+
+
+def test_query_results_follow_graph_replacement():
+    kb = _kb()
+    assert kb.find_shortest_path("nfr_security", "smell_long_method") is not None
+
+    kb.edges = [edge for edge in kb.edges if edge.relation != "addresses"]
+
+    assert kb.find_shortest_path("nfr_security", "smell_long_method") is None